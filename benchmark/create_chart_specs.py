@@ -1,13 +1,32 @@
 import json
+import re
+import sys
 from pathlib import Path
 
-from pyperf import Benchmark
+from pyperf import Benchmark, BenchmarkSuite
 
+SCENARIO_NAME_RE = re.compile(
+    r"^(?P<scenario>[^\[]+)\[(?P<library>[^\]]+)\]\[(?P<type>load|dump)\]$"
+)
 
-def create_spec(benchmark_type: str) -> None:
+
+def load_spec_template() -> dict:
     data_dir = Path(Path.cwd() / "benchmark" / "data")
     with open(data_dir / "spec_template.json") as f:
-        spec = json.load(f)
+        return json.load(f)
+
+
+def get_value(library_name: str, benchmark: Benchmark) -> dict:
+    return {
+        "library": library_name,
+        "time": benchmark.mean(),
+        "timeFormat": benchmark.format_value(benchmark.mean()),
+    }
+
+
+def create_spec(benchmark_type: str) -> None:
+    data_dir = Path(Path.cwd() / "benchmark" / "data")
+    spec = load_spec_template()
     if benchmark_type == "load":
         spec["title"]["text"] = "Creating GitHub Issue object from dict"
     elif benchmark_type == "dump":
@@ -19,19 +38,82 @@ def create_spec(benchmark_type: str) -> None:
     ):
         benchmark: Benchmark = Benchmark.load(str(file))
         library_name = benchmark.get_name()[:-6]
-        values.append(
-            {
-                "library": library_name,
-                "time": benchmark.mean(),
-                "timeFormat": benchmark.format_value(benchmark.mean()),
-            }
-        )
+        values.append(get_value(library_name, benchmark))
     values.sort(key=lambda v: v["time"])
 
     with open(data_dir / f"spec_{benchmark_type}.json", "w") as f:
         json.dump(spec, f)
 
 
+def create_scenario_specs(results_file: str) -> None:
+    from benchmark.scenarios.common import LIBRARY_TITLES
+    from benchmark.scenarios.models import SCENARIOS
+
+    titles = {scenario.name: scenario.title for scenario in SCENARIOS}
+    specs: dict[tuple[str, str], dict] = {}
+    for benchmark in BenchmarkSuite.load(results_file).get_benchmarks():
+        match = SCENARIO_NAME_RE.match(benchmark.get_name())
+        if match is None:
+            continue
+        scenario, library, benchmark_type = match.groups()
+        spec = specs.get((scenario, benchmark_type))
+        if spec is None:
+            spec = specs[(scenario, benchmark_type)] = load_spec_template()
+            spec["title"][
+                "text"
+            ] = f"{titles.get(scenario, scenario)} [{benchmark_type}]"
+        spec["data"]["values"].append(
+            get_value(LIBRARY_TITLES.get(library, library), benchmark)
+        )
+    specs_dir = Path(Path.cwd() / "benchmark" / "data" / "scenario_specs")
+    specs_dir.mkdir(parents=True, exist_ok=True)
+    for (scenario, benchmark_type), spec in specs.items():
+        spec["data"]["values"].sort(key=lambda v: v["time"])
+        with open(
+            specs_dir / f"spec_{scenario}_{benchmark_type}.json", "w"
+        ) as f:
+            json.dump(spec, f)
+
+
+def create_memory_specs(results_file: str) -> None:
+    with open(results_file) as f:
+        results = json.load(f)
+    specs: dict[tuple[str, int], dict] = {}
+    for result in results:
+        # mashumaro layers use their own model, so they aren't comparable
+        if result["target"].startswith("mashumaro "):
+            continue
+        benchmark_type, size = result["type"], result["size"]
+        spec = specs.get((benchmark_type, size))
+        if spec is None:
+            spec = specs[(benchmark_type, size)] = load_spec_template()
+            action = "Creating" if benchmark_type == "load" else "Converting"
+            spec["title"][
+                "text"
+            ] = f"{action} {size} GitHub Issue objects: peak memory"
+            spec["encoding"]["x"]["axis"][
+                "labelExpr"
+            ] = "format(datum.value / 1048576, '.1f') + ' MiB'"
+        spec["data"]["values"].append(
+            {
+                "library": result["target"],
+                "time": result["peak"],
+                "timeFormat": f"{result['peak'] / 2**20:.2f} MiB",
+            }
+        )
+    specs_dir = Path(Path.cwd() / "benchmark" / "data" / "memory_specs")
+    specs_dir.mkdir(parents=True, exist_ok=True)
+    for (benchmark_type, size), spec in specs.items():
+        spec["data"]["values"].sort(key=lambda v: v["time"])
+        with open(specs_dir / f"spec_{benchmark_type}_{size}.json", "w") as f:
+            json.dump(spec, f)
+
+
 if __name__ == "__main__":
-    create_spec("load")
-    create_spec("dump")
+    if len(sys.argv) > 2 and sys.argv[1] == "--memory":
+        create_memory_specs(sys.argv[2])
+    elif len(sys.argv) > 1:
+        create_scenario_specs(sys.argv[1])
+    else:
+        create_spec("load")
+        create_spec("dump")
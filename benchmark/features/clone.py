@@ -0,0 +1,61 @@
+import copy
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pyperf
+
+from mashumaro import DataClassDictMixin
+
+SIZE = 100
+
+
+@dataclass(frozen=True)
+class Point:
+    x: float
+    y: float
+
+
+@dataclass
+class Stop(DataClassDictMixin):
+    name: str
+    point: Point
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Route(DataClassDictMixin):
+    id: UUID
+    created: datetime
+    stops: list[Stop]
+    attrs: dict[str, str] = field(default_factory=dict)
+
+
+def deepcopy(route: Route) -> Route:
+    return copy.deepcopy(route)
+
+
+def round_trip(route: Route) -> Route:
+    return Route.from_dict(route.to_dict())
+
+
+def clone(route: Route) -> Route:
+    return route.clone()
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    route = Route(
+        id=uuid4(),
+        created=datetime(2024, 1, 1),
+        stops=[Stop(str(i), Point(i, i), ["a", "b"]) for i in range(SIZE)],
+        attrs={"a": "b"},
+    )
+    assert deepcopy(route) == round_trip(route) == clone(route)
+    runner.bench_func("clone[deepcopy]", deepcopy, route)
+    runner.bench_func("clone[to_dict_from_dict]", round_trip, route)
+    runner.bench_func("clone[clone]", clone, route)
+
+
+if __name__ == "__main__":
+    main()
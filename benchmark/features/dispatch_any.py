@@ -0,0 +1,51 @@
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import orjson
+import pyperf
+
+from mashumaro.codecs.orjson import ORJSONEncoder
+from mashumaro.dialect import Dialect
+
+SIZE = 1000
+
+
+class DispatchAnyDialect(Dialect):
+    dispatch_any = True
+
+
+@dataclass(slots=True)
+class Item:
+    id: UUID
+    created_at: datetime
+    tags: list[str]
+
+
+def default(value: Any) -> Any:
+    # the usual fallback for objects that orjson doesn't serialize natively
+    if is_dataclass(value):
+        return asdict(value)  # type: ignore[arg-type]
+    raise TypeError
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    data = {
+        "items": [
+            Item(uuid4(), datetime.now(), ["a", "b"]) for _ in range(SIZE)
+        ]
+    }
+    encoder = ORJSONEncoder(dict[str, Any], default_dialect=DispatchAnyDialect)
+    assert orjson.loads(encoder.encode(data)) == orjson.loads(
+        orjson.dumps(data, default=default)
+    )
+    runner.bench_func(
+        "dispatch_any[orjson_default]", orjson.dumps, data, default
+    )
+    runner.bench_func("dispatch_any[dispatch_any]", encoder.encode, data)
+
+
+if __name__ == "__main__":
+    main()
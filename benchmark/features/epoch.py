@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pyperf
+
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.codecs.json import JSONDecoder, JSONEncoder
+from mashumaro.dialect import Dialect
+
+SIZE = 1000
+
+
+class ISOFormatDialect(Dialect):
+    pass
+
+
+class EpochMsDialect(Dialect):
+    serialization_strategy = {
+        datetime: {"serialize": "epoch_ms", "deserialize": "epoch_ms"},
+        timedelta: {"serialize": "epoch_ms", "deserialize": "epoch_ms"},
+    }
+
+
+class EpochNsDialect(Dialect):
+    serialization_strategy = {
+        datetime: {"serialize": "epoch_ns", "deserialize": "epoch_ns"},
+        timedelta: {"serialize": "epoch_ns", "deserialize": "epoch_ns"},
+    }
+
+
+@dataclass(slots=True)
+class Sample:
+    timestamp: datetime
+    duration: timedelta
+    value: float
+
+
+SERIES = [
+    Sample(
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        + timedelta(seconds=i, microseconds=i),
+        duration=timedelta(milliseconds=i),
+        value=i / 10,
+    )
+    for i in range(SIZE)
+]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    for name, dialect in (
+        ("isoformat", ISOFormatDialect),
+        ("epoch_ms", EpochMsDialect),
+        ("epoch_ns", EpochNsDialect),
+    ):
+        encoder = BasicEncoder(list[Sample], default_dialect=dialect)
+        decoder = BasicDecoder(list[Sample], default_dialect=dialect)
+        data = encoder.encode(SERIES)
+        runner.bench_func(f"epoch[{name}][dump]", encoder.encode, SERIES)
+        runner.bench_func(f"epoch[{name}][load]", decoder.decode, data)
+        json_encoder = JSONEncoder(list[Sample], default_dialect=dialect)
+        json_decoder = JSONDecoder(list[Sample], default_dialect=dialect)
+        json_data = json_encoder.encode(SERIES)
+        runner.bench_func(
+            f"epoch[{name}][json-dump]", json_encoder.encode, SERIES
+        )
+        runner.bench_func(
+            f"epoch[{name}][json-load]", json_decoder.decode, json_data
+        )
+
+
+if __name__ == "__main__":
+    main()
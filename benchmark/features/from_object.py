@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import pyperf
+
+from mashumaro import DataClassDictMixin
+
+SIZE = 1000
+
+
+class CustomerRow:
+    def __init__(self, id: int, name: str, email: Optional[str]):
+        self.id = id
+        self.name = name
+        self.email = email
+
+
+class OrderRow:
+    def __init__(self, id: int, created_at: datetime, customer: CustomerRow):
+        self.id = id
+        self.created_at = created_at
+        self.total = 10.5
+        self.note = None
+        self.customer = customer
+
+
+@dataclass(slots=True)
+class Customer(DataClassDictMixin):
+    id: int
+    name: str
+    email: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Order(DataClassDictMixin):
+    id: int
+    created_at: datetime
+    total: float
+    customer: Customer
+    note: Optional[str] = None
+
+
+def from_vars(rows: list[OrderRow]) -> list[Order]:
+    # the usual way to build dataclasses from objects
+    result = []
+    for row in rows:
+        d = vars(row).copy()
+        d["customer"] = vars(row.customer)
+        d["created_at"] = row.created_at.isoformat()
+        result.append(Order.from_dict(d))
+    return result
+
+
+def from_object(rows: list[OrderRow]) -> list[Order]:
+    return [Order.from_object(row) for row in rows]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    rows = [
+        OrderRow(i, datetime(2024, 1, 1), CustomerRow(i, "name", None))
+        for i in range(SIZE)
+    ]
+    assert from_vars(rows) == from_object(rows)
+    runner.bench_func("from_object[vars_from_dict]", from_vars, rows)
+    runner.bench_func("from_object[from_object]", from_object, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import pyperf
+
+from mashumaro.codecs import BasicDecoder
+
+SIZE = 1000
+
+
+@dataclass
+class Card:
+    number: str
+    expires: str
+
+
+@dataclass
+class Transfer:
+    iban: str
+    bic: Optional[str] = None
+
+
+@dataclass
+class Wallet:
+    wallet_id: str
+    provider: str
+
+
+@dataclass
+class Payment:
+    amount: int
+    method: Union[Card, Transfer, Wallet]
+    tags: Optional[list[int]] = None
+
+
+def reject_all(decoder: BasicDecoder, items: list[dict]) -> int:
+    rejected = 0
+    for item in items:
+        try:
+            decoder.decode(item)
+        except (ValueError, LookupError):
+            rejected += 1
+    return rejected
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    decoder = BasicDecoder(Payment)
+    # each item has a valid method, so the union is probed until Wallet
+    union_probing = [
+        {"amount": i, "method": {"wallet_id": str(i), "provider": "x"}}
+        for i in range(SIZE)
+    ]
+    invalid_method = [
+        {"amount": i, "method": {"unknown": str(i)}} for i in range(SIZE)
+    ]
+    invalid_field = [
+        {"amount": i, "method": {"iban": "x"}, "tags": ["x"]}
+        for i in range(SIZE)
+    ]
+    missing_field = [{"method": {"iban": "x"}} for _ in range(SIZE)]
+    assert reject_all(decoder, union_probing) == 0
+    for items in (invalid_method, invalid_field, missing_field):
+        assert reject_all(decoder, items) == SIZE
+    runner.bench_func(
+        "invalid_input[union_probing]", reject_all, decoder, union_probing
+    )
+    runner.bench_func(
+        "invalid_input[invalid_union]", reject_all, decoder, invalid_method
+    )
+    runner.bench_func(
+        "invalid_input[invalid_field]", reject_all, decoder, invalid_field
+    )
+    runner.bench_func(
+        "invalid_input[missing_field]", reject_all, decoder, missing_field
+    )
+
+
+if __name__ == "__main__":
+    main()
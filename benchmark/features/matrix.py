@@ -0,0 +1,295 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, Optional
+
+import orjson
+import pyperf
+
+from mashumaro import DataClassDictMixin, field_options
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.codecs.json import JSONDecoder, JSONEncoder
+from mashumaro.codecs.msgpack import MessagePackDecoder, MessagePackEncoder
+from mashumaro.codecs.orjson import ORJSONDecoder, ORJSONEncoder
+from mashumaro.config import (
+    ADD_DIALECT_SUPPORT,
+    TO_DICT_ADD_BY_ALIAS_FLAG,
+    TO_DICT_ADD_OMIT_NONE_FLAG,
+    BaseConfig,
+)
+from mashumaro.dialect import Dialect
+from mashumaro.mixins.json import DataClassJSONMixin
+from mashumaro.mixins.msgpack import DataClassMessagePackMixin
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+
+SIZE = 100
+
+
+class OrderStatus(Enum):
+    NEW = "new"
+    PAID = "paid"
+    SHIPPED = "shipped"
+
+
+@dataclass(slots=True)
+class Customer:
+    name: str
+    email: Optional[str]
+
+
+@dataclass(slots=True)
+class LineItem:
+    sku: str
+    quantity: int
+    price: float
+
+
+@dataclass
+class Order:
+    id: int
+    created_at: datetime
+    status: OrderStatus
+    customer: Customer
+    items: list[LineItem]
+    external_id: Optional[str] = field(
+        default=None, metadata=field_options(alias="externalId")
+    )
+
+
+@dataclass
+class DictOrder(Order, DataClassDictMixin):
+    pass
+
+
+@dataclass
+class FlagsOrder(Order, DataClassDictMixin):
+    class Config(BaseConfig):
+        code_generation_options = [
+            TO_DICT_ADD_OMIT_NONE_FLAG,
+            TO_DICT_ADD_BY_ALIAS_FLAG,
+        ]
+
+
+@dataclass
+class DialectOrder(Order, DataClassDictMixin):
+    class Config(BaseConfig):
+        code_generation_options = [ADD_DIALECT_SUPPORT]
+
+
+@dataclass
+class JSONOrder(Order, DataClassJSONMixin):
+    pass
+
+
+@dataclass
+class ORJSONOrder(Order, DataClassORJSONMixin):
+    pass
+
+
+@dataclass
+class MessagePackOrder(Order, DataClassMessagePackMixin):
+    pass
+
+
+class CustomDialect(Dialect):
+    pass
+
+
+DATA = [
+    {
+        "id": i,
+        "created_at": (
+            datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i)
+        ).isoformat(),
+        "status": "paid",
+        "customer": {"name": f"Customer {i}", "email": None},
+        "items": [
+            {"sku": f"SKU-{j}", "quantity": j, "price": j * 1.5}
+            for j in range(5)
+        ],
+        "external_id": None,
+    }
+    for i in range(SIZE)
+]
+
+
+@dataclass
+class Layer:
+    name: str
+    # the layer whose cost is included in this one
+    baseline: Optional[str]
+    load: Callable[[], Any]
+    dump: Callable[[], Any]
+
+
+def get_layers() -> list[Layer]:
+    objects = BasicDecoder(list[Order]).decode(DATA)
+    json_data = orjson.dumps(DATA)
+    layers = []
+
+    def add_codec_layer(name, baseline, shape, decoder, encoder, data):
+        objs = decoder.decode(data) if shape is not Order else objects
+        layers.append(
+            Layer(
+                name=name,
+                baseline=baseline,
+                load=lambda: decoder.decode(data),
+                dump=lambda: encoder.encode(objs),
+            )
+        )
+
+    def add_mixin_layer(name, baseline, cls, load, dump, encode=None):
+        objs = [cls.from_dict(d) for d in DATA]
+        data = [encode(obj) for obj in objs] if encode else DATA
+        layers.append(
+            Layer(
+                name=name,
+                baseline=baseline,
+                load=lambda: [load(d) for d in data],
+                dump=lambda: [dump(obj) for obj in objs],
+            )
+        )
+
+    add_codec_layer(
+        "codec[dict]",
+        None,
+        Order,
+        BasicDecoder(list[Order]),
+        BasicEncoder(list[Order]),
+        DATA,
+    )
+    add_codec_layer(
+        "codec[json]",
+        "codec[dict]",
+        Order,
+        JSONDecoder(list[Order]),
+        JSONEncoder(list[Order]),
+        json_data,
+    )
+    add_codec_layer(
+        "codec[json+orjson]",
+        "codec[dict]",
+        Order,
+        JSONDecoder(list[Order], pre_decoder_func=orjson.loads),
+        JSONEncoder(list[Order], post_encoder_func=orjson.dumps),
+        json_data,
+    )
+    add_codec_layer(
+        "codec[orjson]",
+        "codec[dict]",
+        Order,
+        ORJSONDecoder(list[Order]),
+        ORJSONEncoder(list[Order]),
+        json_data,
+    )
+    add_codec_layer(
+        "codec[msgpack]",
+        "codec[dict]",
+        Order,
+        MessagePackDecoder(list[Order]),
+        MessagePackEncoder(list[Order]),
+        MessagePackEncoder(list[Order]).encode(objects),
+    )
+    # codecs call compiled methods of mixin classes instead of inlining them
+    add_codec_layer(
+        "codec[dict]+mixin",
+        "codec[dict]",
+        DictOrder,
+        BasicDecoder(list[DictOrder]),
+        BasicEncoder(list[DictOrder]),
+        DATA,
+    )
+    add_mixin_layer(
+        "mixin[dict]",
+        "codec[dict]",
+        DictOrder,
+        DictOrder.from_dict,
+        DictOrder.to_dict,
+    )
+    add_mixin_layer(
+        "mixin[dict]+flags",
+        "mixin[dict]",
+        FlagsOrder,
+        FlagsOrder.from_dict,
+        FlagsOrder.to_dict,
+    )
+    add_mixin_layer(
+        "mixin[dict]+flags(kwargs)",
+        "mixin[dict]+flags",
+        FlagsOrder,
+        FlagsOrder.from_dict,
+        lambda obj: obj.to_dict(omit_none=False, by_alias=False),
+    )
+    add_mixin_layer(
+        "mixin[dict]+dialect_support",
+        "mixin[dict]",
+        DialectOrder,
+        DialectOrder.from_dict,
+        DialectOrder.to_dict,
+    )
+    add_mixin_layer(
+        "mixin[dict]+dialect_support(dialect)",
+        "mixin[dict]+dialect_support",
+        DialectOrder,
+        lambda d: DialectOrder.from_dict(d, dialect=CustomDialect),
+        lambda obj: obj.to_dict(dialect=CustomDialect),
+    )
+    add_mixin_layer(
+        "mixin[json]",
+        "mixin[dict]",
+        JSONOrder,
+        JSONOrder.from_json,
+        JSONOrder.to_json,
+        JSONOrder.to_json,
+    )
+    add_mixin_layer(
+        "mixin[orjson]",
+        "mixin[dict]",
+        ORJSONOrder,
+        ORJSONOrder.from_json,
+        ORJSONOrder.to_jsonb,
+        ORJSONOrder.to_jsonb,
+    )
+    add_mixin_layer(
+        "mixin[msgpack]",
+        "mixin[dict]",
+        MessagePackOrder,
+        MessagePackOrder.from_msgpack,
+        MessagePackOrder.to_msgpack,
+        MessagePackOrder.to_msgpack,
+    )
+    return layers
+
+
+def format_overhead(layers: list[Layer], results: dict[str, float]) -> str:
+    lines = [f"{'layer':<40} {'load':>12} {'dump':>12}  baseline"]
+    for layer in layers:
+        if layer.baseline is None:
+            continue
+        cells = []
+        for bench_type in ("load", "dump"):
+            mean = results[f"matrix[{layer.name}][{bench_type}]"]
+            base = results[f"matrix[{layer.baseline}][{bench_type}]"]
+            cells.append(f"{(mean - base) / base:>+12.1%}")
+        lines.append(f"{layer.name:<40} {' '.join(cells)}  {layer.baseline}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    layers = get_layers()
+    results = {}
+    for layer in layers:
+        for bench_type, func in (("load", layer.load), ("dump", layer.dump)):
+            name = f"matrix[{layer.name}][{bench_type}]"
+            benchmark = runner.bench_func(name, func)
+            if benchmark is not None:
+                results[name] = benchmark.mean()
+    if len(results) == 2 * len(layers):
+        print()
+        print("Overhead of each layer relative to its baseline:")
+        print(format_overhead(layers, results))
+
+
+if __name__ == "__main__":
+    main()
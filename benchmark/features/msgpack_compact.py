@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from ipaddress import IPv4Address, IPv6Address
+from uuid import UUID
+
+import pyperf
+
+from mashumaro.codecs.msgpack import MessagePackDecoder, MessagePackEncoder
+from mashumaro.mixins.msgpack import CompactMessagePackDialect
+
+SIZE = 1000
+
+
+@dataclass(slots=True)
+class Event:
+    id: UUID
+    created_at: datetime
+    source: IPv4Address
+    destination: IPv6Address
+    amount: Decimal
+
+
+EVENTS = [
+    Event(
+        id=UUID(int=i * 2**64 + i),
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        + timedelta(seconds=i, microseconds=i),
+        source=IPv4Address(0x0A000000 + i),
+        destination=IPv6Address(2**127 + i),
+        amount=Decimal(i) / 100,
+    )
+    for i in range(SIZE)
+]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    for name, dialect in (
+        ("default", None),
+        ("compact", CompactMessagePackDialect),
+    ):
+        encoder = MessagePackEncoder(list[Event], default_dialect=dialect)
+        decoder = MessagePackDecoder(list[Event], default_dialect=dialect)
+        data = encoder.encode(EVENTS)
+        metadata = {"description": f"payload size: {len(data)} bytes"}
+        runner.bench_func(
+            f"msgpack[{name}][dump]", encoder.encode, EVENTS, metadata=metadata
+        )
+        runner.bench_func(
+            f"msgpack[{name}][load]", decoder.decode, data, metadata=metadata
+        )
+
+
+if __name__ == "__main__":
+    main()
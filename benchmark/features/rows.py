@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+import pyperf
+
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.codecs.rows import RowDecoder, RowEncoder
+
+SIZE = 1000
+COLUMNS = ["id", "name", "email", "joined", "score"]
+
+
+@dataclass(slots=True)
+class User:
+    id: int
+    name: str
+    email: Optional[str]
+    joined: date
+    score: float = 0.0
+
+
+dict_decoder = BasicDecoder(User)
+dict_encoder = BasicEncoder(User)
+row_decoder = RowDecoder(User, columns=COLUMNS)
+row_encoder = RowEncoder(User, columns=COLUMNS)
+
+
+def decode_dicts(rows: list[tuple]) -> list[User]:
+    # the usual way to load a result set of a cursor
+    return [dict_decoder.decode(dict(zip(COLUMNS, row))) for row in rows]
+
+
+def decode_rows(rows: list[tuple]) -> list[User]:
+    return list(row_decoder.decode_many(rows))
+
+
+def encode_dicts(users: list[User]) -> list[tuple]:
+    result = []
+    for user in users:
+        d = dict_encoder.encode(user)
+        result.append(tuple(d[c] for c in COLUMNS))
+    return result
+
+
+def encode_rows(users: list[User]) -> list[tuple]:
+    return list(row_encoder.encode_many(users))
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    rows = [
+        (i, "name", None if i % 2 else "a@b.c", "2024-01-01", 1.5)
+        for i in range(SIZE)
+    ]
+    users = decode_rows(rows)
+    assert decode_dicts(rows) == users
+    assert encode_dicts(users) == encode_rows(users)
+    runner.bench_func("rows[decode_dicts]", decode_dicts, rows)
+    runner.bench_func("rows[decode_rows]", decode_rows, rows)
+    runner.bench_func("rows[encode_dicts]", encode_dicts, users)
+    runner.bench_func("rows[encode_rows]", encode_rows, users)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import py_compile
+import sys
+import tempfile
+from pathlib import Path
+
+import pyperf
+
+COUNTS = (10, 100, 1000)
+MODES = ("mixin", "mixin_lazy", "codec")
+MODULES_DIR = Path(tempfile.gettempdir()) / "mashumaro_startup_benchmark"
+
+HEADER = """\
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, Optional, TypeVar, Union
+
+from mashumaro import DataClassDictMixin
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.config import BaseConfig
+
+T = TypeVar("T")
+
+
+class ModelConfig(BaseConfig):
+    lazy_compilation = {lazy}
+
+
+@dataclass
+class Page(Generic[T]{bases}):
+    items: list[T]
+    total: int
+"""
+
+# each model kind is a pair of field definitions and a valid input sample
+KINDS = (
+    (
+        "    a: int\n"
+        "    b: str\n"
+        "    c: float\n"
+        "    d: Optional[datetime] = None\n",
+        {"a": 1, "b": "b", "c": 1.0},
+    ),
+    (
+        "    a: Union[int, str]\n"
+        "    b: Optional[{prev}]\n"
+        "    c: list[Union[{prev}, str]]\n",
+        {"a": 1, "b": None, "c": ["c"]},
+    ),
+    (
+        "    page: Page[{prev}]\n    counters: dict[str, list[int]]\n",
+        {"page": {"items": [], "total": 0}, "counters": {"a": [1]}},
+    ),
+    # forward reference to a model that isn't defined yet
+    ("    next: Optional[{next}] = None\n", {"next": None}),
+)
+
+
+def generate_module(count: int, mode: str) -> str:
+    mixin = mode != "codec"
+    lines = [
+        HEADER.format(
+            lazy=mode == "mixin_lazy",
+            bases=", DataClassDictMixin" if mixin else "",
+        )
+    ]
+    for i in range(count):
+        fields, _ = KINDS[i % len(KINDS)]
+        lines.append("")
+        lines.append("@dataclass")
+        if mixin:
+            lines.append(f"class Model{i}(DataClassDictMixin):")
+            lines.append("    Config = ModelConfig")
+        else:
+            lines.append(f"class Model{i}:")
+        lines.append(
+            fields.format(
+                prev=f"Model{max(i - 1, 0)}", next=f"Model{(i + 1) % count}"
+            )
+        )
+    models = ", ".join(f"Model{i}" for i in range(count))
+    samples = [KINDS[i % len(KINDS)][1] for i in range(count)]
+    lines.append(f"MODELS = [{models}]")
+    lines.append(f"SAMPLES = {samples!r}")
+    if mixin:
+        lines.append("""
+
+def use():
+    for model, sample in zip(MODELS, SAMPLES):
+        model.from_dict(sample).to_dict()
+""")
+    else:
+        lines.append("""
+DECODERS = [BasicDecoder(model) for model in MODELS]
+ENCODERS = [BasicEncoder(model) for model in MODELS]
+
+
+def use():
+    for decoder, encoder, sample in zip(DECODERS, ENCODERS, SAMPLES):
+        encoder.encode(decoder.decode(sample))
+""")
+    return "\n".join(lines)
+
+
+def write_modules(counts: list[int]) -> None:
+    MODULES_DIR.mkdir(exist_ok=True)
+    for count in counts:
+        for mode in MODES:
+            path = MODULES_DIR / f"models_{mode}_{count}.py"
+            source = generate_module(count, mode)
+            if not path.exists() or path.read_text() != source:
+                path.write_text(source)
+                py_compile.compile(str(path))
+
+
+def get_command(statements: str) -> list[str]:
+    return [
+        sys.executable,
+        "-c",
+        f"import sys; sys.path.insert(0, {str(MODULES_DIR)!r}); {statements}",
+    ]
+
+
+def add_cmdline_args(cmd, args) -> None:
+    for count in args.count or ():
+        cmd.extend(("--count", str(count)))
+
+
+def main() -> None:
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.argparser.add_argument(
+        "--count",
+        action="append",
+        type=int,
+        choices=COUNTS,
+        help="number of models in a module, can be repeated (default: all)",
+    )
+    counts = runner.parse_args().count or list(COUNTS)
+    write_modules(counts)
+    benchmarks = [
+        runner.bench_command(
+            "startup[baseline][import]", get_command("import mashumaro")
+        )
+    ]
+    for count in counts:
+        for mode in MODES:
+            module = f"models_{mode}_{count}"
+            benchmarks.append(
+                runner.bench_command(
+                    f"startup[{mode}][{count}][import]",
+                    get_command(f"import {module}"),
+                )
+            )
+            benchmarks.append(
+                runner.bench_command(
+                    f"startup[{mode}][{count}][first_use]",
+                    get_command(f"import {module}; {module}.use()"),
+                )
+            )
+    if all(benchmarks):
+        print()
+        print(f"{'benchmark':<40} {'time':>12} {'max RSS, MiB':>14}")
+        for benchmark in benchmarks:
+            max_rss = max(
+                run.get_metadata().get("command_max_rss", 0)
+                for run in benchmark.get_runs()
+            )
+            print(
+                f"{benchmark.get_name():<40} "
+                f"{benchmark.format_value(benchmark.mean()):>12} "
+                f"{max_rss / 2**20:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+import pyperf
+
+from mashumaro import field_options
+from mashumaro.codecs import BasicDecoder, BasicEncoder, Transcoder
+from mashumaro.dialect import Dialect
+
+
+@dataclass(slots=True)
+class Item:
+    sku: str = field(metadata=field_options(alias="skuCode"))
+    added_at: datetime = field(metadata=field_options(alias="addedAt"))
+    quantity: int = 1
+    price: float = 0.0
+
+
+@dataclass(slots=True)
+class Order:
+    order_id: int = field(metadata=field_options(alias="orderId"))
+    customer: str
+    items: list[Item]
+    tags: list[str] = field(default_factory=list)
+    note: Optional[str] = None
+
+
+class ExternalDialect(Dialect):
+    serialize_by_alias = True
+
+
+class InternalDialect(Dialect):
+    serialization_strategy = {
+        datetime: {
+            "serialize": lambda dt: int(dt.timestamp()),
+            "deserialize": lambda ts: datetime.fromtimestamp(ts, timezone.utc),
+        }
+    }
+
+
+decoder = BasicDecoder(Order, default_dialect=ExternalDialect)
+encoder = BasicEncoder(Order, default_dialect=InternalDialect)
+transcoder = Transcoder(
+    Order, from_dialect=ExternalDialect, to_dialect=InternalDialect
+)
+
+
+def decode_encode(data: dict) -> dict:
+    return encoder.encode(decoder.decode(data))
+
+
+def transcode(data: dict) -> dict:
+    return transcoder.transcode(data)
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    data = {
+        "orderId": 1,
+        "customer": "customer",
+        "items": [
+            {
+                "skuCode": f"sku{i}",
+                "addedAt": "2024-01-01T00:00:00+00:00",
+                "quantity": i,
+                "price": 1.5,
+            }
+            for i in range(10)
+        ],
+        "tags": ["a", "b"],
+    }
+    assert decode_encode(data) == transcode(data)
+    runner.bench_func("transcode[decode_encode]", decode_encode, data)
+    runner.bench_func("transcode[transcode]", transcode, data)
+
+
+if __name__ == "__main__":
+    main()
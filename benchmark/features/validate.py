@@ -0,0 +1,18 @@
+import pyperf
+
+from benchmark.features.matrix import DATA, Order
+from mashumaro import Validator
+from mashumaro.codecs import BasicDecoder
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    decoder = BasicDecoder(list[Order])
+    validator = Validator(list[Order])
+    validator.validate(DATA)
+    runner.bench_func("validate[decode]", decoder.decode, DATA)
+    runner.bench_func("validate[validate]", validator.validate, DATA)
+
+
+if __name__ == "__main__":
+    main()
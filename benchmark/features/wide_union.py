@@ -0,0 +1,44 @@
+from dataclasses import dataclass, make_dataclass
+from typing import Union
+
+import pyperf
+
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+
+SIZE = 1000
+WIDTHS = (2, 4, 8, 16)
+
+# variants have distinct required fields, so each of them is unambiguous
+VARIANTS = [
+    dataclass(slots=True)(
+        make_dataclass(f"Variant{i}", [(f"field_{i}", int), ("value", str)])
+    )
+    for i in range(max(WIDTHS))
+]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    for width in WIDTHS:
+        variants = VARIANTS[:width]
+        shape = list[Union[tuple(variants)]]  # type: ignore[misc]
+        # the last variant is the slowest one for ordered unions
+        objects = [variants[-1](i, str(i)) for i in range(SIZE)]
+        mixed = [variants[i % width](i, str(i)) for i in range(SIZE)]
+        encoder = BasicEncoder(shape)
+        decoder = BasicDecoder(shape)
+        runner.bench_func(
+            f"wide_union[{width}][last][dump]", encoder.encode, objects
+        )
+        runner.bench_func(
+            f"wide_union[{width}][mixed][dump]", encoder.encode, mixed
+        )
+        runner.bench_func(
+            f"wide_union[{width}][last][load]",
+            decoder.decode,
+            encoder.encode(objects),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import argparse
+import gc
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from benchmark.common import load_data
+
+SIZES = (1, 100, 1000)
+LIBRARIES = (
+    "mashumaro",
+    "cattrs",
+    "pydantic_v2",
+    "pydantic_v1",
+    "marshmallow",
+    "dataclasses_json",
+    "dacite",
+    "asdict",
+)
+# mashumaro layers from benchmark/features/matrix.py
+LAYER_PREFIX = "mashumaro "
+
+
+def get_rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+class RSSSampler(threading.Thread):
+    def __init__(self, interval: float = 0.001) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = get_rss() or 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            self.peak = max(self.peak, get_rss() or 0)
+            time.sleep(self.interval)
+
+    def stop(self) -> int:
+        self._stopped.set()
+        self.join()
+        self.peak = max(self.peak, get_rss() or 0)
+        return self.peak
+
+
+class CaptureRunner:
+    """Collects functions that benchmarks pass to pyperf instead of timing."""
+
+    def __init__(self) -> None:
+        self.func: Optional[Callable[..., Any]] = None
+        self.args: tuple[Any, ...] = ()
+
+    def bench_func(self, name, func, *args, **kwargs) -> None:
+        self.func = func
+        self.args = args
+
+
+def get_library_func(library: str, bench_type: str):
+    module = importlib.import_module(f"benchmark.libs.{library}.common")
+    runner = CaptureRunner()
+    benchmark = module.Benchmark(runner)
+    data = load_data()
+    if bench_type == "load":
+        benchmark.run_loader(data)
+    else:
+        benchmark.run_dumper(data)
+    return runner.func, runner.args
+
+
+def get_layer_func(layer_name: str, bench_type: str):
+    from benchmark.features.matrix import get_layers
+
+    for layer in get_layers():
+        if layer.name == layer_name:
+            return getattr(layer, bench_type), ()
+    raise ValueError(f"Unknown layer: {layer_name}")
+
+
+def measure(target: str, bench_type: str, size: int) -> dict[str, Any]:
+    try:
+        if target.startswith(LAYER_PREFIX):
+            func, args = get_layer_func(
+                target[len(LAYER_PREFIX) :], bench_type
+            )
+        else:
+            func, args = get_library_func(target, bench_type)
+    except ImportError as e:
+        return {"skipped": str(e)}
+    if func is None:
+        return {"skipped": f"{target} doesn't support {bench_type}"}
+    func(*args)  # warmup to exclude compilation and caches
+
+    gc.collect()
+    rss_before = get_rss()
+    sampler = RSSSampler()
+    sampler.start()
+    results = [func(*args) for _ in range(size)]
+    rss_peak = sampler.stop()
+    gc.collect()
+    rss_retained = get_rss()
+    del results
+    gc.collect()
+
+    tracemalloc.start()
+    results = [func(*args) for _ in range(size)]
+    _, peak = tracemalloc.get_traced_memory()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    result: dict[str, Any] = {"peak": peak, "retained": retained}
+    if rss_before is not None and rss_retained is not None:
+        result["rss_peak"] = rss_peak - rss_before
+        result["rss_retained"] = rss_retained - rss_before
+    return result
+
+
+def get_targets(include_layers: bool) -> list[str]:
+    targets = list(LIBRARIES)
+    if include_layers:
+        from benchmark.features.matrix import get_layers
+
+        targets.extend(LAYER_PREFIX + layer.name for layer in get_layers())
+    return targets
+
+
+def format_size(value: Optional[int]) -> str:
+    if value is None:
+        return "-"
+    return f"{value / 2**20:.2f} MiB"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure memory used for decoding and encoding"
+    )
+    parser.add_argument("--worker", nargs=3, help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--target",
+        action="append",
+        help="library or mashumaro layer, can be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        type=int,
+        help=f"number of decoded or encoded objects (default: {SIZES})",
+    )
+    parser.add_argument(
+        "--no-layers",
+        action="store_true",
+        help="don't measure mashumaro mixins and codecs separately",
+    )
+    parser.add_argument("-o", "--output", help="JSON file to write results")
+    args = parser.parse_args()
+
+    if args.worker:
+        target, bench_type, size = args.worker
+        print(json.dumps(measure(target, bench_type, int(size))))
+        return
+
+    results = []
+    print(
+        f"{'target':<50} {'type':<5} {'size':>5} {'peak':>12} "
+        f"{'retained':>12} {'RSS peak':>12} {'RSS retained':>12}"
+    )
+    for target in args.target or get_targets(not args.no_layers):
+        for bench_type in ("load", "dump"):
+            for size in args.size or SIZES:
+                output = subprocess.run(
+                    [
+                        sys.executable,
+                        str(Path(__file__)),
+                        "--worker",
+                        target,
+                        bench_type,
+                        str(size),
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                result = json.loads(output)
+                if "skipped" in result:
+                    continue
+                result.update(target=target, type=bench_type, size=size)
+                results.append(result)
+                print(
+                    f"{target:<50} {bench_type:<5} {size:>5} "
+                    f"{format_size(result['peak']):>12} "
+                    f"{format_size(result['retained']):>12} "
+                    f"{format_size(result.get('rss_peak')):>12} "
+                    f"{format_size(result.get('rss_retained')):>12}"
+                )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f)
+
+
+if __name__ == "__main__":
+    main()
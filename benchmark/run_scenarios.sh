@@ -0,0 +1,14 @@
+#!/bin/bash
+
+set -e
+export PYTHONPATH=$PYTHONPATH:.
+rm -rf benchmark/data/scenario_specs
+mkdir -p benchmark/data/results
+rm -f benchmark/data/results/scenarios.json
+
+python benchmark/scenarios/run.py "$@" -o benchmark/data/results/scenarios.json
+
+python benchmark/create_chart_specs.py benchmark/data/results/scenarios.json
+echo "You can now render chart specs with https://vega.github.io/editor/
+  * benchmark/data/scenario_specs/spec_<scenario>_load.json
+  * benchmark/data/scenario_specs/spec_<scenario>_dump.json"
@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, Optional, Type
+
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.dialect import Dialect
+
+LoadFunc = Callable[[Any], Any]
+DumpFunc = Callable[[Any], Any]
+
+
+@dataclass
+class Scenario:
+    name: str
+    title: str
+    type: Any
+    make_corpus: Callable[[], Any]
+    dialect: Optional[Type[Dialect]] = None
+    # libraries that can produce the same data without extra configuration
+    libraries: tuple[str, ...] = field(
+        default=("mashumaro", "cattrs", "pydantic_v2")
+    )
+
+
+def mashumaro_adapter(scenario: Scenario) -> tuple[LoadFunc, DumpFunc]:
+    decoder = BasicDecoder(scenario.type, default_dialect=scenario.dialect)
+    encoder = BasicEncoder(scenario.type, default_dialect=scenario.dialect)
+    return decoder.decode, encoder.encode
+
+
+def cattrs_adapter(scenario: Scenario) -> tuple[LoadFunc, DumpFunc]:
+    import cattrs
+
+    converter = cattrs.Converter(detailed_validation=False)
+    for typ in (datetime, date, time):
+        converter.register_structure_hook(typ, lambda o, t: t.fromisoformat(o))
+        converter.register_unstructure_hook(typ, lambda o: o.isoformat())
+    converter.register_structure_hook(Decimal, lambda o, _: Decimal(o))
+    converter.register_unstructure_hook(Decimal, str)
+    typ = scenario.type
+    return (
+        lambda data: converter.structure(data, typ),
+        lambda obj: converter.unstructure(obj, typ),
+    )
+
+
+def pydantic_v2_adapter(scenario: Scenario) -> tuple[LoadFunc, DumpFunc]:
+    from pydantic import TypeAdapter
+
+    adapter = TypeAdapter(scenario.type)
+    return (
+        adapter.validate_python,
+        lambda obj: adapter.dump_python(obj, mode="json"),
+    )
+
+
+LIBRARIES: dict[str, Callable[[Scenario], tuple[LoadFunc, DumpFunc]]] = {
+    "mashumaro": mashumaro_adapter,
+    "cattrs": cattrs_adapter,
+    "pydantic_v2": pydantic_v2_adapter,
+}
+
+LIBRARY_TITLES = {
+    "mashumaro": "mashumaro",
+    "cattrs": "cattrs",
+    "pydantic_v2": "pydantic v2",
+}
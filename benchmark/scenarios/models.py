@@ -0,0 +1,307 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Annotated, Generic, Literal, Optional, TypeVar, Union
+
+from typing_extensions import Self
+
+from benchmark.scenarios.common import Scenario
+from mashumaro import field_options
+from mashumaro.dialect import Dialect
+from mashumaro.types import Discriminator
+
+T = TypeVar("T")
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
+class Point:
+    x: int
+    y: int
+
+
+@dataclass(slots=True)
+class Measurement:
+    id: int
+    value: Union[int, float, str, list[int], Point]
+
+
+def make_union_corpus():
+    values = [1, 1.5, "text", [1, 2, 3], {"x": 1, "y": 2}]
+    return [{"id": i, "value": values[i % len(values)]} for i in range(1000)]
+
+
+# tag values should be available as class attributes, so no slots here
+@dataclass
+class Shape:
+    pass
+
+
+@dataclass
+class Circle(Shape):
+    radius: float
+    kind: Literal["circle"] = "circle"
+
+
+@dataclass
+class Square(Shape):
+    side: float
+    kind: Literal["square"] = "square"
+
+
+@dataclass
+class Rectangle(Shape):
+    width: float
+    height: float
+    kind: Literal["rectangle"] = "rectangle"
+
+
+def make_discriminated_union_corpus():
+    shapes = [
+        {"kind": "circle", "radius": 1.0},
+        {"kind": "square", "side": 2.0},
+        {"kind": "rectangle", "width": 1.0, "height": 2.0},
+    ]
+    return [shapes[i % len(shapes)] for i in range(1000)]
+
+
+@dataclass(slots=True)
+class TreeNode:
+    name: str
+    children: list[Self] = field(default_factory=list)
+
+
+def make_tree(depth: int, width: int = 2):
+    if depth == 0:
+        return {"name": "leaf", "children": []}
+    return {
+        "name": f"node-{depth}",
+        "children": [make_tree(depth - 1, width) for _ in range(width)],
+    }
+
+
+def make_point_corpus():
+    return [{"x": i, "y": -i} for i in range(100_000)]
+
+
+@dataclass(slots=True)
+class AuditRecord:
+    id: int
+    created_at: datetime
+    updated_at: datetime
+    deleted_at: Optional[datetime]
+    day: date
+    opens_at: time
+
+
+def make_datetime_corpus():
+    result = []
+    for i in range(1000):
+        created_at = START + timedelta(seconds=i, microseconds=i)
+        result.append(
+            {
+                "id": i,
+                "created_at": created_at.isoformat(),
+                "updated_at": (created_at + timedelta(hours=1)).isoformat(),
+                "deleted_at": None if i % 2 else created_at.isoformat(),
+                "day": created_at.date().isoformat(),
+                "opens_at": time(9, i % 60).isoformat(),
+            }
+        )
+    return result
+
+
+@dataclass(slots=True)
+class Payment:
+    id: int
+    amount: Decimal
+    fee: Decimal
+    currency: str
+
+
+def make_decimal_corpus():
+    return [
+        {
+            "id": i,
+            "amount": str(Decimal(i * 1234) / 100),
+            "fee": str(Decimal(i) / 1000),
+            "currency": "USD",
+        }
+        for i in range(1000)
+    ]
+
+
+@dataclass(slots=True)
+class Profile:
+    id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    nickname: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    company: Optional[str] = None
+    title: Optional[str] = None
+    city: Optional[str] = None
+    country: Optional[str] = None
+    age: Optional[int] = None
+    score: Optional[float] = None
+    website: Optional[str] = None
+    bio: Optional[str] = None
+    avatar: Optional[str] = None
+    timezone: Optional[str] = None
+    language: Optional[str] = None
+
+
+def make_sparse_corpus():
+    return [
+        {"id": i, "nickname": f"user{i}", "age": i % 100} for i in range(1000)
+    ]
+
+
+@dataclass(slots=True)
+class Settings:
+    id: int
+    theme: str = "light"
+    language: str = "en"
+    notifications: bool = True
+    page_size: int = 20
+    timeout: float = 30.0
+    tags: list[str] = field(default_factory=list)
+
+
+def make_settings_corpus():
+    return [
+        {"id": i, "page_size": 50} if i % 10 == 0 else {"id": i}
+        for i in range(1000)
+    ]
+
+
+class OmitNoneDialect(Dialect):
+    omit_none = True
+
+
+class OmitDefaultDialect(Dialect):
+    omit_default = True
+
+
+@dataclass(slots=True)
+class Account:
+    account_id: int = field(metadata=field_options(alias="accountId"))
+    display_name: str = field(metadata=field_options(alias="displayName"))
+    created_at: datetime = field(metadata=field_options(alias="createdAt"))
+    is_active: bool = field(metadata=field_options(alias="isActive"))
+
+
+class ByAliasDialect(Dialect):
+    serialize_by_alias = True
+
+
+def make_alias_corpus():
+    return [
+        {
+            "accountId": i,
+            "displayName": f"Account {i}",
+            "createdAt": (START + timedelta(seconds=i)).isoformat(),
+            "isActive": bool(i % 2),
+        }
+        for i in range(1000)
+    ]
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: list[T]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+def make_generic_corpus():
+    return [
+        {
+            "items": [{"x": j, "y": i} for j in range(100)],
+            "total": 10_000,
+            "next_cursor": f"cursor-{i + 1}" if i < 99 else None,
+        }
+        for i in range(100)
+    ]
+
+
+SCENARIOS = [
+    Scenario(
+        name="union",
+        title="Union of primitives, lists and dataclasses",
+        type=list[Measurement],
+        make_corpus=make_union_corpus,
+        libraries=("mashumaro", "pydantic_v2"),
+    ),
+    Scenario(
+        name="discriminated_union",
+        title="Discriminated union of dataclasses",
+        type=list[
+            Annotated[Shape, Discriminator("kind", include_subtypes=True)]
+        ],
+        make_corpus=make_discriminated_union_corpus,
+        libraries=("mashumaro",),
+    ),
+    Scenario(
+        name="deep_nesting",
+        title="Recursive tree with 2047 nodes",
+        type=TreeNode,
+        make_corpus=lambda: make_tree(10),
+    ),
+    Scenario(
+        name="many_small",
+        title="List of 100 000 small dataclasses",
+        type=list[Point],
+        make_corpus=make_point_corpus,
+    ),
+    Scenario(
+        name="datetime",
+        title="Datetime-heavy records",
+        type=list[AuditRecord],
+        make_corpus=make_datetime_corpus,
+    ),
+    Scenario(
+        name="decimal",
+        title="Records with Decimal money fields",
+        type=list[Payment],
+        make_corpus=make_decimal_corpus,
+    ),
+    Scenario(
+        name="sparse_optional",
+        title="Sparse records with many Optional fields",
+        type=list[Profile],
+        make_corpus=make_sparse_corpus,
+    ),
+    Scenario(
+        name="omit_none",
+        title="Sparse records with omit_none",
+        type=list[Profile],
+        make_corpus=make_sparse_corpus,
+        dialect=OmitNoneDialect,
+        libraries=("mashumaro",),
+    ),
+    Scenario(
+        name="omit_default",
+        title="Records with omit_default",
+        type=list[Settings],
+        make_corpus=make_settings_corpus,
+        dialect=OmitDefaultDialect,
+        libraries=("mashumaro",),
+    ),
+    Scenario(
+        name="aliases",
+        title="Records with aliased fields",
+        type=list[Account],
+        make_corpus=make_alias_corpus,
+        dialect=ByAliasDialect,
+        libraries=("mashumaro",),
+    ),
+    Scenario(
+        name="generic",
+        title="Generic dataclass pages",
+        type=list[Page[Point]],
+        make_corpus=make_generic_corpus,
+    ),
+]
@@ -0,0 +1,58 @@
+import pyperf
+
+from benchmark.scenarios.common import LIBRARIES
+from benchmark.scenarios.models import SCENARIOS
+
+
+def add_cmdline_args(cmd, args) -> None:
+    for scenario in args.scenario or ():
+        cmd.extend(("--scenario", scenario))
+    for library in args.library or ():
+        cmd.extend(("--library", library))
+    if args.compare:
+        cmd.append("--compare")
+
+
+def main() -> None:
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.argparser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="scenario to run, can be repeated (default: all)",
+    )
+    runner.argparser.add_argument(
+        "--library",
+        action="append",
+        choices=list(LIBRARIES),
+        help="library to run, can be repeated (default: mashumaro)",
+    )
+    runner.argparser.add_argument(
+        "--compare",
+        action="store_true",
+        help="run all the libraries that support a scenario",
+    )
+    args = runner.parse_args()
+    if args.compare:
+        libraries = list(LIBRARIES)
+    else:
+        libraries = args.library or ["mashumaro"]
+    for scenario in SCENARIOS:
+        if args.scenario and scenario.name not in args.scenario:
+            continue
+        data = scenario.make_corpus()
+        for library in libraries:
+            if library not in scenario.libraries:
+                continue
+            try:
+                load, dump = LIBRARIES[library](scenario)
+            except ImportError:
+                continue
+            obj = load(data)
+            dump(obj)
+            runner.bench_func(f"{scenario.name}[{library}][load]", load, data)
+            runner.bench_func(f"{scenario.name}[{library}][dump]", dump, obj)
+
+
+if __name__ == "__main__":
+    main()
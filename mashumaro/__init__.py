@@ -1,10 +1,18 @@
+from mashumaro.cloner import clone
 from mashumaro.exceptions import MissingField
 from mashumaro.helper import field_options, pass_through
+from mashumaro.instrumentation import compile_report, stats
 from mashumaro.mixins.dict import DataClassDictMixin
+from mashumaro.validator import Validator, validate
 
 __all__ = [
     "MissingField",
     "DataClassDictMixin",
     "field_options",
     "pass_through",
+    "stats",
+    "compile_report",
+    "Validator",
+    "validate",
+    "clone",
 ]
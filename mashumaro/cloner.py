@@ -0,0 +1,23 @@
+from dataclasses import is_dataclass
+from typing import TypeVar
+
+from mashumaro.core.meta.code.builder import CodeBuilder, InternalMethodName
+from mashumaro.core.meta.helpers import type_name
+
+__all__ = ["clone"]
+
+T = TypeVar("T")
+
+CLONE_METHOD = InternalMethodName.from_public("clone")
+
+
+def clone(obj: T) -> T:
+    cls = type(obj)
+    try:
+        method = cls.__dict__[CLONE_METHOD]
+    except KeyError:
+        if not is_dataclass(cls):
+            raise ValueError(f"{type_name(cls)} is not a dataclass") from None
+        CodeBuilder(cls, allow_postponed_evaluation=False).add_clone_method()
+        method = cls.__dict__[CLONE_METHOD]
+    return method(obj)
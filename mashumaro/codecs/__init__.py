@@ -1,3 +1,11 @@
 from .basic import BasicDecoder, BasicEncoder
+from .rows import RowDecoder, RowEncoder
+from .transcoder import Transcoder
 
-__all__ = ["BasicDecoder", "BasicEncoder"]
+__all__ = [
+    "BasicDecoder",
+    "BasicEncoder",
+    "RowDecoder",
+    "RowEncoder",
+    "Transcoder",
+]
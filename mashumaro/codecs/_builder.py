@@ -1,27 +1,60 @@
+import collections.abc
 import re
-from collections.abc import Callable
-from typing import Any, Type
+from collections.abc import Callable, Sequence
+from contextlib import nullcontext
+from dataclasses import MISSING, is_dataclass
+from typing import Any, ContextManager, Type
 
+from typing_extensions import Self
+
+from mashumaro.config import ADD_SERIALIZATION_CONTEXT
 from mashumaro.core.meta.code.builder import CodeBuilder
-from mashumaro.core.meta.helpers import is_optional, is_type_var_any
+from mashumaro.core.meta.helpers import (
+    get_args,
+    get_type_origin,
+    is_annotated,
+    is_optional,
+    is_self,
+    is_type_var_any,
+    not_none_type_arg,
+    type_name,
+)
 from mashumaro.core.meta.types.common import (
     AttrsHolder,
     FieldContext,
     ValueSpec,
+    clean_id,
 )
 from mashumaro.core.meta.types.pack import PackerRegistry
 from mashumaro.core.meta.types.unpack import UnpackerRegistry
+from mashumaro.dialect import Dialect
+from mashumaro.exceptions import BadHookSignature
+from mashumaro.types import GenericSerializableType, SerializableType
 
 CALL_EXPR = re.compile(r"^([^ ]+)\(value\)$")
 
 
 class CodecCodeBuilder(CodeBuilder):
     @classmethod
-    def new(cls, **kwargs: Any) -> "CodecCodeBuilder":
+    def new(cls, **kwargs: Any) -> Self:
         if "attrs" not in kwargs:
             kwargs["attrs"] = AttrsHolder()
         return cls(AttrsHolder("__root__"), **kwargs)  # type: ignore
 
+    @classmethod
+    def new_for_dataclass(cls, shape_type: Type, **kwargs: Any) -> Self:
+        origin_type = get_type_origin(shape_type)
+        if not is_dataclass(origin_type):
+            raise ValueError(f"{type_name(shape_type)} is not a dataclass")
+        return cls(
+            origin_type, get_args(shape_type), attrs=AttrsHolder(), **kwargs
+        )
+
+    compile_report_name: str | None = None
+
+    def get_compile_report_name(self) -> str:
+        return self.compile_report_name or super().get_compile_report_name()
+
     def add_decode_method(
         self,
         shape_type: Type,
@@ -29,6 +62,7 @@ class CodecCodeBuilder(CodeBuilder):
         pre_decoder_func: Callable[[Any], Any] | None = None,
     ) -> None:
         self.reset()
+        self.compile_report_name = f"{type_name(shape_type)} decoder"
         with self.indent("def decode(value):"):
             if pre_decoder_func:
                 self.ensure_object_imported(pre_decoder_func, "decoder")
@@ -40,6 +74,13 @@ class CodecCodeBuilder(CodeBuilder):
                     shape_type, self.get_field_resolved_type_params("")
                 )
             )
+            get_option = self.get_dialect_or_config_option
+            limits = get_option("decode_limits", None)
+            count_items = (
+                limits is not None and limits.max_total_items is not None
+            )
+            if count_items:
+                self.add_line(f"{self.get_decode_limiter()}.start()")
             unpacked_value = UnpackerRegistry.get(
                 ValueSpec(
                     type=shape_type,
@@ -47,11 +88,17 @@ class CodecCodeBuilder(CodeBuilder):
                     builder=self,
                     field_ctx=FieldContext(name="", metadata={}),
                     could_be_none=could_be_none,
+                    no_copy_unpack_collections=get_option(
+                        "no_copy_unpack_collections", ()
+                    ),
+                    trust_no_copy_unpack_collections=get_option(
+                        "trust_no_copy_unpack_collections", False
+                    ),
                 )
             )
             self.add_line(f"return {unpacked_value}")
         self.add_line("setattr(decoder_obj, 'decode', decode)")
-        if pre_decoder_func is None:
+        if pre_decoder_func is None and not count_items:
             m = CALL_EXPR.match(unpacked_value)
             if m:
                 method_name = m.group(1)
@@ -68,6 +115,7 @@ class CodecCodeBuilder(CodeBuilder):
         post_encoder_func: Callable[[Any], Any] | None = None,
     ) -> None:
         self.reset()
+        self.compile_report_name = f"{type_name(shape_type)} encoder"
         with self.indent("def encode(value):"):
             could_be_none = (
                 shape_type in (Any, type(None), None)
@@ -104,3 +152,522 @@ class CodecCodeBuilder(CodeBuilder):
         self.ensure_object_imported(self.cls, "cls")
         self.ensure_object_imported(self.cls, "self")
         self.compile()
+
+    def get_row_fields(
+        self, columns: Sequence[str | None]
+    ) -> list[tuple[str | None, Any]]:
+        fields_by_key: dict[str, tuple[str, Any]] = {}
+        for fname, ftype in self.get_field_types(include_extras=True).items():
+            field = self.dataclass_fields.get(fname)
+            if field and not field.init:
+                continue
+            for key in self.get_field_keys(fname, ftype):
+                fields_by_key.setdefault(key, (fname, ftype))
+            fields_by_key[fname] = (fname, ftype)
+        row_fields: list[tuple[str | None, Any]] = []
+        mapped_fields: set[str] = set()
+        for column in columns:
+            if column is None:
+                row_fields.append((None, None))
+            elif column in fields_by_key:
+                fname = fields_by_key[column][0]
+                if fname in mapped_fields:
+                    raise ValueError(
+                        f"Column '{column}' maps field '{fname}' "
+                        f"of {type_name(self.cls)} that is already mapped"
+                    )
+                mapped_fields.add(fname)
+                row_fields.append(fields_by_key[column])
+            else:
+                raise ValueError(
+                    f"Column '{column}' doesn't match any field "
+                    f"of {type_name(self.cls)}"
+                )
+        return row_fields
+
+    def add_row_decode_method(
+        self, columns: Sequence[str | None], decoder_obj: Any
+    ) -> None:
+        self.reset()
+        self.compile_report_name = f"{type_name(self.cls)} row decoder"
+        row_fields = self.get_row_fields(columns)
+        fnames = {fname for fname, _ in row_fields if fname is not None}
+        for name in self.get_field_types():
+            field = self.dataclass_fields.get(name)
+            if (
+                name not in fnames
+                and (field is None or field.init)
+                and self.get_field_default(name) is MISSING
+            ):
+                raise ValueError(
+                    f"Required field '{name}' of {type_name(self.cls)} "
+                    "is missing in columns"
+                )
+        params = ", ".join(
+            filter(None, ("row", self.get_unpack_method_default_flag_values()))
+        )
+        with self.indent(f"def decode({params}):"):
+            targets = [
+                "_" if fname is None else f"__{fname}"
+                for fname, _ in row_fields
+            ]
+            self.add_line(f"{', '.join(targets)}, = row")
+            for fname, ftype in row_fields:
+                if fname is not None:
+                    self._add_row_unpack_lines(fname, ftype)
+            kwargs = ", ".join(
+                f"{fname}=__{fname}"
+                for fname, _ in row_fields
+                if fname is not None
+            )
+            obj = f"cls({kwargs})"
+            post_deserialize = self.get_declared_hook("__post_deserialize__")
+            if post_deserialize:
+                if not isinstance(post_deserialize, classmethod):
+                    raise BadHookSignature(
+                        "`__post_deserialize__` must be a class method with "
+                        f"Callable[[{type_name(self.cls)}], "
+                        f"{type_name(self.cls)}] signature"
+                    )
+                obj = f"cls.__post_deserialize__({obj})"
+            self.add_line(f"return {obj}")
+        self.add_line("setattr(decoder_obj, 'decode', decode)")
+        self.ensure_object_imported(decoder_obj, "decoder_obj")
+        self.ensure_object_imported(self.cls, "cls")
+        self.compile()
+
+    def _add_row_unpack_lines(self, fname: str, ftype: Any) -> None:
+        self.add_type_modules(ftype)
+        metadata = self.metadatas.get(fname, {})
+        get_option = self.get_dialect_or_config_option
+        could_be_none = (
+            ftype in (Any, type(None), None)
+            or is_type_var_any(self.get_real_type(fname, ftype))
+            or is_optional(ftype, self.get_field_resolved_type_params(fname))
+            or self.get_field_default(fname) is None
+        )
+        unpacked_value = UnpackerRegistry.get(
+            ValueSpec(
+                type=ftype,
+                expression="value",
+                builder=self,
+                field_ctx=FieldContext(name=fname, metadata=metadata),
+                could_be_none=not could_be_none,
+                no_copy_unpack_collections=get_option(
+                    "no_copy_unpack_collections", ()
+                ),
+                trust_no_copy_unpack_collections=get_option(
+                    "trust_no_copy_unpack_collections", False
+                ),
+            )
+        )
+        if unpacked_value == "value":
+            return
+        field_type = self.get_type_ref(
+            ftype,
+            resolved_type_params=self.get_field_resolved_type_params(fname),
+        )
+        self.add_line(f"value = __{fname}")
+        not_none_block: ContextManager[None]
+        if could_be_none:
+            not_none_block = self.indent("if value is not None:")
+        else:
+            not_none_block = nullcontext()
+        with not_none_block:
+            with self.indent("try:"):
+                self.add_line(f"__{fname} = {unpacked_value}")
+            self.add_decode_limits_reraise()
+            with self.indent("except:"):
+                self.add_line(
+                    f"raise InvalidFieldValue('{fname}',{field_type},value,cls)"
+                )
+
+    def add_row_encode_method(
+        self, columns: Sequence[str | None], encoder_obj: Any
+    ) -> None:
+        self.reset()
+        self.compile_report_name = f"{type_name(self.cls)} row encoder"
+        row_fields = self.get_row_fields(columns)
+        config = self.get_config()
+        params = ", ".join(
+            filter(None, ("self", self.get_pack_method_default_flag_values()))
+        )
+        with self.indent(f"def encode({params}):"):
+            pre_serialize = self.get_declared_hook("__pre_serialize__")
+            if pre_serialize:
+                if self.is_code_generation_option_enabled(
+                    ADD_SERIALIZATION_CONTEXT
+                ):
+                    self.add_line(
+                        "self = self.__pre_serialize__(context=context)"
+                    )
+                else:
+                    self.add_line("self = self.__pre_serialize__()")
+            values = []
+            for fname, ftype in row_fields:
+                if fname is None:
+                    raise ValueError("Row encoder columns can't be None")
+                self.add_type_modules(ftype)
+                packer, _, could_be_none = self._get_field_packer(
+                    fname, ftype, config
+                )
+                if could_be_none and packer != "value":
+                    self.add_line(f"value = self.{fname}")
+                    self.add_line(
+                        f"__{fname} = None if value is None else {packer}"
+                    )
+                    values.append(f"__{fname}")
+                elif could_be_none:
+                    values.append(f"self.{fname}")
+                else:
+                    values.append(packer)
+            self.add_line(f"return ({', '.join(values)},)")
+        self.add_line("setattr(encoder_obj, 'encode', encode)")
+        self.ensure_object_imported(encoder_obj, "encoder_obj")
+        self.ensure_object_imported(self.cls, "cls")
+        self.compile()
+
+
+class TranscoderCodeBuilder(CodecCodeBuilder):
+    shape_type: Type
+    from_dialect: Type[Dialect] | None
+    from_builder: CodecCodeBuilder
+    transcoders: dict[str, "TranscoderCodeBuilder"]
+
+    @classmethod
+    def new_transcoder(
+        cls,
+        shape_type: Type,
+        from_dialect: Type[Dialect] | None,
+        to_dialect: Type[Dialect] | None,
+        transcoders: dict[str, "TranscoderCodeBuilder"],
+    ) -> Self:
+        builder = cls.new_for_dataclass(shape_type, default_dialect=to_dialect)
+        # values are unpacked with the source dialect in a separate namespace
+        builder.from_builder = CodecCodeBuilder.new_for_dataclass(
+            shape_type, default_dialect=from_dialect
+        )
+        builder.shape_type = shape_type
+        builder.from_dialect = from_dialect
+        builder.transcoders = transcoders
+        builder.compile_report_name = f"{type_name(shape_type)} transcoder"
+        return builder
+
+    @staticmethod
+    def get_function_name(shape_type: Type) -> str:
+        return f"transcode_{clean_id(type_name(shape_type))}"
+
+    @classmethod
+    def build(
+        cls,
+        shape_type: Type,
+        from_dialect: Type[Dialect] | None,
+        to_dialect: Type[Dialect] | None,
+    ) -> Callable[[Any], Any]:
+        transcoders: dict[str, TranscoderCodeBuilder] = {}
+        cls.new_transcoder(
+            shape_type, from_dialect, to_dialect, transcoders
+        ).add_transcode_method()
+        functions = {
+            name: builder.globals[name]
+            for name, builder in transcoders.items()
+        }
+        # nested transcoders can refer to each other recursively
+        for builder in transcoders.values():
+            builder.globals.update(functions)
+        return functions[cls.get_function_name(shape_type)]
+
+    def add_transcode_method(self) -> None:
+        name = self.get_function_name(self.shape_type)
+        self.transcoders[name] = self
+        self.reset()
+        self.from_builder.reset()
+        with self.indent(f"def {name}(d):"):
+            pre_deserialize = self.get_declared_hook("__pre_deserialize__")
+            if pre_deserialize:
+                if not isinstance(pre_deserialize, classmethod):
+                    raise BadHookSignature(
+                        "`__pre_deserialize__` must be a class method with "
+                        "Callable[[Dict[Any, Any]], Dict[Any, Any]] signature"
+                    )
+                self.add_line("d = cls.__pre_deserialize__(d)")
+            self.add_line("out = {}")
+            filtered_fields = []
+            for fname, ftype in self.get_field_types(
+                include_extras=True
+            ).items():
+                field = self.dataclass_fields.get(fname)
+                if field and not field.init:
+                    continue
+                keys = self.get_field_keys(fname, ftype)
+                alias = keys[0] if keys[0] != fname else None
+                filtered_fields.append((fname, alias, ftype))
+            with self.indent("try:"):
+                if self.get_config().forbid_extra_keys:
+                    self._add_extra_keys_check(filtered_fields)
+                for fname, alias, ftype in filtered_fields:
+                    self.add_type_modules(ftype)
+                    self._add_field_lines(fname, alias, ftype)
+            with self.indent("except AttributeError:"):
+                with self.indent("if not isinstance(d, dict):"):
+                    self.add_line(
+                        "raise ValueError('Argument for "
+                        f"{type_name(self.shape_type)} transcoder "
+                        "should be a dict instance') from None"
+                    )
+                with self.indent("else:"):
+                    self.add_line("raise")
+            self.add_line("return out")
+        if self.from_builder.lines.as_text():
+            self.from_builder.compile()
+        for unpacker in self.from_builder.__dict__:
+            if unpacker.startswith("unpack_"):
+                self.ensure_object_imported(
+                    self.from_builder.__dict__[unpacker], unpacker
+                )
+        self.ensure_object_imported(self.cls, "cls")
+        self.compile()
+        self.globals[name] = self.__dict__[name]
+
+    def _add_field_lines(
+        self, fname: str, alias: str | None, ftype: Type
+    ) -> None:
+        metadata = self.metadatas.get(fname, {})
+        default = self.get_field_default(fname)
+        field_type = self.get_type_ref(
+            ftype,
+            resolved_type_params=self.get_field_resolved_type_params(fname),
+        )
+        could_be_none = (
+            ftype in (Any, type(None), None)
+            or is_type_var_any(self.get_real_type(fname, ftype))
+            or is_optional(ftype, self.get_field_resolved_type_params(fname))
+            or default is None
+        )
+        if metadata.get("serialize") == "omit":
+            out_key = None
+        elif alias and self.get_dialect_or_config_option(
+            "serialize_by_alias", False
+        ):
+            out_key = alias
+        else:
+            out_key = fname
+        omit_none = self.get_dialect_or_config_option("omit_none", False)
+        keys = self.get_field_keys(fname, ftype)
+        self.add_line(f"value = d.get('{keys[0]}', MISSING)")
+        for key in keys[1:]:
+            with self.indent("if value is MISSING:"):
+                self.add_line(f"value = d.get('{key}', MISSING)")
+        with self.indent("if value is MISSING:"):
+            field = self.dataclass_fields.get(fname)
+            if field and field.default_factory is not MISSING:
+                factory_name = f"__{fname}_default_factory"
+                self.ensure_object_imported(
+                    field.default_factory, factory_name
+                )
+                self.add_line(f"value = {factory_name}()")
+            elif default is not MISSING:
+                default_name = f"__{fname}_default"
+                self.ensure_object_imported(default, default_name)
+                self.add_line(f"value = {default_name}")
+            else:
+                self.add_line(
+                    f"raise MissingField('{fname}',{field_type},cls) from None"
+                )
+            if out_key is not None and default is not MISSING:
+                self._add_set_value_lines(
+                    out_key,
+                    self._get_packed_value(self, fname, ftype, "value"),
+                    could_be_none,
+                    omit_none,
+                )
+        if out_key is None:
+            return
+        value_expr = self._get_transcoded_value(fname, ftype, could_be_none)
+        with self.indent("else:"):
+            if value_expr == "value":
+                if omit_none and could_be_none:
+                    with self.indent("if value is not None:"):
+                        self.add_line(f"out['{out_key}'] = value")
+                else:
+                    self.add_line(f"out['{out_key}'] = value")
+                return
+            not_none_block: ContextManager[None]
+            if could_be_none:
+                with self.indent("if value is None:"):
+                    if omit_none:
+                        self.add_line("pass")
+                    else:
+                        self.add_line(f"out['{out_key}'] = None")
+                not_none_block = self.indent("else:")
+            else:
+                not_none_block = nullcontext()
+            with not_none_block:
+                with self.indent("try:"):
+                    self.add_line(f"out['{out_key}'] = {value_expr}")
+                self.add_decode_limits_reraise()
+                with self.indent("except:"):
+                    self.add_line(
+                        "raise InvalidFieldValue("
+                        f"'{fname}',{field_type},value,cls)"
+                    )
+
+    def _add_set_value_lines(
+        self, key: str, packed_value: str, could_be_none: bool, omit_none: bool
+    ) -> None:
+        if could_be_none and packed_value != "value":
+            with self.indent("if value is not None:"):
+                self.add_line(f"out['{key}'] = {packed_value}")
+            if not omit_none:
+                with self.indent("else:"):
+                    self.add_line(f"out['{key}'] = None")
+        elif could_be_none and omit_none:
+            with self.indent("if value is not None:"):
+                self.add_line(f"out['{key}'] = value")
+        else:
+            self.add_line(f"out['{key}'] = {packed_value}")
+
+    def _get_packed_value(
+        self, builder: CodeBuilder, fname: str, ftype: Type, expr: str
+    ) -> str:
+        return PackerRegistry.get(
+            ValueSpec(
+                type=ftype,
+                expression=expr,
+                builder=builder,
+                field_ctx=FieldContext(
+                    name=fname, metadata=self.metadatas.get(fname, {})
+                ),
+                could_be_none=False,
+                no_copy_collections=builder.get_dialect_or_config_option(
+                    "no_copy_collections", ()
+                ),
+            )
+        )
+
+    def _get_unpacked_value(
+        self,
+        builder: CodeBuilder,
+        fname: str,
+        ftype: Type,
+        could_be_none: bool,
+    ) -> str:
+        get_option = builder.get_dialect_or_config_option
+        return UnpackerRegistry.get(
+            ValueSpec(
+                type=ftype,
+                expression="value",
+                builder=builder,
+                field_ctx=FieldContext(
+                    name=fname, metadata=self.metadatas.get(fname, {})
+                ),
+                could_be_none=not could_be_none,
+                no_copy_unpack_collections=get_option(
+                    "no_copy_unpack_collections", ()
+                ),
+                trust_no_copy_unpack_collections=get_option(
+                    "trust_no_copy_unpack_collections", False
+                ),
+            )
+        )
+
+    def _get_transcoded_value(
+        self, fname: str, ftype: Type, could_be_none: bool
+    ) -> str:
+        metadata = self.metadatas.get(fname, {})
+        real_type = self.get_real_type(fname, ftype)
+        nested_type = (
+            not_none_type_arg(get_args(real_type))
+            if is_optional(real_type)
+            else real_type
+        )
+        if not any(
+            metadata.get(option) is not None
+            for option in (
+                "serialize",
+                "deserialize",
+                "serialization_strategy",
+            )
+        ):
+            nested = self._get_nested_value(nested_type, "value")
+            if nested is not None:
+                return nested
+        unpacked_value = self._get_unpacked_value(
+            self.from_builder, fname, ftype, could_be_none
+        )
+        packed_value = self._get_packed_value(self, fname, ftype, "value")
+        if unpacked_value == self._get_unpacked_value(
+            self, fname, ftype, could_be_none
+        ) and packed_value == self._get_packed_value(
+            self.from_builder, fname, ftype, "value"
+        ):
+            # both dialects represent the value in the same way
+            return "value"
+        if unpacked_value != "value":
+            with self.from_builder.indent(f"def unpack_{fname}(value):"):
+                self.from_builder.add_line(f"return {unpacked_value}")
+            unpacked_value = f"unpack_{fname}(value)"
+        return self._get_packed_value(self, fname, ftype, unpacked_value)
+
+    def _get_nested_value(self, typ: Type | None, expr: str) -> str | None:
+        if typ is None or is_annotated(typ):
+            return None
+        if is_self(typ):
+            typ = self.shape_type
+        origin_type = get_type_origin(typ)
+        args = get_args(typ)
+        if is_optional(typ):
+            value = self._get_nested_value(not_none_type_arg(args), expr)
+            if value is not None:
+                return f"(None if {expr} is None else {value})"
+        elif is_dataclass(origin_type):
+            if not self._is_transcodable_dataclass(typ):
+                return None
+            name = self.get_function_name(typ)
+            if name not in self.transcoders:
+                self.new_transcoder(
+                    typ,
+                    self.from_dialect,
+                    self.default_dialect,
+                    self.transcoders,
+                ).add_transcode_method()
+            return f"{name}({expr})"
+        elif (
+            origin_type
+            in (
+                list,
+                collections.abc.Sequence,
+                collections.abc.MutableSequence,
+            )
+            or origin_type is tuple
+            and len(args) == 2
+            and args[1] is Ellipsis
+        ) and args:
+            value = self._get_nested_value(args[0], "v")
+            if value is not None:
+                return f"[{value} for v in {expr}]"
+        elif (
+            origin_type
+            in (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+            and len(args) == 2
+            and args[0] is str
+        ):
+            value = self._get_nested_value(args[1], "v")
+            if value is not None:
+                return f"{{k: {value} for k, v in {expr}.items()}}"
+        return None
+
+    def _is_transcodable_dataclass(self, typ: Type) -> bool:
+        origin_type = get_type_origin(typ)
+        if issubclass(
+            origin_type, (SerializableType, GenericSerializableType)
+        ):
+            return False
+        if self.get_config(origin_type).discriminator is not None:
+            return False
+        for builder in (self, self.from_builder):
+            for t in (typ, origin_type):
+                for strategy in builder.iter_serialization_strategies({}, t):
+                    if strategy is not None:
+                        return False
+        return True
@@ -0,0 +1,88 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Generic, Type, TypeVar, final, overload
+
+from mashumaro.codecs._builder import CodecCodeBuilder
+from mashumaro.dialect import Dialect
+
+T = TypeVar("T")
+
+
+class RowDecoder(Generic[T]):
+    @overload
+    def __init__(
+        self,
+        shape_type: Type[T],
+        *,
+        columns: Sequence[str | None],
+        default_dialect: Type[Dialect] | None = None,
+    ): ...
+
+    @overload
+    def __init__(
+        self,
+        shape_type: Any,
+        *,
+        columns: Sequence[str | None],
+        default_dialect: Type[Dialect] | None = None,
+    ): ...
+
+    def __init__(
+        self,
+        shape_type: Type[T] | Any,
+        *,
+        columns: Sequence[str | None],
+        default_dialect: Type[Dialect] | None = None,
+    ):
+        code_builder = CodecCodeBuilder.new_for_dataclass(
+            shape_type, default_dialect=default_dialect
+        )
+        code_builder.add_row_decode_method(columns, self)
+
+    @final
+    def decode(self, row: Sequence[Any]) -> T: ...
+
+    @final
+    def decode_many(self, rows: Iterable[Sequence[Any]]) -> Iterator[T]:
+        return map(self.decode, rows)
+
+
+class RowEncoder(Generic[T]):
+    @overload
+    def __init__(
+        self,
+        shape_type: Type[T],
+        *,
+        columns: Sequence[str],
+        default_dialect: Type[Dialect] | None = None,
+    ): ...
+
+    @overload
+    def __init__(
+        self,
+        shape_type: Any,
+        *,
+        columns: Sequence[str],
+        default_dialect: Type[Dialect] | None = None,
+    ): ...
+
+    def __init__(
+        self,
+        shape_type: Type[T] | Any,
+        *,
+        columns: Sequence[str],
+        default_dialect: Type[Dialect] | None = None,
+    ):
+        code_builder = CodecCodeBuilder.new_for_dataclass(
+            shape_type, default_dialect=default_dialect
+        )
+        code_builder.add_row_encode_method(columns, self)
+
+    @final
+    def encode(self, obj: T) -> tuple[Any, ...]: ...
+
+    @final
+    def encode_many(self, objs: Iterable[T]) -> Iterator[tuple[Any, ...]]:
+        return map(self.encode, objs)
+
+
+__all__ = ["RowDecoder", "RowEncoder"]
@@ -0,0 +1,26 @@
+from typing import Any, Generic, Type, TypeVar, final
+
+from mashumaro.codecs._builder import TranscoderCodeBuilder
+from mashumaro.dialect import Dialect
+
+T = TypeVar("T")
+
+
+class Transcoder(Generic[T]):
+    def __init__(
+        self,
+        shape_type: Type[T],
+        *,
+        from_dialect: Type[Dialect] | None = None,
+        to_dialect: Type[Dialect] | None = None,
+    ):
+        transcode = TranscoderCodeBuilder.build(
+            shape_type, from_dialect, to_dialect
+        )
+        setattr(self, "transcode", transcode)
+
+    @final
+    def transcode(self, data: dict[Any, Any]) -> dict[str, Any]: ...
+
+
+__all__ = ["Transcoder"]
@@ -3,7 +3,7 @@ from typing import Any, Literal, Type, TypedDict
 
 from mashumaro.core.const import Sentinel
 from mashumaro.dialect import Dialect
-from mashumaro.types import Discriminator, SerializationStrategy
+from mashumaro.types import DecodeLimits, Discriminator, SerializationStrategy
 
 __all__ = [
     "BaseConfig",
@@ -11,6 +11,7 @@ __all__ = [
     "TO_DICT_ADD_OMIT_NONE_FLAG",
     "ADD_DIALECT_SUPPORT",
     "ADD_SERIALIZATION_CONTEXT",
+    "ADD_INSTRUMENTATION",
     "SerializationStrategyValueType",
 ]
 
@@ -19,6 +20,7 @@ TO_DICT_ADD_BY_ALIAS_FLAG = "TO_DICT_ADD_BY_ALIAS_FLAG"
 TO_DICT_ADD_OMIT_NONE_FLAG = "TO_DICT_ADD_OMIT_NONE_FLAG"
 ADD_DIALECT_SUPPORT = "ADD_DIALECT_SUPPORT"
 ADD_SERIALIZATION_CONTEXT = "ADD_SERIALIZATION_CONTEXT"
+ADD_INSTRUMENTATION = "ADD_INSTRUMENTATION"
 
 
 CodeGenerationOption = Literal[
@@ -26,6 +28,7 @@ CodeGenerationOption = Literal[
     "TO_DICT_ADD_OMIT_NONE_FLAG",
     "ADD_DIALECT_SUPPORT",
     "ADD_SERIALIZATION_CONTEXT",
+    "ADD_INSTRUMENTATION",
 ]
 
 
@@ -57,3 +60,9 @@ class BaseConfig:
     sort_keys: bool = False
     allow_deserialization_not_by_alias: bool = False
     forbid_extra_keys: bool = False
+    cache_serialization: bool | int = False
+    track_changes: bool = False
+    adaptive_union_ordering: bool | int = False
+    decode_limits: DecodeLimits | None | Literal[Sentinel.MISSING] = (
+        Sentinel.MISSING
+    )
@@ -1,12 +1,38 @@
+import array
 import datetime
 import re
+import threading
+import weakref
+from collections.abc import Callable
+from dataclasses import is_dataclass
+from typing import Any
 
-__all__ = ["parse_timezone", "ConfigValue", "UTC_OFFSET_PATTERN"]
+from mashumaro.core.const import Sentinel
+from mashumaro.exceptions import DecodeLimitExceeded
+from mashumaro.types import DecodeLimits
+
+__all__ = [
+    "parse_timezone",
+    "EPOCH",
+    "UTC_EPOCH",
+    "EPOCH_ORDINAL",
+    "byteswapped_array",
+    "SerializationCache",
+    "ConfigValue",
+    "AnyTypePacker",
+    "SubtypePacker",
+    "DecodeLimiter",
+    "UTC_OFFSET_PATTERN",
+]
 
 
 UTC_OFFSET_PATTERN = r"^UTC(([+-][0-2][0-9]):([0-5][0-9]))?$"
 UTC_OFFSET_RE = re.compile(UTC_OFFSET_PATTERN)
 
+EPOCH = datetime.datetime(1970, 1, 1)
+UTC_EPOCH = EPOCH.replace(tzinfo=datetime.timezone.utc)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
 
 def parse_timezone(s: str) -> datetime.timezone:
     match = UTC_OFFSET_RE.match(s)
@@ -26,6 +52,186 @@ def parse_timezone(s: str) -> datetime.timezone:
         return datetime.timezone.utc
 
 
+def byteswapped_array(value: array.array) -> array.array:
+    result = array.array(value.typecode, value)
+    result.byteswap()
+    return result
+
+
+class SerializationCache:
+    """Bounded memo of serialization results keyed by object identity."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries: dict[int, tuple[weakref.ref, dict[Any, Any]]] = {}
+        self.checked_types: set[type] = set()
+
+    def get(self, obj: Any, key: Any) -> Any:
+        entry = self.entries.get(id(obj))
+        if entry is None:
+            return Sentinel.MISSING
+        return entry[1].get(key, Sentinel.MISSING)
+
+    def set(self, obj: Any, key: Any, value: Any) -> None:
+        obj_id = id(obj)
+        entry = self.entries.get(obj_id)
+        if entry is None:
+            if type(obj) not in self.checked_types:
+                self._check_type(type(obj))
+            if len(self.entries) >= self.maxsize:
+                self.entries.pop(next(iter(self.entries)), None)
+            entry = (
+                weakref.ref(obj, lambda ref: self._discard(obj_id, ref)),
+                {},
+            )
+            self.entries[obj_id] = entry
+        entry[1][key] = value
+
+    def _check_type(self, typ: type) -> None:
+        # dataclass parameters aren't available yet at compile time
+        params = getattr(typ, "__dataclass_params__", None)
+        if params is None or not params.frozen:
+            raise TypeError(
+                "Config option 'cache_serialization' can only be used "
+                f"with frozen dataclasses, {typ.__qualname__} is not frozen"
+            )
+        if not typ.__weakrefoffset__:
+            # the class can be replaced by a slotted one after compilation
+            raise TypeError(
+                "Config option 'cache_serialization' requires "
+                f"{typ.__qualname__} instances to support weak references"
+            )
+        self.checked_types.add(typ)
+
+    def _discard(self, obj_id: int, ref: weakref.ref) -> None:
+        entry = self.entries.get(obj_id)
+        if entry is not None and entry[0] is ref:
+            del self.entries[obj_id]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class AnyTypePacker:
+    """Packs values of Any fields with packers compiled for their classes."""
+
+    def __init__(self, dialect: Any):
+        self.dialect = dialect
+        self.packers: dict[type, Callable[[Any], Any]] = {
+            typ: _identity
+            for typ in (str, int, float, bool, type(None))
+            if typ not in dialect.serialization_strategy
+        }
+        # object fields are packed by this packer itself
+        self.packers[object] = _identity
+
+    def pack(self, value: Any) -> Any:
+        packer = self.packers.get(value.__class__)
+        if packer is None:
+            packer = self._compile(value.__class__)
+        return packer(value)
+
+    def _compile(self, typ: type) -> Callable[[Any], Any]:
+        # imported here to avoid a circular import
+        from mashumaro.codecs.basic import BasicEncoder
+        from mashumaro.exceptions import UnserializableDataError
+
+        packer: Callable[[Any], Any]
+        try:
+            packer = BasicEncoder(typ, default_dialect=self.dialect).encode
+        except UnserializableDataError:
+            packer = _identity
+        self.packers[typ] = packer
+        return packer
+
+
+class SubtypePacker:
+    """Packs instances of a dataclass hierarchy with packers of their classes."""
+
+    def __init__(
+        self,
+        base: type,
+        base_packer: Callable[..., Any],
+        compile_packer: Callable[[type], Callable[..., Any]],
+    ):
+        self.base = base
+        self.compile_packer = compile_packer
+        self.packers: dict[type, Callable[..., Any]] = {base: base_packer}
+
+    def pack(self, value: Any, **flags: Any) -> Any:
+        packer = self.packers.get(value.__class__)
+        if packer is None:
+            packer = self._compile(value.__class__)
+        return packer(value, **flags)
+
+    def _compile(self, typ: type) -> Callable[..., Any]:
+        if issubclass(typ, self.base) and is_dataclass(typ):
+            packer = self.compile_packer(typ)
+        else:
+            packer = self.packers[self.base]
+        self.packers[typ] = packer
+        return packer
+
+
+class _DecodeState(threading.local):
+    depth = 0
+    items = 0
+
+
+_decode_state = _DecodeState()
+
+
+class DecodeLimiter:
+    """Checks the input data against DecodeLimits during decoding."""
+
+    def __init__(self, limits: DecodeLimits):
+        self.limits = limits
+
+    def collection(self, value: Any) -> Any:
+        if isinstance(value, str):
+            # strings would be iterated by characters
+            return self.string(value)
+        size = len(value)
+        limit = self.limits.max_collection_length
+        if limit is not None and size > limit:
+            raise DecodeLimitExceeded("max_collection_length", limit, size)
+        limit = self.limits.max_total_items
+        if limit is not None:
+            total = _decode_state.items + size
+            if total > limit:
+                raise DecodeLimitExceeded("max_total_items", limit, total)
+            _decode_state.items = total
+        return value
+
+    def string(self, value: Any) -> Any:
+        size = len(value)
+        limit = self.limits.max_string_length
+        if limit is not None and size > limit:
+            raise DecodeLimitExceeded("max_string_length", limit, size)
+        return value
+
+    def start(self) -> None:
+        # the total number of items is counted from the outermost call
+        if _decode_state.depth == 0:
+            _decode_state.items = 0
+
+    def enter(self) -> None:
+        depth = _decode_state.depth
+        if depth == 0:
+            _decode_state.items = 0
+        limit = self.limits.max_depth
+        if limit is not None and depth >= limit:
+            raise DecodeLimitExceeded("max_depth", limit, depth + 1)
+        _decode_state.depth = depth + 1
+
+    def exit(self) -> None:
+        _decode_state.depth -= 1
+
+
 class ConfigValue:
     def __init__(self, name: str):
         self.name = name
@@ -1,12 +1,27 @@
+import collections.abc
+import copy
+import datetime
+import decimal
 import enum
+import fractions
 import importlib
 import inspect
+import ipaddress
+import itertools
+import keyword
+import linecache
 import math
+import os
+import pathlib
+import re
 import sys
+import time
 import types
 import typing
 import uuid
-from contextlib import contextmanager
+import weakref
+import zoneinfo
+from contextlib import contextmanager, nullcontext
 
 # noinspection PyProtectedMember
 from dataclasses import _FIELDS  # type: ignore
@@ -17,6 +32,7 @@ import typing_extensions
 
 from mashumaro.config import (
     ADD_DIALECT_SUPPORT,
+    ADD_INSTRUMENTATION,
     ADD_SERIALIZATION_CONTEXT,
     TO_DICT_ADD_BY_ALIAS_FLAG,
     TO_DICT_ADD_OMIT_NONE_FLAG,
@@ -24,7 +40,11 @@ from mashumaro.config import (
     SerializationStrategyValueType,
 )
 from mashumaro.core.const import Sentinel
-from mashumaro.core.helpers import ConfigValue
+from mashumaro.core.helpers import (
+    ConfigValue,
+    DecodeLimiter,
+    SerializationCache,
+)
 from mashumaro.core.meta.code.lines import CodeLines
 from mashumaro.core.meta.helpers import (
     get_args,
@@ -33,6 +53,7 @@ from mashumaro.core.meta.helpers import (
     get_literal_values,
     get_name_error_name,
     get_type_annotations,
+    get_type_origin,
     hash_type_args,
     is_annotated,
     is_class_var,
@@ -44,8 +65,12 @@ from mashumaro.core.meta.helpers import (
     is_literal,
     is_local_type_name,
     is_named_tuple,
+    is_new_type,
     is_optional,
+    is_self,
     is_type_var_any,
+    is_union,
+    not_none_type_arg,
     resolve_type_params,
     substitute_type_params,
     type_name,
@@ -65,6 +90,7 @@ from mashumaro.dialect import Dialect
 from mashumaro.exceptions import (  # noqa
     BadDialect,
     BadHookSignature,
+    DecodeLimitExceeded,
     ExtraKeysError,
     InvalidFieldValue,
     MissingDiscriminatorError,
@@ -77,6 +103,7 @@ from mashumaro.exceptions import (  # noqa
     UnsupportedDeserializationEngine,
     UnsupportedSerializationEngine,
 )
+from mashumaro.instrumentation import get_call_stats, record_compilation
 from mashumaro.types import Alias, Discriminator
 
 if sys.version_info >= (3, 14):
@@ -92,6 +119,91 @@ __POST_DESERIALIZE__ = "__post_deserialize__"
 
 SIMPLE_TYPES = (int, float, bool, str, NoneType)
 
+# values of these types are shared between an instance and its clone
+IMMUTABLE_TYPES = frozenset(
+    (
+        NoneType,
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        decimal.Decimal,
+        fractions.Fraction,
+        uuid.UUID,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        datetime.timezone,
+        zoneinfo.ZoneInfo,
+        ipaddress.IPv4Address,
+        ipaddress.IPv6Address,
+        ipaddress.IPv4Network,
+        ipaddress.IPv6Network,
+        ipaddress.IPv4Interface,
+        ipaddress.IPv6Interface,
+        pathlib.PurePath,
+        pathlib.PurePosixPath,
+        pathlib.PureWindowsPath,
+        pathlib.Path,
+        pathlib.PosixPath,
+        pathlib.WindowsPath,
+        re.Pattern,
+        range,
+    )
+)
+
+DEFAULT_SERIALIZATION_CACHE_SIZE = 1024
+
+REGISTER_GENERATED_SOURCE = not os.environ.get("MASHUMARO_DISABLE_LINECACHE")
+FUNCTION_NAME_RE = re.compile(r"^\s*def (\w+)", re.MULTILINE)
+_generated_source_ids = itertools.count()
+
+
+def _release_generated_source(filename: str, remaining: list[int]) -> None:
+    remaining[0] -= 1
+    if not remaining[0]:
+        linecache.cache.pop(filename, None)
+
+
+def _mark_clean(self: typing.Any) -> None:
+    object.__setattr__(self, "__mashumaro_changes__", set())
+
+
+_mark_clean.__name__ = "mark_clean"
+
+
+def _enable_changes_tracking(cls: typing.Type) -> None:
+    params = getattr(cls, "__dataclass_params__", None)
+    if params is not None and params.frozen:
+        raise ValueError(
+            "Config option 'track_changes' can't be used with "
+            f"frozen dataclass {type_name(cls)}"
+        )
+    inherited_setattr = cls.__setattr__
+    base_setattr: typing.Callable[..., None] = getattr(
+        inherited_setattr, "__mashumaro_base_setattr__", inherited_setattr
+    )
+
+    def __setattr__(self: typing.Any, name: str, value: typing.Any) -> None:
+        base_setattr(self, name, value)
+        changes = self.__mashumaro_changes__
+        if changes is not None:
+            changes.add(name)
+
+    __setattr__.__mashumaro_base_setattr__ = (  # type: ignore[attr-defined]
+        base_setattr
+    )
+    setattr(cls, "__setattr__", __setattr__)
+    setattr(cls, "mark_clean", _mark_clean)
+
+
+# total time spent by finished builders excluding nested ones, used to
+# subtract the compilation of nested dataclasses from the outer builder
+_compile_time = {"exclusive": 0.0}
+
 
 class InternalMethodName(str):
     _PREFIX = "__mashumaro_"
@@ -106,6 +218,10 @@ class InternalMethodName(str):
         return self[len(self._PREFIX) : -len(self._SUFFIX)]
 
 
+UPDATE_PREPARE_METHOD = InternalMethodName.from_public("prepare_update")
+UPDATE_APPLY_METHOD = InternalMethodName.from_public("apply_update")
+
+
 class CodeBuilder:
     def __init__(
         self,
@@ -129,6 +245,9 @@ class CodeBuilder:
             typing.Type, dict[typing.Type, typing.Type]
         ] = {}
         self.field_classes: dict = {}
+        self.started_at = time.perf_counter()
+        self.nested_exclusive_time_mark = _compile_time["exclusive"]
+        self.resolution_time = 0.0
         self.initial_type_args = type_args
         if dialect is not None and not is_dialect_subclass(dialect):
             raise BadDialect(
@@ -153,12 +272,15 @@ class CodeBuilder:
             self.attrs_registry = {}
 
     def reset(self) -> None:
+        self.started_at = time.perf_counter()
+        self.nested_exclusive_time_mark = _compile_time["exclusive"]
         self.lines.reset()
         self.globals = globals().copy()
         self.resolved_type_params = resolve_type_params(
             self.cls, self.initial_type_args
         )
         self.field_classes = {}
+        self.resolution_time = time.perf_counter() - self.started_at
 
     @property
     def namespace(self) -> typing.Mapping[typing.Any, typing.Any]:
@@ -176,6 +298,7 @@ class CodeBuilder:
         self, recursive: bool = True, include_extras: bool = False
     ) -> dict[str, typing.Any]:
         fields = {}
+        started_at = time.perf_counter()
         try:
             field_type_hints = typing_extensions.get_type_hints(
                 self.cls, include_extras=include_extras
@@ -183,6 +306,8 @@ class CodeBuilder:
         except NameError as e:
             name = get_name_error_name(e)
             raise UnresolvedTypeReferenceError(self.cls, name) from None
+        finally:
+            self.resolution_time += time.perf_counter() - started_at
         for fname, ftype in field_type_hints.items():
             if is_class_var(ftype) or is_init_var(ftype) or ftype is KW_ONLY:
                 continue
@@ -230,6 +355,21 @@ class CodeBuilder:
 
         return field_type
 
+    def get_type_ref(
+        self,
+        typ: typing.Any,
+        resolved_type_params: dict[typing.Type, typing.Type] | None = None,
+    ) -> str:
+        # exceptions get a ready type object so that a type expression
+        # isn't evaluated each time a value is rejected
+        if resolved_type_params:
+            typ = substitute_type_params(typ, resolved_type_params)
+        name = f"__type_{clean_id(type_name(typ))}"
+        while self.globals.get(name, typ) is not typ:
+            name += "_"
+        self.globals[name] = typ
+        return name
+
     @property
     @lru_cache()
     def dataclass_fields(self) -> dict[str, Field]:
@@ -321,7 +461,67 @@ class CodeBuilder:
             else:
                 print(f"{type_name(self.cls)}:")
             print(code)
-        exec(code, self.globals, self.__dict__)
+        exec_started_at = time.perf_counter()
+        self.exec_code(code)
+        finished_at = time.perf_counter()
+        exclusive_time = (
+            exec_started_at
+            - self.started_at
+            - (_compile_time["exclusive"] - self.nested_exclusive_time_mark)
+        )
+        exec_time = finished_at - exec_started_at
+        _compile_time["exclusive"] += exclusive_time + exec_time
+        record_compilation(
+            name=self.get_compile_report_name(),
+            resolution_time=self.resolution_time,
+            generation_time=exclusive_time - self.resolution_time,
+            exec_time=exec_time,
+            source=code,
+        )
+
+    def exec_code(
+        self,
+        code: str,
+        globals_: dict[str, typing.Any] | None = None,
+        locals_: dict[str, typing.Any] | None = None,
+    ) -> None:
+        if globals_ is None:
+            globals_ = self.globals
+        if locals_ is None:
+            locals_ = self.__dict__
+        if not REGISTER_GENERATED_SOURCE:
+            exec(code, globals_, locals_)
+            return
+        name = self.get_compile_report_name()
+        match = FUNCTION_NAME_RE.search(code)
+        if match:
+            name = f"{name}.{match.group(1)}"
+        filename = f"<mashumaro {name} #{next(_generated_source_ids)}>"
+        compiled = compile(code, filename, "exec")
+        # the entry lives as long as any of the generated functions does,
+        # so that runtime codecs don't leak their source code
+        function_codes = [
+            c for c in compiled.co_consts if isinstance(c, types.CodeType)
+        ]
+        if function_codes:
+            linecache.cache[filename] = (
+                len(code),
+                None,
+                code.splitlines(keepends=True),
+                filename,
+            )
+            remaining = [len(function_codes)]
+            for function_code in function_codes:
+                weakref.finalize(
+                    function_code,
+                    _release_generated_source,
+                    filename,
+                    remaining,
+                ).atexit = False
+        exec(compiled, globals_, locals_)
+
+    def get_compile_report_name(self) -> str:
+        return type_name(self.cls)
 
     def get_declared_hook(self, method_name: str) -> typing.Any:
         cls = get_class_that_defines_method(method_name, self.cls)
@@ -364,154 +564,234 @@ class CodeBuilder:
                 raise
             self._add_unpack_method_lines_lazy(method_name)
         else:
-            if self.decoder is not None:
-                self.add_line("d = decoder(d)")
             discr = self.get_discriminator()
-            if discr:
-                if not discr.include_subtypes:
-                    raise ValueError(
-                        "Config based discriminator must have "
-                        "'include_subtypes' enabled"
-                    )
-                discr = Discriminator(
-                    # prevent RecursionError
-                    field=discr.field,
-                    include_subtypes=discr.include_subtypes,
-                    variant_tagger_fn=discr.variant_tagger_fn,
-                )
-                self.add_type_modules(self.cls)
-                method = SubtypeUnpackerBuilder(discr).build(
-                    spec=ValueSpec(
-                        type=self.cls,
-                        expression="d",
-                        builder=self,
-                        field_ctx=FieldContext("", {}),
-                    )
-                )
-                self.add_line(f"return {method}")
-                return
-            pre_deserialize = self.get_declared_hook(__PRE_DESERIALIZE__)
-            if pre_deserialize:
-                if not isinstance(pre_deserialize, classmethod):
-                    raise BadHookSignature(
-                        f"`{__PRE_DESERIALIZE__}` must be a class method with "
-                        "Callable[[Dict[Any, Any]], Dict[Any, Any]] signature"
+            with (
+                self._add_instrumentation_lines(f"from_{self.format_name}"),
+                self._add_decode_depth_lines(skip=discr is not None),
+            ):
+                if self.decoder is not None:
+                    self.add_line("d = decoder(d)")
+                if discr:
+                    if not discr.include_subtypes:
+                        raise ValueError(
+                            "Config based discriminator must have "
+                            "'include_subtypes' enabled"
+                        )
+                    discr = Discriminator(
+                        # prevent RecursionError
+                        field=discr.field,
+                        include_subtypes=discr.include_subtypes,
+                        variant_tagger_fn=discr.variant_tagger_fn,
                     )
-                else:
-                    self.add_line(f"d = cls.{__PRE_DESERIALIZE__}(d)")
-            post_deserialize = self.get_declared_hook(__POST_DESERIALIZE__)
-            if post_deserialize:
-                if not isinstance(post_deserialize, classmethod):
-                    raise BadHookSignature(
-                        f"`{__POST_DESERIALIZE__}` must be a class method "
-                        f"with Callable[[{type_name(self.cls)}], "
-                        f"{type_name(self.cls)}] signature"
+                    self.add_type_modules(self.cls)
+                    method = SubtypeUnpackerBuilder(discr).build(
+                        spec=ValueSpec(
+                            type=self.cls,
+                            expression="d",
+                            builder=self,
+                            field_ctx=FieldContext("", {}),
+                        )
                     )
-            filtered_fields = []
-            pos_args = []
-            kw_args = []
-            missing_kw_only = False
-            add_kwargs = False
-            kw_only_fields = set()
-            field_blocks = []
-            for fname, ftype in field_types.items():
-                field = self.dataclass_fields.get(fname)
-                if field and not field.init:
-                    continue
-                if missing_kw_only:
-                    kw_only_fields.add(fname)
-                elif field:
-                    kw_only = getattr(field, "kw_only", MISSING)
-                    if kw_only is MISSING:
-                        missing_kw_only = True
+                    self.add_line(f"return {method}")
+                    return
+                pre_deserialize = self.get_declared_hook(__PRE_DESERIALIZE__)
+                if pre_deserialize:
+                    if not isinstance(pre_deserialize, classmethod):
+                        raise BadHookSignature(
+                            f"`{__PRE_DESERIALIZE__}` must be a class method with "
+                            "Callable[[Dict[Any, Any]], Dict[Any, Any]] signature"
+                        )
+                    else:
+                        self.add_line(f"d = cls.{__PRE_DESERIALIZE__}(d)")
+                post_deserialize = self.get_declared_hook(__POST_DESERIALIZE__)
+                if post_deserialize:
+                    if not isinstance(post_deserialize, classmethod):
+                        raise BadHookSignature(
+                            f"`{__POST_DESERIALIZE__}` must be a class method "
+                            f"with Callable[[{type_name(self.cls)}], "
+                            f"{type_name(self.cls)}] signature"
+                        )
+                filtered_fields = []
+                pos_args = []
+                kw_args = []
+                missing_kw_only = False
+                add_kwargs = False
+                kw_only_fields = set()
+                field_blocks = []
+                for fname, ftype in field_types.items():
+                    field = self.dataclass_fields.get(fname)
+                    if field and not field.init:
+                        continue
+                    if missing_kw_only:
                         kw_only_fields.add(fname)
-                    elif kw_only:
+                    elif field:
+                        kw_only = getattr(field, "kw_only", MISSING)
+                        if kw_only is MISSING:
+                            missing_kw_only = True
+                            kw_only_fields.add(fname)
+                        elif kw_only:
+                            kw_only_fields.add(fname)
+                    else:
+                        missing_kw_only = True
                         kw_only_fields.add(fname)
-                else:
-                    missing_kw_only = True
-                    kw_only_fields.add(fname)
-
-                metadata = self.metadatas.get(fname, {})
-                alias = self.__get_field_alias(fname, ftype, metadata, config)
-
-                filtered_fields.append((fname, alias, ftype))
-            if filtered_fields:
-                if config.forbid_extra_keys:
-                    allowed_keys = {f[1] or f[0] for f in filtered_fields}
 
-                    # If a discriminator with a field is set via config,
-                    # we should allow this field to be present in the input
-                    # This will not work for annotated discriminators though...
-                    discr = self.get_discriminator(look_in_parents=True)
-                    if discr and discr.field:
-                        allowed_keys.add(discr.field)
+                    metadata = self.metadatas.get(fname, {})
+                    alias = self.__get_field_alias(
+                        fname, ftype, metadata, config
+                    )
 
-                    if config.allow_deserialization_not_by_alias:
-                        allowed_keys |= {f[0] for f in filtered_fields}
+                    filtered_fields.append((fname, alias, ftype))
+                if filtered_fields:
+                    if config.forbid_extra_keys:
+                        self._add_extra_keys_check(filtered_fields)
+
+                    with self.indent("try:"):
+                        for fname, alias, ftype in filtered_fields:
+                            self.add_type_modules(ftype)
+                            metadata = self.metadatas.get(fname, {})
+                            field_block = FieldUnpackerCodeBlockBuilder(
+                                self, CodeLines()
+                            ).build(
+                                fname=fname,
+                                ftype=ftype,
+                                metadata=metadata,
+                                alias=alias,
+                            )
+                            if field_block.in_kwargs:
+                                add_kwargs = True
+                            field_blocks.append(field_block)
+                        if add_kwargs:
+                            self.add_line("kwargs = {}")
+                        in_kwargs = False
+                        for field_block in field_blocks:
+                            self.lines.extend(field_block.lines)
+                            if field_block.in_kwargs:
+                                in_kwargs = True
+                            else:
+                                if (
+                                    field_block.fname in kw_only_fields
+                                    or in_kwargs
+                                ):
+                                    kw_args.append(field_block.fname)
+                                else:
+                                    pos_args.append(field_block.fname)
+                    with self.indent("except AttributeError:"):
+                        with self.indent("if not isinstance(d, dict):"):
+                            self.add_line(
+                                "raise ValueError('Argument for "
+                                f"{type_name(self.cls)}.{method_name} method "
+                                "should be a dict instance') from None"
+                            )
+                        with self.indent("else:"):
+                            self.add_line("raise")
 
-                    allowed_keys_str = "'" + "', '".join(allowed_keys) + "'"
+                args = [f"__{f}" for f in pos_args]
+                for kw_arg in kw_args:
+                    args.append(f"{kw_arg}=__{kw_arg}")
+                if add_kwargs:
+                    args.append("**kwargs")
+                cls_inst = f"cls({', '.join(args)})"
 
-                    self.add_line("d_keys = set(d.keys())")
+                if post_deserialize:
                     self.add_line(
-                        f"forbidden_keys = d_keys - {{{allowed_keys_str}}}"
+                        f"return cls.{__POST_DESERIALIZE__}({cls_inst})"
                     )
-                    with self.indent("if forbidden_keys:"):
-                        self.add_line(
-                            "raise ExtraKeysError(forbidden_keys,cls) "
-                            "from None"
-                        )
+                else:
+                    self.add_line(f"return {cls_inst}")
 
-                with self.indent("try:"):
-                    for fname, alias, ftype in filtered_fields:
-                        self.add_type_modules(ftype)
-                        metadata = self.metadatas.get(fname, {})
-                        field_block = FieldUnpackerCodeBlockBuilder(
-                            self, CodeLines()
-                        ).build(
-                            fname=fname,
-                            ftype=ftype,
-                            metadata=metadata,
-                            alias=alias,
-                        )
-                        if field_block.in_kwargs:
-                            add_kwargs = True
-                        field_blocks.append(field_block)
-                    if add_kwargs:
-                        self.add_line("kwargs = {}")
-                    in_kwargs = False
-                    for field_block in field_blocks:
-                        self.lines.extend(field_block.lines)
-                        if field_block.in_kwargs:
-                            in_kwargs = True
-                        else:
-                            if (
-                                field_block.fname in kw_only_fields
-                                or in_kwargs
-                            ):
-                                kw_args.append(field_block.fname)
-                            else:
-                                pos_args.append(field_block.fname)
-                with self.indent("except AttributeError:"):
-                    with self.indent("if not isinstance(d, dict):"):
-                        self.add_line(
-                            "raise ValueError('Argument for "
-                            f"{type_name(self.cls)}.{method_name} method "
-                            "should be a dict instance') from None"
-                        )
-                    with self.indent("else:"):
-                        self.add_line("raise")
+    @contextmanager
+    def _add_instrumentation_lines(
+        self, method: str
+    ) -> typing.Generator[None, None, None]:
+        if not self.is_code_generation_option_enabled(ADD_INSTRUMENTATION):
+            yield
+            return
+        self.ensure_object_imported(time.perf_counter, "perf_counter")
+        self.ensure_object_imported(
+            get_call_stats(self.cls, method), "call_stats"
+        )
+        self.add_line("__mashumaro_start = perf_counter()")
+        with self.indent("try:"):
+            yield
+        with self.indent("except BaseException:"):
+            self.add_line("call_stats.failures += 1")
+            self.add_line("raise")
+        with self.indent("finally:"):
+            self.add_line("call_stats.calls += 1")
+            self.add_line(
+                "call_stats.total_time += perf_counter() - __mashumaro_start"
+            )
 
-            args = [f"__{f}" for f in pos_args]
-            for kw_arg in kw_args:
-                args.append(f"{kw_arg}=__{kw_arg}")
-            if add_kwargs:
-                args.append("**kwargs")
-            cls_inst = f"cls({', '.join(args)})"
+    @contextmanager
+    def _add_decode_depth_lines(
+        self, skip: bool = False
+    ) -> typing.Generator[None, None, None]:
+        limits = self.get_dialect_or_config_option("decode_limits", None)
+        if (
+            skip
+            or limits is None
+            or (limits.max_depth is None and limits.max_total_items is None)
+        ):
+            yield
+            return
+        limiter = self.get_decode_limiter()
+        self.add_line(f"{limiter}.enter()")
+        with self.indent("try:"):
+            yield
+        with self.indent("finally:"):
+            self.add_line(f"{limiter}.exit()")
 
-            if post_deserialize:
-                self.add_line(f"return cls.{__POST_DESERIALIZE__}({cls_inst})")
-            else:
-                self.add_line(f"return {cls_inst}")
+    def get_deserialization_keys(
+        self,
+    ) -> typing.Tuple[list[set[str]], set[str]]:
+        """Returns possible keys of each required field and all allowed keys."""
+        required_keys = []
+        allowed_keys = set()
+        for fname, ftype in self.get_field_types(include_extras=True).items():
+            field = self.dataclass_fields.get(fname)
+            if field and not field.init:
+                continue
+            keys = set(self.get_field_keys(fname, ftype))
+            allowed_keys |= keys
+            if self.get_field_default(fname) is MISSING:
+                required_keys.append(keys)
+        return required_keys, allowed_keys
+
+    def get_field_keys(
+        self, fname: str, ftype: typing.Type
+    ) -> typing.Tuple[str, ...]:
+        """Returns input keys of a field in the order they are looked up."""
+        config = self.get_config()
+        metadata = self.metadatas.get(fname, {})
+        alias = self.__get_field_alias(fname, ftype, metadata, config)
+        if alias is None:
+            return (fname,)
+        elif config.allow_deserialization_not_by_alias:
+            return alias, fname
+        else:
+            return (alias,)
+
+    def _add_extra_keys_check(
+        self, filtered_fields: list[tuple[str, str | None, typing.Any]]
+    ) -> None:
+        allowed_keys = {f[1] or f[0] for f in filtered_fields}
+
+        # If a discriminator with a field is set via config,
+        # we should allow this field to be present in the input
+        # This will not work for annotated discriminators though...
+        discr = self.get_discriminator(look_in_parents=True)
+        if discr and discr.field:
+            allowed_keys.add(discr.field)
+
+        if self.get_config().allow_deserialization_not_by_alias:
+            allowed_keys |= {f[0] for f in filtered_fields}
+
+        allowed_keys_str = "'" + "', '".join(allowed_keys) + "'"
+
+        self.add_line("d_keys = set(d.keys())")
+        self.add_line(f"forbidden_keys = d_keys - {{{allowed_keys_str}}}")
+        with self.indent("if forbidden_keys:"):
+            self.add_line("raise ExtraKeysError(forbidden_keys,cls) from None")
 
     def _add_unpack_method_with_dialect_lines(self, method_name: str) -> None:
         if self.decoder is not None:
@@ -579,6 +859,624 @@ class CodeBuilder:
         else:
             self.add_line(f"def {method_name}(d{kwargs}):")
 
+    def add_update_method(self) -> None:
+        self.reset()
+        method_name = InternalMethodName.from_public("update_from_dict")
+        filtered_fields = self._get_update_fields()
+        self.add_line(f"def {UPDATE_PREPARE_METHOD}(self, d, reset_missing):")
+        with self.indent():
+            self._add_update_prepare_method_lines(method_name, filtered_fields)
+        self.add_line(f"def {UPDATE_APPLY_METHOD}(self, values):")
+        with self.indent():
+            self._add_update_apply_method_lines(filtered_fields)
+        self.add_line(f"def {method_name}(self, d, *, reset_missing=False):")
+        with self.indent():
+            self.add_line(
+                f"self.{UPDATE_APPLY_METHOD}("
+                f"self.{UPDATE_PREPARE_METHOD}(d, reset_missing))"
+            )
+        for name in (UPDATE_PREPARE_METHOD, UPDATE_APPLY_METHOD, method_name):
+            self.add_line(f"setattr(cls, '{name}', {name})")
+        owner = get_class_that_defines_method(method_name.public, self.cls)
+        if (
+            owner is None
+            or is_dataclass_dict_mixin(owner)
+            or owner.__dict__[method_name.public].__name__ == method_name
+        ):
+            # a method defined by the user can call the compiled one
+            self.add_line(
+                f"setattr(cls, '{method_name.public}', {method_name})"
+            )
+        self.compile()
+
+    def _get_update_fields(
+        self,
+    ) -> list[tuple[str, str | None, typing.Type, typing.Type | None]]:
+        config = self.get_config()
+        filtered_fields = []
+        for fname, ftype in self.get_field_types(include_extras=True).items():
+            field = self.dataclass_fields.get(fname)
+            if field and not field.init:
+                continue
+            metadata = self.metadatas.get(fname, {})
+            alias = self.__get_field_alias(fname, ftype, metadata, config)
+            nested_cls = self._get_updatable_in_place_class(ftype, metadata)
+            filtered_fields.append((fname, alias, ftype, nested_cls))
+        return filtered_fields
+
+    def _add_update_prepare_method_lines(
+        self,
+        method_name: str,
+        filtered_fields: list[
+            tuple[str, str | None, typing.Type, typing.Type | None]
+        ],
+    ) -> None:
+        self.add_line("cls = self.__class__")
+        pre_deserialize = self.get_declared_hook(__PRE_DESERIALIZE__)
+        if pre_deserialize:
+            if not isinstance(pre_deserialize, classmethod):
+                raise BadHookSignature(
+                    f"`{__PRE_DESERIALIZE__}` must be a class method with "
+                    "Callable[[Dict[Any, Any]], Dict[Any, Any]] signature"
+                )
+            self.add_line(f"d = cls.{__PRE_DESERIALIZE__}(d)")
+        if not filtered_fields:
+            self.add_line("return ()")
+            return
+        if self.get_config().forbid_extra_keys:
+            self._add_extra_keys_check(
+                [
+                    (fname, alias, ftype)
+                    for fname, alias, ftype, _ in filtered_fields
+                ]
+            )
+        with self.indent("try:"):
+            for fname, alias, ftype, nested_cls in filtered_fields:
+                self.add_type_modules(ftype)
+                self._add_update_field_lines(fname, alias, ftype, nested_cls)
+        with self.indent("except AttributeError:"):
+            with self.indent("if not isinstance(d, dict):"):
+                self.add_line(
+                    "raise ValueError('Argument for "
+                    f"{type_name(self.cls)}.{method_name} method "
+                    "should be a dict instance') from None"
+                )
+            with self.indent("else:"):
+                self.add_line("raise")
+        names = ", ".join(f"__{f[0]}" for f in filtered_fields)
+        self.add_line(f"return ({names},)")
+
+    def _add_update_apply_method_lines(
+        self,
+        filtered_fields: list[
+            tuple[str, str | None, typing.Type, typing.Type | None]
+        ],
+    ) -> None:
+        if not filtered_fields:
+            self.add_line("pass")
+            return
+        names = ", ".join(f"__{f[0]}" for f in filtered_fields)
+        self.add_line(f"{names}, = values")
+        for fname, _, _, nested_cls in filtered_fields:
+            if nested_cls is not None:
+                # nested objects updated in place are prepared as tuples
+                with self.indent(f"if type(__{fname}) is tuple:"):
+                    self.add_line(
+                        f"self.{fname}.{UPDATE_APPLY_METHOD}(__{fname})"
+                    )
+                new_value_block: typing.ContextManager[None] = self.indent(
+                    f"elif __{fname} is not MISSING:"
+                )
+            else:
+                new_value_block = self.indent(f"if __{fname} is not MISSING:")
+            with new_value_block:
+                self.add_line(f"self.{fname} = __{fname}")
+
+    def _add_update_field_lines(
+        self,
+        fname: str,
+        alias: str | None,
+        ftype: typing.Type,
+        nested_cls: typing.Type | None,
+    ) -> None:
+        metadata = self.metadatas.get(fname, {})
+        field = self.dataclass_fields.get(fname)
+        default = self.get_field_default(fname)
+        field_type = self.get_type_ref(
+            ftype,
+            resolved_type_params=self.get_field_resolved_type_params(fname),
+        )
+        could_be_none = (
+            ftype in (typing.Any, type(None), None)
+            or is_type_var_any(self.get_real_type(fname, ftype))
+            or is_optional(ftype, self.get_field_resolved_type_params(fname))
+            or default is None
+        )
+        get_option = self.get_dialect_or_config_option
+        unpacked_value = UnpackerRegistry.get(
+            ValueSpec(
+                type=ftype,
+                expression="value",
+                builder=self,
+                field_ctx=FieldContext(name=fname, metadata=metadata),
+                could_be_none=False if could_be_none else True,
+                no_copy_unpack_collections=get_option(
+                    "no_copy_unpack_collections", ()
+                ),
+                trust_no_copy_unpack_collections=get_option(
+                    "trust_no_copy_unpack_collections", False
+                ),
+            )
+        )
+        self.add_line(f"__{fname} = MISSING")
+        self.add_line(f"value = d.get('{alias or fname}', MISSING)")
+        if alias and self.get_config().allow_deserialization_not_by_alias:
+            with self.indent("if value is MISSING:"):
+                self.add_line(f"value = d.get('{fname}', MISSING)")
+        not_none_block: typing.ContextManager[None]
+        new_value_block: typing.ContextManager[None]
+        with self.indent("if value is not MISSING:"):
+            if could_be_none:
+                with self.indent("if value is None:"):
+                    self.add_line(f"__{fname} = None")
+                not_none_block = self.indent("else:")
+            else:
+                not_none_block = nullcontext()
+            with not_none_block:
+                if nested_cls is not None:
+                    nested_cls_name = self.get_type_name_identifier(nested_cls)
+                    self.add_line(f"current = self.{fname}")
+                    with self.indent(
+                        f"if type(current) is {nested_cls_name}:"
+                    ):
+                        with self.indent("try:"):
+                            self.add_line(
+                                f"__{fname} = current."
+                                f"{UPDATE_PREPARE_METHOD}(value, reset_missing)"
+                            )
+                        self.add_decode_limits_reraise()
+                        with self.indent("except:"):
+                            self.add_line(
+                                "raise InvalidFieldValue("
+                                f"'{fname}',{field_type},value,cls)"
+                            )
+                    new_value_block = self.indent("else:")
+                else:
+                    new_value_block = nullcontext()
+                with new_value_block:
+                    if unpacked_value != "value":
+                        with self.indent("try:"):
+                            self.add_line(f"__{fname} = {unpacked_value}")
+                        self.add_decode_limits_reraise()
+                        with self.indent("except:"):
+                            self.add_line(
+                                "raise InvalidFieldValue("
+                                f"'{fname}',{field_type},value,cls)"
+                            )
+                    else:
+                        self.add_line(f"__{fname} = value")
+        with self.indent("elif reset_missing:"):
+            if field and field.default_factory is not MISSING:
+                factory_name = f"__{fname}_default_factory"
+                self.ensure_object_imported(
+                    field.default_factory, factory_name
+                )
+                self.add_line(f"__{fname} = {factory_name}()")
+            elif default is not MISSING:
+                default_name = f"__{fname}_default"
+                self.ensure_object_imported(default, default_name)
+                self.add_line(f"__{fname} = {default_name}")
+            else:
+                self.add_line(
+                    f"raise MissingField('{fname}',{field_type},cls) from None"
+                )
+
+    def add_object_unpack_method(self) -> None:
+        self.reset()
+        method_name = InternalMethodName.from_public("from_object")
+        # register the method before compiling it for recursive types
+        setattr(self.cls, method_name, None)
+        try:
+            self.add_line("@classmethod")
+            with self.indent(f"def {method_name}(cls, obj):"):
+                self._add_object_unpack_method_lines()
+            self.add_line(f"setattr(cls, '{method_name}', {method_name})")
+            if is_dataclass_dict_mixin_subclass(self.cls):
+                self.add_line(
+                    f"setattr(cls, '{method_name.public}', {method_name})"
+                )
+            self.compile()
+        except BaseException:
+            delattr(self.cls, method_name)
+            raise
+
+    def _add_object_unpack_method_lines(self) -> None:
+        fast_fields = []
+        other_fields = []
+        args = []
+        kw_only = False
+        for fname, ftype in self.get_field_types(include_extras=True).items():
+            field = self.dataclass_fields.get(fname)
+            if field and not field.init:
+                continue
+            self.add_type_modules(ftype)
+            keys = self.get_field_keys(fname, ftype)
+            if (
+                len(keys) == 1
+                and self.get_field_default(fname) is MISSING
+                and keys[0].isidentifier()
+                and not keyword.iskeyword(keys[0])
+            ):
+                fast_fields.append((fname, ftype, keys[0]))
+            else:
+                other_fields.append((fname, ftype, keys))
+            if field is None or getattr(field, "kw_only", True) is not False:
+                kw_only = True
+            args.append(f"{fname}=__{fname}" if kw_only else f"__{fname}")
+        if fast_fields:
+            # loading attributes in a single block is cheaper than getattr
+            with self.indent("try:"):
+                for fname, _, key in fast_fields:
+                    self.add_line(f"__{fname} = obj.{key}")
+            with self.indent("except AttributeError:"):
+                for fname, ftype, key in fast_fields:
+                    with self.indent(f"if not hasattr(obj, '{key}'):"):
+                        self._add_object_missing_field_line(fname, ftype)
+                self.add_line("raise")
+            for fname, ftype, _ in fast_fields:
+                self._add_object_value_lines(fname, ftype, f"__{fname}")
+        for fname, ftype, keys in other_fields:
+            value = f"__{fname}"
+            self.add_line(f"{value} = getattr(obj, '{keys[0]}', MISSING)")
+            for key in keys[1:]:
+                with self.indent(f"if {value} is MISSING:"):
+                    self.add_line(f"{value} = getattr(obj, '{key}', MISSING)")
+            field = self.dataclass_fields.get(fname)
+            default = self.get_field_default(fname)
+            with self.indent(f"if {value} is MISSING:"):
+                if default is MISSING:
+                    self._add_object_missing_field_line(fname, ftype)
+                elif field and field.default_factory is not MISSING:
+                    factory_name = f"__{fname}_default_factory"
+                    self.ensure_object_imported(
+                        field.default_factory, factory_name
+                    )
+                    self.add_line(f"{value} = {factory_name}()")
+                else:
+                    default_literal = self.get_field_default_literal(default)
+                    self.add_line(f"{value} = {default_literal}")
+            value_lines, self.lines = self.lines, CodeLines()
+            try:
+                self._add_object_value_lines(fname, ftype, value)
+            finally:
+                value_lines, self.lines = self.lines, value_lines
+            if value_lines.as_text():
+                with self.indent("else:"):
+                    self.lines.extend(value_lines)
+        cls_inst = f"cls({', '.join(args)})"
+        if self.get_declared_hook(__POST_DESERIALIZE__):
+            self.add_line(f"return cls.{__POST_DESERIALIZE__}({cls_inst})")
+        else:
+            self.add_line(f"return {cls_inst}")
+
+    def _add_object_missing_field_line(
+        self, fname: str, ftype: typing.Type
+    ) -> None:
+        field_type = self.get_type_ref(
+            ftype,
+            resolved_type_params=self.get_field_resolved_type_params(fname),
+        )
+        self.add_line(
+            f"raise MissingField('{fname}',{field_type},cls) from None"
+        )
+
+    def _add_object_value_lines(
+        self, fname: str, ftype: typing.Type, expr: str
+    ) -> None:
+        value_expr = self._get_object_value_expr(
+            ftype, expr, itertools.count()
+        )
+        if value_expr is None:
+            return
+        field_type = self.get_type_ref(
+            ftype,
+            resolved_type_params=self.get_field_resolved_type_params(fname),
+        )
+        with self.indent("try:"):
+            self.add_line(f"{expr} = {value_expr}")
+        with self.indent("except:"):
+            self.add_line(
+                f"raise InvalidFieldValue('{fname}',{field_type},{expr},cls)"
+            )
+
+    def _get_object_value_expr(
+        self, ftype: typing.Any, expr: str, var_ids: typing.Iterator[int]
+    ) -> str | None:
+        # returns None if the attribute value is used as is
+        if is_annotated(ftype):
+            ftype = ftype.__origin__
+        if is_self(ftype):
+            ftype = self.cls
+        args = get_args(ftype)
+        if is_optional(ftype):
+            inner = self._get_object_value_expr(
+                not_none_type_arg(args), expr, var_ids
+            )
+            if inner is None:
+                return None
+            return f"(None if {expr} is None else {inner})"
+        origin = get_type_origin(ftype)
+        if not isinstance(origin, type):
+            return None
+        elif is_dataclass(origin):
+            method_name = InternalMethodName.from_public("from_object")
+            if method_name not in origin.__dict__:
+                CodeBuilder(
+                    origin, allow_postponed_evaluation=False
+                ).add_object_unpack_method()
+            cls_name = clean_id(type_name(origin))
+            self.ensure_object_imported(origin, cls_name)
+            return (
+                f"({expr} if isinstance({expr}, {cls_name}) "
+                f"else {cls_name}.{method_name}({expr}))"
+            )
+        elif origin in (dict, collections.abc.Mapping) and len(args) == 2:
+            var = f"v{next(var_ids)}"
+            inner = self._get_object_value_expr(args[1], var, var_ids)
+            if inner is None:
+                return None
+            return f"{{k: {inner} for k, {var} in {expr}.items()}}"
+        elif origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+            item_type = args[0]
+            template = "tuple([{}])"
+        elif origin in (list, collections.abc.Sequence) and args:
+            item_type = args[0]
+            template = "[{}]"
+        elif origin in (set, collections.abc.Set) and args:
+            item_type = args[0]
+            template = "{{{}}}"
+        elif origin is frozenset and args:
+            item_type = args[0]
+            template = "frozenset([{}])"
+        else:
+            return None
+        var = f"v{next(var_ids)}"
+        inner = self._get_object_value_expr(item_type, var, var_ids)
+        if inner is None:
+            return None
+        return template.format(f"{inner} for {var} in {expr}")
+
+    def add_clone_method(self) -> None:
+        self.reset()
+        method_name = InternalMethodName.from_public("clone")
+        # register the method before compiling it for recursive types
+        setattr(self.cls, method_name, None)
+        try:
+            with self.indent(f"def {method_name}(self):"):
+                self._add_clone_method_lines()
+            self.add_line(f"setattr(cls, '{method_name}', {method_name})")
+            if is_dataclass_dict_mixin_subclass(self.cls):
+                self.add_line(
+                    f"setattr(cls, '{method_name.public}', {method_name})"
+                )
+            self.compile()
+        except BaseException:
+            delattr(self.cls, method_name)
+            raise
+
+    def _add_clone_method_lines(self) -> None:
+        from mashumaro.cloner import clone
+
+        self.ensure_object_imported(self.cls, "cls")
+        self.ensure_object_imported(clone, "clone")
+        with self.indent("if self.__class__ is not cls:"):
+            # a subclass may have fields this method doesn't know about
+            self.add_line("return clone(self)")
+        self.add_line("new = cls.__new__(cls)")
+        has_dict = self.cls.__dictoffset__ != 0
+        if has_dict:
+            # frozen dataclasses don't allow assigning __dict__
+            self.add_line("d = new.__dict__")
+            self.add_line("d.update(self.__dict__)")
+            if self.get_config().track_changes:
+                self.add_line("changes = d.get('__mashumaro_changes__')")
+                with self.indent("if changes is not None:"):
+                    self.add_line(
+                        "d['__mashumaro_changes__'] = changes.copy()"
+                    )
+        for fname, ftype in self.get_field_types(include_extras=True).items():
+            ftype = self.get_real_type(fname, ftype)
+            slot = inspect.getattr_static(self.cls, fname, None)
+            is_slot = isinstance(slot, types.MemberDescriptorType)
+            value_expr = self._get_clone_expr(
+                ftype, "value", itertools.count()
+            )
+            field = self.dataclass_fields.get(fname)
+            # fields that aren't set in __init__ can be missing
+            may_be_unset = (
+                field is not None
+                and not field.init
+                and field.default is MISSING
+                and field.default_factory is MISSING
+            )
+            set_block: typing.ContextManager[None]
+            if is_slot:
+                setter = f"__{fname}_set"
+                self.ensure_object_imported(slot.__set__, setter)
+                if may_be_unset:
+                    set_block = self.indent(f"if hasattr(self, '{fname}'):")
+                else:
+                    set_block = nullcontext()
+                with set_block:
+                    if value_expr is None:
+                        self.add_line(f"{setter}(new, self.{fname})")
+                    else:
+                        self.add_line(f"value = self.{fname}")
+                        self.add_line(f"{setter}(new, {value_expr})")
+            elif value_expr is not None:
+                if may_be_unset:
+                    set_block = self.indent(f"if '{fname}' in d:")
+                else:
+                    set_block = nullcontext()
+                with set_block:
+                    self.add_line(f"value = d['{fname}']")
+                    self.add_line(f"d['{fname}'] = {value_expr}")
+        self.add_line("return new")
+
+    def _get_clone_expr(
+        self, ftype: typing.Any, expr: str, var_ids: typing.Iterator[int]
+    ) -> str | None:
+        # returns None if the value can be shared with the clone
+        if self._is_immutable_type(ftype):
+            return None
+        if is_annotated(ftype):
+            return self._get_clone_expr(ftype.__origin__, expr, var_ids)
+        elif is_new_type(ftype):
+            return self._get_clone_expr(ftype.__supertype__, expr, var_ids)
+        elif is_self(ftype):
+            ftype = self.cls
+        args = get_args(ftype)
+        origin = get_type_origin(ftype)
+        if is_optional(ftype):
+            inner = self._get_clone_expr(
+                not_none_type_arg(args), expr, var_ids
+            )
+            return f"(None if {expr} is None else {inner})"
+        elif not isinstance(origin, type) or is_union(ftype):
+            pass
+        elif is_dataclass(origin):
+            method_name = InternalMethodName.from_public("clone")
+            if method_name not in origin.__dict__:
+                CodeBuilder(
+                    origin, allow_postponed_evaluation=False
+                ).add_clone_method()
+            cls_name = clean_id(type_name(origin))
+            self.ensure_object_imported(origin, cls_name)
+            return f"{cls_name}.{method_name}({expr})"
+        elif origin is list and args:
+            var = f"v{next(var_ids)}"
+            inner = self._get_clone_expr(args[0], var, var_ids)
+            if inner is None:
+                return f"{expr}.copy()"
+            return f"[{inner} for {var} in {expr}]"
+        elif origin is set and args:
+            var = f"v{next(var_ids)}"
+            inner = self._get_clone_expr(args[0], var, var_ids)
+            if inner is None:
+                return f"{expr}.copy()"
+            return f"{{{inner} for {var} in {expr}}}"
+        elif origin is frozenset and args:
+            var = f"v{next(var_ids)}"
+            inner = self._get_clone_expr(args[0], var, var_ids)
+            return f"frozenset([{inner} for {var} in {expr}])"
+        elif origin is dict and len(args) == 2:
+            key_var = f"k{next(var_ids)}"
+            value_var = f"v{next(var_ids)}"
+            key = self._get_clone_expr(args[0], key_var, var_ids)
+            value = self._get_clone_expr(args[1], value_var, var_ids)
+            if key is None and value is None:
+                return f"{expr}.copy()"
+            return (
+                f"{{{key or key_var}: {value or value_var} "
+                f"for {key_var}, {value_var} in {expr}.items()}}"
+            )
+        elif origin is tuple and args and not is_named_tuple(origin):
+            if len(args) == 2 and args[1] is Ellipsis:
+                var = f"v{next(var_ids)}"
+                inner = self._get_clone_expr(args[0], var, var_ids)
+                return f"tuple([{inner} for {var} in {expr}])"
+            items = []
+            for i, arg in enumerate(args):
+                item_expr = f"{expr}[{i}]"
+                items.append(
+                    self._get_clone_expr(arg, item_expr, var_ids) or item_expr
+                )
+            return f"({', '.join(items)},)"
+        elif origin is bytearray:
+            return f"bytearray({expr})"
+        elif (
+            origin
+            in (
+                collections.deque,
+                collections.OrderedDict,
+                collections.defaultdict,
+                collections.Counter,
+            )
+            and args
+            and all(map(self._is_immutable_type, args))
+        ):
+            return f"{expr}.copy()"
+        self.ensure_object_imported(copy.deepcopy, "deepcopy")
+        return f"deepcopy({expr})"
+
+    def _is_immutable_type(
+        self, typ: typing.Any, seen: typing.FrozenSet[type] = frozenset()
+    ) -> bool:
+        if is_annotated(typ):
+            return self._is_immutable_type(typ.__origin__, seen)
+        elif is_new_type(typ):
+            return self._is_immutable_type(typ.__supertype__, seen)
+        elif is_literal(typ):
+            return True
+        elif is_union(typ):
+            return all(
+                self._is_immutable_type(arg, seen) for arg in get_args(typ)
+            )
+        elif isinstance(typ, type):
+            if typ in IMMUTABLE_TYPES or issubclass(typ, enum.Enum):
+                return True
+            elif is_named_tuple(typ):
+                return all(
+                    self._is_immutable_type(arg, seen)
+                    for arg in self._get_type_hints(typ).values()
+                )
+        origin = get_type_origin(typ)
+        args = get_args(typ)
+        if origin is tuple and args:
+            if len(args) == 2 and args[1] is Ellipsis:
+                args = args[:1]
+            return all(self._is_immutable_type(arg, seen) for arg in args)
+        elif origin is frozenset and args:
+            return self._is_immutable_type(args[0], seen)
+        elif (
+            isinstance(origin, type)
+            and is_dataclass(origin)
+            and origin.__dataclass_params__.frozen  # type: ignore
+        ):
+            if origin in seen:
+                return True
+            hints = self._get_type_hints(origin)
+            return all(
+                self._is_immutable_type(hints.get(name), seen | {origin})
+                for name in getattr(origin, _FIELDS)
+            )
+        return False
+
+    @staticmethod
+    def _get_type_hints(typ: type) -> dict[str, typing.Any]:
+        try:
+            return typing.get_type_hints(typ, include_extras=True)
+        except Exception:
+            return {}
+
+    def _get_updatable_in_place_class(
+        self, ftype: typing.Type, metadata: typing.Mapping[str, typing.Any]
+    ) -> typing.Type | None:
+        if is_optional(ftype):
+            ftype = next(arg for arg in get_args(ftype) if arg is not NoneType)
+        if (
+            not isinstance(ftype, type)
+            or not is_dataclass_dict_mixin_subclass(ftype)
+            or "deserialize" in metadata
+            or any(self.iter_serialization_strategies(metadata, ftype))
+            or self.get_config(ftype).discriminator is not None
+        ):
+            return None
+        hook_owner = get_class_that_defines_method(__POST_DESERIALIZE__, ftype)
+        if hook_owner is not None and not is_dataclass_dict_mixin(hook_owner):
+            return None
+        return ftype
+
     @lru_cache()
     @typing.no_type_check
     def get_config(
@@ -613,6 +1511,38 @@ class CodeBuilder:
                 return discriminator
         return None
 
+    def get_discriminator_tag(
+        self, field_types: typing.Mapping[str, typing.Any]
+    ) -> typing.Tuple[str, typing.Any] | None:
+        # the tag of a variant in a hierarchy with a config based
+        # discriminator, if it isn't serialized as a regular field
+        for cls in self.cls.__mro__[1:]:
+            discr = self.get_config(cls, look_in_parents=False).discriminator
+            if discr:
+                break
+        else:
+            return None
+        if (
+            not discr.serialize_tag
+            or not discr.include_subtypes
+            or not discr.field
+            or discr.field in field_types
+        ):
+            return None
+        if discr.variant_tagger_fn is not None:
+            tag = discr.variant_tagger_fn(self.cls)
+            if isinstance(tag, list):
+                if not tag:
+                    return None
+                tag = tag[0]
+        else:
+            tag = self.cls.__dict__.get(discr.field, MISSING)
+            if tag is MISSING:
+                return None
+        if isinstance(tag, enum.Enum):
+            tag = tag.value
+        return discr.field, tag
+
     def get_pack_method_flags(
         self, cls: typing.Type | None = None, pass_encoder: bool = False
     ) -> str:
@@ -813,6 +1743,19 @@ class CodeBuilder:
                 raise
             self._add_pack_method_lines_lazy(method_name)
         else:
+            self._add_pack_method_body(field_types)
+
+    def _add_pack_method_body(
+        self, field_types: dict[str, typing.Any], changes_only: bool = False
+    ) -> None:
+        config = self.get_config()
+        if changes_only:
+            instrumented_method = f"to_{self.format_name}_changes"
+            # the hook may return another object without recorded changes
+            self.add_line("changes = self.__mashumaro_changes__")
+        else:
+            instrumented_method = f"to_{self.format_name}"
+        with self._add_instrumentation_lines(instrumented_method):
             pre_serialize = self.get_declared_hook(__PRE_SERIALIZE__)
             if pre_serialize:
                 if self.is_code_generation_option_enabled(
@@ -838,6 +1781,12 @@ class CodeBuilder:
                 "omit_default", False
             )
             force_value = omit_default
+            discriminator_tag = self.get_discriminator_tag(field_types)
+            if discriminator_tag:
+                discriminator_tag = (
+                    discriminator_tag[0],
+                    self.get_field_default_literal(discriminator_tag[1]),
+                )
             packers = {}
             aliases = {}
             nullable_fields = set()
@@ -868,56 +1817,80 @@ class CodeBuilder:
                 or by_alias_feature
                 and aliases
                 or omit_default
+                or changes_only
             ):
                 kwargs = "kwargs"
                 self.add_line("kwargs = {}")
+                if discriminator_tag:
+                    self.add_line(
+                        f"kwargs['{discriminator_tag[0]}'] = "
+                        f"{discriminator_tag[1]}"
+                    )
                 for fname, packer in packers.items():
-                    if force_value:
-                        self.add_line(f"value = self.{fname}")
-                    alias = aliases.get(fname)
-                    if omit_default:
-                        # do not call default_factory if we don't need to
-                        default = self.get_field_default(
-                            fname, call_factory=True
+                    changed_block: typing.ContextManager[None]
+                    if changes_only:
+                        changed_block = self.indent(
+                            f"if changes is None or '{fname}' in changes:"
                         )
                     else:
-                        default = None
-                    if fname in nullable_fields:
-                        if (
-                            packer == "value"
-                            and not omit_none
-                            and not omit_none_feature
-                            and not (omit_default and default is None)
-                        ):
-                            self._pack_method_set_value(
-                                fname=fname,
-                                alias=alias,
-                                by_alias_feature=by_alias_feature,
-                                packed_value=(
-                                    "value" if force_value else f"self.{fname}"
-                                ),
-                                omit_default=omit_default,
-                            )
-                            continue
-                        if not force_value:  # to add it only once
+                        changed_block = nullcontext()
+                    with changed_block:
+                        if force_value:
                             self.add_line(f"value = self.{fname}")
-                        with self.indent("if value is not None:"):
-                            self._pack_method_set_value(
-                                fname=fname,
-                                alias=alias,
-                                by_alias_feature=by_alias_feature,
-                                packed_value=packer,
-                                omit_default=(
-                                    omit_default and default is not None
-                                ),
+                        alias = aliases.get(fname)
+                        if omit_default:
+                            # do not call default_factory if we don't need to
+                            default = self.get_field_default(
+                                fname, call_factory=True
                             )
-                        if omit_none and not omit_none_feature:
-                            continue
-                        elif omit_default and default is None:
-                            continue
-                        with self.indent("else:"):
-                            if omit_none_feature:
-                                with self.indent("if not omit_none:"):
+                        else:
+                            default = None
+                        if fname in nullable_fields:
+                            if (
+                                packer == "value"
+                                and not omit_none
+                                and not omit_none_feature
+                                and not (omit_default and default is None)
+                            ):
+                                self._pack_method_set_value(
+                                    fname=fname,
+                                    alias=alias,
+                                    by_alias_feature=by_alias_feature,
+                                    packed_value=(
+                                        "value"
+                                        if force_value
+                                        else f"self.{fname}"
+                                    ),
+                                    omit_default=omit_default,
+                                )
+                                continue
+                            if not force_value:  # to add it only once
+                                self.add_line(f"value = self.{fname}")
+                            with self.indent("if value is not None:"):
+                                self._pack_method_set_value(
+                                    fname=fname,
+                                    alias=alias,
+                                    by_alias_feature=by_alias_feature,
+                                    packed_value=packer,
+                                    omit_default=(
+                                        omit_default and default is not None
+                                    ),
+                                )
+                            if omit_none and not omit_none_feature:
+                                continue
+                            elif omit_default and default is None:
+                                continue
+                            with self.indent("else:"):
+                                if omit_none_feature:
+                                    with self.indent("if not omit_none:"):
+                                        self._pack_method_set_value(
+                                            fname=fname,
+                                            alias=alias,
+                                            by_alias_feature=by_alias_feature,
+                                            packed_value="None",
+                                            omit_default=False,
+                                        )
+                                else:
                                     self._pack_method_set_value(
                                         fname=fname,
                                         alias=alias,
@@ -925,24 +1898,18 @@ class CodeBuilder:
                                         packed_value="None",
                                         omit_default=False,
                                     )
-                            else:
-                                self._pack_method_set_value(
-                                    fname=fname,
-                                    alias=alias,
-                                    by_alias_feature=by_alias_feature,
-                                    packed_value="None",
-                                    omit_default=False,
-                                )
-                    else:
-                        self._pack_method_set_value(
-                            fname=fname,
-                            alias=alias,
-                            by_alias_feature=by_alias_feature,
-                            packed_value=packer,
-                            omit_default=omit_default,
-                        )
+                        else:
+                            self._pack_method_set_value(
+                                fname=fname,
+                                alias=alias,
+                                by_alias_feature=by_alias_feature,
+                                packed_value=packer,
+                                omit_default=omit_default,
+                            )
             else:
                 kwargs_parts = []
+                if discriminator_tag:
+                    kwargs_parts.append(discriminator_tag)
                 for fname, packer in packers.items():
                     if serialize_by_alias:
                         fname_or_alias = aliases.get(fname, fname)
@@ -951,7 +1918,7 @@ class CodeBuilder:
                     kwargs_parts.append(
                         (
                             fname_or_alias,
-                            packer if packer != "value" else f"self.{fname}",
+                            (packer if packer != "value" else f"self.{fname}"),
                         )
                     )
                 kwargs = ", ".join(f"'{k}': {v}" for k, v in kwargs_parts)
@@ -1100,7 +2067,14 @@ class CodeBuilder:
             with self.indent(f"if not '{cache_name}' in cls.__dict__:"):
                 self.add_line(f"cls.{cache_name} = {{}}")
 
-        self._add_pack_method_definition(method_name)
+        serialization_cache = self._get_serialization_cache()
+        if serialization_cache is not None:
+            uncached_method_name = InternalMethodName.from_public(
+                f"{method_name.public}_uncached"
+            )
+            self._add_pack_method_definition(uncached_method_name)
+        else:
+            self._add_pack_method_definition(method_name)
         with self.indent():
             if dialects_feature and self.dialect is None:
                 with self.indent("if dialect is None:"):
@@ -1109,9 +2083,133 @@ class CodeBuilder:
                     self._add_pack_method_with_dialect_lines(method_name)
             else:
                 self._add_pack_method_lines(method_name)
+        if serialization_cache is not None:
+            self._add_cached_pack_method(
+                method_name, uncached_method_name, serialization_cache
+            )
         self._add_setattr_method(method_name, cache_name)
         self.compile()
 
+    def _get_serialization_cache(self) -> SerializationCache | None:
+        maxsize = self.get_config().cache_serialization
+        if not maxsize or self.dialect is not None or not self.is_nailed:
+            return None
+        if not self.cls.__weakrefoffset__:
+            raise ValueError(
+                "Config option 'cache_serialization' requires "
+                f"{type_name(self.cls)} instances to support weak references"
+            )
+        cache = self.cls.__dict__.get("__mashumaro_serialization_cache__")
+        if cache is None:
+            if maxsize is True:
+                maxsize = DEFAULT_SERIALIZATION_CACHE_SIZE
+            cache = SerializationCache(maxsize)
+            setattr(self.cls, "__mashumaro_serialization_cache__", cache)
+        return cache
+
+    def _add_cached_pack_method(
+        self,
+        method_name: InternalMethodName,
+        uncached_method_name: InternalMethodName,
+        serialization_cache: SerializationCache,
+    ) -> None:
+        self.ensure_object_imported(serialization_cache, "serialization_cache")
+        packer_args = self.get_pack_method_flags(pass_encoder=True)
+        key_parts = [repr(method_name)]
+        for packer_arg in filter(None, packer_args.split(", ")):
+            key_parts.append(packer_arg.split("=")[0])
+        self._add_pack_method_definition(method_name)
+        with self.indent():
+            uncached_call = f"self.{uncached_method_name}({packer_args})"
+            if self.is_code_generation_option_enabled(
+                ADD_SERIALIZATION_CONTEXT
+            ):
+                with self.indent("if context is not None:"):
+                    self.add_line(f"return {uncached_call}")
+            self.add_line(f"key = ({', '.join(key_parts)},)")
+            self.add_line("result = serialization_cache.get(self, key)")
+            with self.indent("if result is Sentinel.MISSING:"):
+                self.add_line(f"result = {uncached_call}")
+                self.add_line("serialization_cache.set(self, key, result)")
+            self.add_line("return result")
+        self.add_line(
+            f"setattr(cls, '{uncached_method_name}', {uncached_method_name})"
+        )
+
+    def add_changes_tracking_methods(self) -> None:
+        self.reset()
+        if not self.cls.__dictoffset__:
+            # changes are stored in an instance attribute that isn't a slot
+            raise ValueError(
+                "Config option 'track_changes' requires "
+                f"{type_name(self.cls)} instances to have __dict__"
+            )
+        self.ensure_object_imported(self.cls, "cls")
+        self.ensure_object_imported(object.__setattr__, "object_setattr")
+        self.ensure_object_imported(
+            _enable_changes_tracking, "enable_changes_tracking"
+        )
+        # the dataclass decorator, which can make the class frozen, is
+        # applied after compilation, so the tracking is enabled on first use
+        self.add_line("def mark_clean(self):")
+        with self.indent():
+            self.add_line("enable_changes_tracking(cls)")
+            self.add_line(
+                "object_setattr(self, '__mashumaro_changes__', set())"
+            )
+        self.add_line("setattr(cls, 'mark_clean', mark_clean)")
+        self.add_line("setattr(cls, '__mashumaro_changes__', None)")
+        if get_class_that_defines_method("__copy__", self.cls) is None:
+            # copies must not share the set of changes
+            self.add_line("def __copy__(self):")
+            with self.indent():
+                self.add_line("new = self.__class__.__new__(self.__class__)")
+                self.add_line("d = new.__dict__")
+                self.add_line("d.update(self.__dict__)")
+                self.add_line("changes = d.get('__mashumaro_changes__')")
+                with self.indent("if changes is not None:"):
+                    self.add_line(
+                        "d['__mashumaro_changes__'] = changes.copy()"
+                    )
+                self.add_line("return new")
+            self.add_line("setattr(cls, '__copy__', __copy__)")
+        self.compile()
+        self.add_pack_changes_method()
+
+    def add_pack_changes_method(self) -> None:
+        self.reset()
+        method_name = InternalMethodName.from_public("to_dict_changes")
+        self._add_pack_method_definition(method_name)
+        with self.indent():
+            self._add_pack_changes_method_lines(method_name)
+        self.add_line(f"setattr(cls, '{method_name}', {method_name})")
+        self.add_line(f"setattr(cls, '{method_name.public}', {method_name})")
+        self.compile()
+
+    def _add_pack_changes_method_lines(self, method_name: str) -> None:
+        config = self.get_config()
+        lazy_line = (
+            "CodeBuilder(self.__class__,allow_postponed_evaluation=False)"
+            ".add_pack_changes_method()"
+        )
+        packer_args = self.get_pack_method_flags()
+        if config.lazy_compilation and self.allow_postponed_evaluation:
+            self.add_line(lazy_line)
+            self.add_line(f"return self.{method_name}({packer_args})")
+            return
+        try:
+            field_types = self.get_field_types(include_extras=True)
+        except UnresolvedTypeReferenceError:
+            if (
+                not self.allow_postponed_evaluation
+                or not config.allow_postponed_evaluation
+            ):
+                raise
+            self.add_line(lazy_line)
+            self.add_line(f"return self.{method_name}({packer_args})")
+            return
+        self._add_pack_method_body(field_types, changes_only=True)
+
     def _add_setattr_method(
         self, method_name: InternalMethodName, cache_name: str
     ) -> None:
@@ -1242,6 +2340,21 @@ class CodeBuilder:
                 return value
         return default
 
+    def get_decode_limiter(self) -> str | None:
+        limits = self.get_dialect_or_config_option("decode_limits", None)
+        if limits is None:
+            return None
+        if "decode_limiter" not in self.globals:
+            self.ensure_object_imported(
+                DecodeLimiter(limits), "decode_limiter"
+            )
+        return "decode_limiter"
+
+    def add_decode_limits_reraise(self) -> None:
+        # exceeded decode limits are not wrapped in InvalidFieldValue
+        if self.get_decode_limiter() is not None:
+            self.add_line("except DecodeLimitExceeded: raise")
+
     def get_field_default_literal(self, value: typing.Any) -> str:
         if isinstance(value, enum.IntFlag):
             return str(value.value)
@@ -1282,6 +2395,8 @@ class FieldUnpackerCodeBlockBuilder:
     ) -> None:
         with self.lines.indent("try:"):
             self._set_value(field_name, unpacked_value, in_kwargs)
+        if self.parent.get_decode_limiter() is not None:
+            self.lines.append("except DecodeLimitExceeded: raise")
         with self.lines.indent("except:"):
             self.lines.append(
                 "raise InvalidFieldValue("
@@ -1306,7 +2421,7 @@ class FieldUnpackerCodeBlockBuilder:
     ) -> FieldUnpackerCodeBlock:
         default = self.parent.get_field_default(fname)
         has_default = default is not MISSING
-        field_type = self.parent.get_type_name_identifier(
+        field_type = self.parent.get_type_ref(
             ftype,
             resolved_type_params=self.parent.get_field_resolved_type_params(
                 fname
@@ -1320,6 +2435,7 @@ class FieldUnpackerCodeBlockBuilder:
             )
             or default is None
         )
+        get_option = self.parent.get_dialect_or_config_option
         unpacked_value = UnpackerRegistry.get(
             ValueSpec(
                 type=ftype,
@@ -1327,6 +2443,12 @@ class FieldUnpackerCodeBlockBuilder:
                 builder=self.parent,
                 field_ctx=FieldContext(name=fname, metadata=metadata),
                 could_be_none=False if could_be_none else True,
+                no_copy_unpack_collections=get_option(
+                    "no_copy_unpack_collections", ()
+                ),
+                trust_no_copy_unpack_collections=get_option(
+                    "trust_no_copy_unpack_collections", False
+                ),
             )
         )
         if self.parent.get_config().allow_deserialization_not_by_alias:
@@ -1,6 +1,8 @@
+import array
 import dataclasses
 import enum
 import inspect
+import sys
 import types
 import typing
 from collections.abc import Callable, Hashable, Iterable, Iterator
@@ -65,6 +67,9 @@ __all__ = [
     "is_hashable",
     "is_hashable_type",
     "is_type_alias_type",
+    "is_numpy_array",
+    "get_numpy_array_dtype",
+    "get_array_typecode",
 ]
 
 
@@ -774,3 +779,40 @@ def type_var_has_default(typ: Any) -> bool:
 
 def get_type_var_default(typ: Any) -> Type:
     return getattr(typ, "__default__")
+
+
+def is_numpy_array(typ: Type) -> bool:
+    # numpy is never imported here, if a field is annotated with ndarray
+    # then the module is already loaded
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and typ is numpy.ndarray
+
+
+def get_numpy_array_dtype(
+    typ: Type, annotations: Sequence[Any] = ()
+) -> Any | None:
+    numpy = sys.modules["numpy"]
+    candidates = list(annotations)
+    type_args = get_args(typ)
+    if len(type_args) == 2:
+        candidates.extend(get_args(type_args[1])[:1])
+    for candidate in candidates:
+        if isinstance(candidate, numpy.dtype):
+            return candidate
+        elif isinstance(candidate, type) and issubclass(
+            candidate, numpy.generic
+        ):
+            with suppress(TypeError):
+                return numpy.dtype(candidate)
+    return None
+
+
+def get_array_typecode(annotations: Sequence[Any] = ()) -> str | None:
+    for annotation in annotations:
+        if (
+            isinstance(annotation, str)
+            and len(annotation) == 1
+            and annotation in array.typecodes
+        ):
+            return annotation
+    return None
@@ -4,7 +4,13 @@ from mashumaro.core.meta.code.builder import CodeBuilder
 from mashumaro.dialect import Dialect
 from mashumaro.exceptions import UnresolvedTypeReferenceError
 
-__all__ = ["compile_mixin_packer", "compile_mixin_unpacker"]
+__all__ = [
+    "compile_mixin_packer",
+    "compile_mixin_unpacker",
+    "compile_mixin_updater",
+    "compile_mixin_object_unpacker",
+    "compile_mixin_cloner",
+]
 
 
 def compile_mixin_packer(
@@ -27,6 +33,8 @@ def compile_mixin_packer(
     except UnresolvedTypeReferenceError:
         if not config.allow_postponed_evaluation:
             raise
+    if config.track_changes and format_name == "dict" and encoder is None:
+        builder.add_changes_tracking_methods()
 
 
 def compile_mixin_unpacker(
@@ -47,3 +55,17 @@ def compile_mixin_unpacker(
     except UnresolvedTypeReferenceError:
         if not config.allow_postponed_evaluation:
             raise
+
+
+def compile_mixin_updater(cls: Type) -> None:
+    CodeBuilder(cls, allow_postponed_evaluation=False).add_update_method()
+
+
+def compile_mixin_object_unpacker(cls: Type) -> None:
+    CodeBuilder(
+        cls, allow_postponed_evaluation=False
+    ).add_object_unpack_method()
+
+
+def compile_mixin_cloner(cls: Type) -> None:
+    CodeBuilder(cls, allow_postponed_evaluation=False).add_clone_method()
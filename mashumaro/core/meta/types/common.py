@@ -33,6 +33,14 @@ class TypeMatchEligibleExpression(str):
 NoneType = type(None)
 Expression: TypeAlias = str | TypeMatchEligibleExpression
 
+# number of epoch units in a second for each epoch engine
+EPOCH_ENGINE_UNITS = {
+    "epoch_s": 1,
+    "epoch_ms": 1_000,
+    "epoch_us": 1_000_000,
+    "epoch_ns": 1_000_000_000,
+}
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -78,6 +86,8 @@ class ValueSpec:
     annotated_type: Type | None = None
     owner: Type | None = None
     no_copy_collections: Sequence = tuple()
+    no_copy_unpack_collections: Sequence = tuple()
+    trust_no_copy_unpack_collections: bool = False
 
     def __setattr__(self, key: str, value: Any) -> None:
         if key == "type":
@@ -174,7 +184,7 @@ class AbstractMethodBuilder(ABC):
         if spec.builder.get_config().debug:
             print(f"{type_name(spec.builder.cls)}:")
             print(lines.as_text())
-        exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+        spec.builder.exec_code(lines.as_text())
 
     @abstractmethod
     def _get_call_expr(self, spec: ValueSpec, method_name: str) -> str:
@@ -274,6 +284,15 @@ def expr_or_maybe_none(spec: ValueSpec, new_expr: Expression) -> Expression:
         return new_expr
 
 
+def numpy_dtype_expr(spec: ValueSpec, dtype: Any) -> str:
+    if dtype.fields is None:
+        return repr(dtype.str)
+    # structured dtypes can't be restored from their string representation
+    name = f"__numpy_dtype_{random_hex()}"
+    spec.builder.ensure_object_imported(dtype, name)
+    return name
+
+
 def random_hex() -> str:
     return str(uuid.uuid4().hex)
 
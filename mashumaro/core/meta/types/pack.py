@@ -1,3 +1,4 @@
+import array
 import datetime
 import enum
 import ipaddress
@@ -20,20 +21,31 @@ import typing_extensions
 from typing_extensions import NotRequired
 
 from mashumaro.core.const import PY_311_MIN
+from mashumaro.core.helpers import (
+    EPOCH,
+    EPOCH_ORDINAL,
+    UTC_EPOCH,
+    AnyTypePacker,
+    SubtypePacker,
+    byteswapped_array,
+)
 from mashumaro.core.meta.code.lines import CodeLines
 from mashumaro.core.meta.helpers import (
     get_args,
     get_class_that_defines_method,
     get_function_return_annotation,
     get_literal_values,
+    get_numpy_array_dtype,
     get_type_origin,
     get_type_var_default,
+    is_dataclass_dict_mixin_subclass,
     is_final,
     is_generic,
     is_literal,
     is_named_tuple,
     is_new_type,
     is_not_required,
+    is_numpy_array,
     is_optional,
     is_readonly,
     is_required,
@@ -53,6 +65,8 @@ from mashumaro.core.meta.helpers import (
     type_var_has_default,
 )
 from mashumaro.core.meta.types.common import (
+    EPOCH_ENGINE_UNITS,
+    AttrsHolder,
     Expression,
     ExpressionWrapper,
     NoneType,
@@ -63,6 +77,7 @@ from mashumaro.core.meta.types.common import (
     ensure_generic_collection_subclass,
     ensure_generic_mapping,
     expr_or_maybe_none,
+    numpy_dtype_expr,
     random_hex,
 )
 from mashumaro.exceptions import (
@@ -90,6 +105,25 @@ __all__ = ["PackerRegistry"]
 PackerRegistry = Registry()
 register = PackerRegistry.register
 
+_any_type_packers: dict[tuple[Any, ...], AnyTypePacker] = {}
+
+
+def _get_any_type_packer(spec: ValueSpec) -> AnyTypePacker:
+    dialects = (
+        spec.builder.default_dialect,
+        spec.builder.get_config().dialect,
+        spec.builder.dialect,
+    )
+    packer = _any_type_packers.get(dialects)
+    if packer is None:
+        merged = [d for d in dialects if d is not None]
+        dialect = merged[0]
+        for other in merged[1:]:
+            dialect = dialect.merge(other)
+        packer = AnyTypePacker(dialect)
+        _any_type_packers[dialects] = packer
+    return packer
+
 
 def _pack_with_annotated_serialization_strategy(
     spec: ValueSpec, strategy: SerializationStrategy
@@ -233,51 +267,120 @@ def pack_generic_serializable_type(spec: ValueSpec) -> Expression | None:
             return f"{spec.expression}._serialize([{type_arg_names}])"
 
 
-@register
-def pack_dataclass(spec: ValueSpec) -> Expression | None:
-    if is_dataclass(spec.origin_type):
-        type_args = get_args(spec.type)
-        method_name = spec.builder.get_pack_method_name(
-            type_args, spec.builder.format_name
+def _get_dataclass_method_loc(spec: ValueSpec) -> Any:
+    return spec.origin_type if spec.builder.is_nailed else spec.attrs
+
+
+class _DataclassPackMethodCompiler:
+    # keeps only the options needed to compile pack methods of dataclasses,
+    # so that it can outlive the builder of the class being compiled
+
+    def __init__(self, builder: Any):
+        self.builder_class = builder.__class__
+        self.cls = builder.cls
+        self.dialect = builder.dialect
+        self.format_name = builder.format_name
+        self.default_dialect = builder.default_dialect
+        self.encoder = builder.encoder
+        self.allow_postponed_evaluation = builder.allow_postponed_evaluation
+        self.attrs_registry = (
+            None if builder.is_nailed else builder.attrs_registry
+        )
+
+    def add_pack_method(
+        self, typ: type, type_args: tuple[Any, ...], method_loc: Any
+    ) -> str:
+        method_name = self.builder_class.get_pack_method_name(
+            type_args, self.format_name
         )
-        method_loc = spec.origin_type if spec.builder.is_nailed else spec.attrs
         if get_class_that_defines_method(
             method_name, method_loc
         ) != method_loc and (
-            spec.origin_type is not spec.builder.cls
-            or spec.builder.get_pack_method_name(
+            typ is not self.cls
+            or self.builder_class.get_pack_method_name(
                 type_args=type_args,
-                format_name=spec.builder.format_name,
-                encoder=spec.builder.encoder,
+                format_name=self.format_name,
+                encoder=self.encoder,
             )
             != method_name
         ):
-            builder = spec.builder.__class__(
-                spec.origin_type,
+            builder = self.builder_class(
+                typ,
                 type_args,
-                dialect=spec.builder.dialect,
-                format_name=spec.builder.format_name,
-                default_dialect=spec.builder.default_dialect,
+                dialect=self.dialect,
+                format_name=self.format_name,
+                default_dialect=self.default_dialect,
                 attrs=method_loc,
-                attrs_registry=(
-                    spec.attrs_registry if not spec.builder.is_nailed else None
-                ),
-                allow_postponed_evaluation=(
-                    spec.builder.allow_postponed_evaluation
-                ),
+                attrs_registry=self.attrs_registry,
+                allow_postponed_evaluation=self.allow_postponed_evaluation,
             )
             builder.add_pack_method()
-        flags = spec.builder.get_pack_method_flags(spec.type)
-        if spec.builder.is_nailed:
-            return f"{spec.expression}.{method_name}({flags})"
+        return method_name
+
+    def compile_subtype_packer(self, typ: type) -> Callable:
+        if self.attrs_registry is None:
+            method_loc = typ
         else:
-            cls_alias = clean_id(type_name(spec.origin_type))
-            method_name_alias = f"{cls_alias}_{method_name}"
+            method_loc = self.attrs_registry.get(typ)
+            if method_loc is None:
+                method_loc = AttrsHolder()
+                self.attrs_registry[typ] = method_loc
+        method_name = self.add_pack_method(typ, (), method_loc)
+        return getattr(method_loc, method_name)
+
+
+def _add_dataclass_pack_method(spec: ValueSpec) -> str:
+    return _DataclassPackMethodCompiler(spec.builder).add_pack_method(
+        spec.origin_type, get_args(spec.type), _get_dataclass_method_loc(spec)
+    )
+
+
+def _has_subtype_discriminator(spec: ValueSpec) -> bool:
+    for cls in spec.origin_type.__mro__:
+        discriminator = spec.builder.get_config(
+            cls, look_in_parents=False
+        ).discriminator
+        if discriminator:
+            return discriminator.include_subtypes
+    return False
+
+
+@register
+def pack_dataclass(spec: ValueSpec) -> Expression | None:
+    if is_dataclass(spec.origin_type):
+        method_name = _add_dataclass_pack_method(spec)
+        flags = spec.builder.get_pack_method_flags(spec.type)
+        cls_alias = clean_id(type_name(spec.origin_type))
+        if (
+            not get_args(spec.type)
+            # compiled methods of mixin subclasses are found by attribute
+            and not (
+                spec.builder.is_nailed
+                and is_dataclass_dict_mixin_subclass(spec.origin_type)
+            )
+            and _has_subtype_discriminator(spec)
+        ):
+            # instances of subclasses are packed by their own methods
+            packer_name = f"{cls_alias}_subtype_packer_{random_hex()}"
             spec.builder.ensure_object_imported(
-                getattr(spec.attrs, method_name), method_name_alias
+                SubtypePacker(
+                    spec.origin_type,
+                    getattr(_get_dataclass_method_loc(spec), method_name),
+                    _DataclassPackMethodCompiler(
+                        spec.builder
+                    ).compile_subtype_packer,
+                ).pack,
+                packer_name,
             )
-            method_args = spec.expression
-            return f"{method_name_alias}({method_args})"
+            packer_args = ", ".join(filter(None, (spec.expression, flags)))
+            return f"{packer_name}({packer_args})"
+        if spec.builder.is_nailed:
+            return f"{spec.expression}.{method_name}({flags})"
+        method_name_alias = f"{cls_alias}_{method_name}"
+        spec.builder.ensure_object_imported(
+            getattr(spec.attrs, method_name), method_name_alias
+        )
+        return f"{method_name_alias}({spec.expression})"
 
 
 @register
@@ -288,8 +391,16 @@ def pack_final(spec: ValueSpec) -> Expression | None:
 
 @register
 def pack_any(spec: ValueSpec) -> Expression | None:
-    if spec.type is Any:
-        return spec.expression
+    if spec.type is Any or spec.type is object:
+        if not spec.builder.get_dialect_or_config_option(
+            "dispatch_any", False
+        ):
+            return spec.expression if spec.type is Any else None
+        packer_name = f"any_packer_{random_hex()}"
+        spec.builder.ensure_object_imported(
+            _get_any_type_packer(spec).pack, packer_name
+        )
+        return f"{packer_name}({spec.expression})"
 
 
 def pack_union(
@@ -319,9 +430,9 @@ def pack_union(
     method_args = "self, value" if spec.builder.is_nailed else "value"
     default_kwargs = spec.builder.get_pack_method_default_flag_values()
     if default_kwargs:
-        lines.append(f"def {method_name}({method_args}, {default_kwargs}):")
+        method_signature = f"({method_args}, {default_kwargs}):"
     else:
-        lines.append(f"def {method_name}({method_args}):")
+        method_signature = f"({method_args}):"
     packers: list[str] = []
     packer_arg_types: dict[str, list[type]] = {}
     for type_arg in args:
@@ -340,7 +451,44 @@ def pack_union(
     if len(packers) == 1 and packers[0] == "value":
         return spec.expression
 
+    # exact classes of the variants are dispatched without trying others
+    dispatch_packers: dict[type, set[str]] = {}
+    for packer, packer_arg_types_ in packer_arg_types.items():
+        for packer_arg_type in packer_arg_types_:
+            origin = get_type_origin(packer_arg_type)
+            if isinstance(origin, type) and origin is not object:
+                dispatch_packers.setdefault(origin, set()).add(packer)
+    dispatch_table: dict[str, str] = {}
+    for variant_index, (dispatch_cls, dispatch_cls_packers) in enumerate(
+        dispatch_packers.items()
+    ):
+        if len(dispatch_cls_packers) > 1 or "value" in dispatch_cls_packers:
+            continue
+        dispatch_cls_name = clean_id(type_name(dispatch_cls))
+        spec.builder.ensure_object_imported(dispatch_cls, dispatch_cls_name)
+        variant_method_name = f"{method_name}_{variant_index}"
+        with lines.indent(f"def {variant_method_name}{method_signature}"):
+            lines.append(f"return {dispatch_cls_packers.pop()}")
+        dispatch_table[dispatch_cls_name] = variant_method_name
+    if dispatch_table:
+        dispatch_table_name = f"{method_name}_dispatch"
+        spec.builder.ensure_object_imported({}, dispatch_table_name)
+        items = ", ".join(f"{k}: {v}" for k, v in dispatch_table.items())
+        lines.append(f"{dispatch_table_name}.update({{{items}}})")
+        variant_args = ", ".join(
+            filter(
+                None,
+                (
+                    "self" if spec.builder.is_nailed else None,
+                    "value",
+                    spec.builder.get_pack_method_flags(),
+                ),
+            )
+        )
+    lines.append(f"def {method_name}{method_signature}")
+
     with lines.indent():
+        dispatch_added = not dispatch_table
         for packer in packers:
             packer_arg_type_names = []
             for packer_arg_type in packer_arg_types[packer]:
@@ -365,12 +513,24 @@ def pack_union(
                     f"if value.__class__ {packer_arg_type_check}:"
                 ):
                     lines.append(f"return {packer}")
-            else:
-                with lines.indent("try:"):
-                    lines.append(f"return {packer}")
-                with lines.indent("except Exception:"):
-                    lines.append("pass")
-        field_type = spec.builder.get_type_name_identifier(
+                continue
+            if not dispatch_added:
+                lines.append(
+                    "variant_packer = "
+                    f"{dispatch_table_name}.get(value.__class__)"
+                )
+                with lines.indent("if variant_packer is not None:"):
+                    # on failure the variants are tried in order as usual
+                    with lines.indent("try:"):
+                        lines.append(f"return variant_packer({variant_args})")
+                    with lines.indent("except Exception:"):
+                        lines.append("pass")
+                dispatch_added = True
+            with lines.indent("try:"):
+                lines.append(f"return {packer}")
+            with lines.indent("except Exception:"):
+                lines.append("pass")
+        field_type = spec.builder.get_type_ref(
             typ=spec.type,
             resolved_type_params=spec.builder.get_field_resolved_type_params(
                 spec.field_ctx.name
@@ -390,7 +550,7 @@ def pack_union(
         print(f"{type_name(spec.builder.cls)}:")
         print(lines.as_text())
 
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+    spec.builder.exec_code(lines.as_text())
 
     method_args = ", ".join(
         filter(None, (spec.expression, spec.builder.get_pack_method_flags()))
@@ -440,7 +600,7 @@ def pack_literal(spec: ValueSpec) -> Expression:
             ):
                 with lines.indent(f"if value == {literal_value!r}:"):
                     lines.append(f"return {packer}")
-        field_type = spec.builder.get_type_name_identifier(
+        field_type = spec.builder.get_type_ref(
             typ=spec.type, resolved_type_params=resolved_type_params
         )
         if spec.builder.is_nailed:
@@ -456,7 +616,7 @@ def pack_literal(spec: ValueSpec) -> Expression:
     if spec.builder.get_config().debug:
         print(f"{type_name(spec.builder.cls)}:")
         print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+    spec.builder.exec_code(lines.as_text())
     method_args = ", ".join(
         filter(None, (spec.expression, spec.builder.get_pack_method_flags()))
     )
@@ -571,16 +731,57 @@ def pack_number_and_bool_and_none(spec: ValueSpec) -> Expression | None:
         return spec.expression
 
 
+def _get_epoch_units(spec: ValueSpec) -> int | None:
+    serialize_option = get_overridden_serialization_method(spec)
+    if isinstance(serialize_option, str):
+        return EPOCH_ENGINE_UNITS.get(serialize_option)
+    return None
+
+
+def _pack_timedelta_as_epoch_units(
+    spec: ValueSpec, expr: Expression, units: int
+) -> Expression:
+    if units == 1:
+        return f"{expr}.total_seconds()"
+    microseconds = max(1_000_000 // units, 1)
+    unit = f"__timedelta_{microseconds}us"
+    spec.builder.ensure_object_imported(
+        datetime.timedelta(microseconds=microseconds), unit
+    )
+    if units <= 1_000_000:
+        return f"{expr} // {unit}"
+    return f"{expr} // {unit} * {units // 1_000_000}"
+
+
 @register
 def pack_date_objects(spec: ValueSpec) -> Expression | None:
     if spec.origin_type in (datetime.datetime, datetime.date, datetime.time):
-        return f"{spec.expression}.isoformat()"
+        units = _get_epoch_units(spec)
+        if units is None or spec.origin_type is datetime.time:
+            return f"{spec.expression}.isoformat()"
+        elif spec.origin_type is datetime.date:
+            return (
+                f"({spec.expression}.toordinal() - {EPOCH_ORDINAL}) "
+                f"* {86400 * units}"
+            )
+        # naive datetimes are considered to be in UTC
+        spec.builder.ensure_object_imported(EPOCH, "__epoch")
+        spec.builder.ensure_object_imported(UTC_EPOCH, "__utc_epoch")
+        return _pack_timedelta_as_epoch_units(
+            spec,
+            f"({spec.expression} - (__epoch if {spec.expression}.tzinfo "
+            f"is None else __utc_epoch))",
+            units,
+        )
 
 
 @register
 def pack_timedelta(spec: ValueSpec) -> Expression | None:
     if spec.origin_type is datetime.timedelta:
-        return f"{spec.expression}.total_seconds()"
+        units = _get_epoch_units(spec)
+        if units is None:
+            return f"{spec.expression}.total_seconds()"
+        return _pack_timedelta_as_epoch_units(spec, spec.expression, units)
 
 
 @register
@@ -782,13 +983,61 @@ def pack_typed_dict(spec: ValueSpec) -> Expression:
     if spec.builder.get_config().debug:
         print(f"{type_name(spec.builder.cls)}:")
         print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+    spec.builder.exec_code(lines.as_text())
     method_args = ", ".join(
         filter(None, (spec.expression, spec.builder.get_pack_method_flags()))
     )
     return f"{spec.self_attrs_name}.{method_name}({method_args})"
 
 
+def _get_array_serialization_engine(spec: ValueSpec) -> str:
+    serialize_option = get_overridden_serialization_method(spec)
+    if serialize_option is None:
+        return "as_list"
+    elif isinstance(serialize_option, str) and serialize_option in (
+        "as_list",
+        "as_bytes",
+    ):
+        return serialize_option
+    raise UnsupportedSerializationEngine(
+        field_name=spec.field_ctx.name,
+        field_type=spec.type,
+        holder_class=spec.builder.cls,
+        engine=serialize_option,
+    )
+
+
+@register
+def pack_array(spec: ValueSpec) -> Expression | None:
+    if spec.origin_type is not array.array:
+        return None
+    if _get_array_serialization_engine(spec) == "as_list":
+        return f"{spec.expression}.tolist()"
+    elif sys.byteorder == "little":
+        return f"{spec.expression}.tobytes()"
+    else:  # pragma: no cover
+        spec.builder.ensure_object_imported(byteswapped_array)
+        return f"byteswapped_array({spec.expression}).tobytes()"
+
+
+@register
+def pack_numpy_array(spec: ValueSpec) -> Expression | None:
+    if not is_numpy_array(spec.origin_type):
+        return None
+    if _get_array_serialization_engine(spec) == "as_list":
+        return f"{spec.expression}.tolist()"
+    dtype = get_numpy_array_dtype(spec.type, spec.annotations)
+    if dtype is None or dtype.hasobject:
+        raise UnserializableField(
+            field_name=spec.field_ctx.name,
+            field_type=spec.type,
+            holder_class=spec.builder.cls,
+            msg="Engine as_bytes requires a fixed-size array dtype",
+        )
+    dtype_expr = numpy_dtype_expr(spec, dtype.newbyteorder("<"))
+    return f"{spec.expression}.astype({dtype_expr}, copy=False).tobytes()"
+
+
 @register
 def pack_collection(spec: ValueSpec) -> Expression | None:
     if not issubclass(spec.origin_type, Collection):
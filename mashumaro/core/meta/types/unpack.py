@@ -1,3 +1,4 @@
+import array
 import collections
 import collections.abc
 import datetime
@@ -31,13 +32,20 @@ import typing_extensions
 from typing_extensions import NotRequired
 
 from mashumaro.core.const import PY_311_MIN
-from mashumaro.core.helpers import parse_timezone
+from mashumaro.core.helpers import (
+    EPOCH_ORDINAL,
+    UTC_EPOCH,
+    byteswapped_array,
+    parse_timezone,
+)
 from mashumaro.core.meta.code.lines import CodeLines
 from mashumaro.core.meta.helpers import (
     get_args,
+    get_array_typecode,
     get_class_that_defines_method,
     get_function_arg_annotation,
     get_literal_values,
+    get_numpy_array_dtype,
     get_type_origin,
     get_type_var_default,
     is_final,
@@ -46,6 +54,7 @@ from mashumaro.core.meta.helpers import (
     is_named_tuple,
     is_new_type,
     is_not_required,
+    is_numpy_array,
     is_optional,
     is_readonly,
     is_required,
@@ -66,6 +75,7 @@ from mashumaro.core.meta.helpers import (
     type_var_has_default,
 )
 from mashumaro.core.meta.types.common import (
+    EPOCH_ENGINE_UNITS,
     AbstractMethodBuilder,
     AttrsHolder,
     Expression,
@@ -79,15 +89,18 @@ from mashumaro.core.meta.types.common import (
     ensure_generic_collection_subclass,
     ensure_generic_mapping,
     expr_or_maybe_none,
+    numpy_dtype_expr,
     random_hex,
 )
 from mashumaro.exceptions import (
     ThirdPartyModuleNotFoundError,
+    UnresolvedTypeReferenceError,
     UnserializableDataError,
     UnserializableField,
     UnsupportedDeserializationEngine,
 )
 from mashumaro.helper import pass_through
+from mashumaro.instrumentation import UnionStats, register_union_stats
 from mashumaro.types import (
     Discriminator,
     GenericSerializableType,
@@ -115,6 +128,9 @@ except ImportError:  # pragma: no cover
 __all__ = ["UnpackerRegistry", "SubtypeUnpackerBuilder"]
 
 
+DEFAULT_ADAPTIVE_UNION_WARMUP = 1000
+
+
 UnpackerRegistry = Registry()
 register = UnpackerRegistry.register
 
@@ -170,6 +186,28 @@ class AbstractUnpackerBuilder(AbstractMethodBuilder, ABC):
         return f"{spec.cls_attrs_name}.{method_name}({method_args})"
 
 
+def _add_except_pass(
+    lines: CodeLines,
+    spec: ValueSpec | None = None,
+    reraise_limits: bool = False,
+) -> None:
+    # exceeded decode limits must not be ignored by trying other variants
+    if reraise_limits or (
+        spec is not None and spec.builder.get_decode_limiter() is not None
+    ):
+        lines.append("except DecodeLimitExceeded: raise")
+    lines.append("except Exception: pass")
+
+
+def _are_mutually_exclusive(
+    keys: tuple[list[set[str]], set[str]],
+    other_keys: tuple[list[set[str]], set[str]],
+) -> bool:
+    return any(
+        required.isdisjoint(other_keys[1]) for required in keys[0]
+    ) and any(required.isdisjoint(keys[1]) for required in other_keys[0])
+
+
 class UnionUnpackerBuilder(AbstractUnpackerBuilder):
     def __init__(self, args: tuple[type, ...]):
         self.union_args = args
@@ -190,6 +228,7 @@ class UnionUnpackerBuilder(AbstractUnpackerBuilder):
             )
         orig_lines = lines
         lines = CodeLines()
+        segments: list[CodeLines | list[tuple[int, str]]] = [lines]
         unpackers = set()
         fallback_unpackers = []
         type_arg_unpackers = []
@@ -201,7 +240,10 @@ class UnionUnpackerBuilder(AbstractUnpackerBuilder):
             type_arg_unpackers.append((type_arg, unpacker))
             if isinstance(unpacker, TypeMatchEligibleExpression):
                 type_match_statements += 1
-        for type_arg, unpacker in type_arg_unpackers:
+        adaptive_groups = self._get_adaptive_groups(spec, type_arg_unpackers)
+        group: list[tuple[int, str]] = []
+        group_id: int | None = None
+        for index, (type_arg, unpacker) in enumerate(type_arg_unpackers):
             condition = ""
             do_try = unpacker != "value"
             unpacker_block = CodeLines()
@@ -221,20 +263,32 @@ class UnionUnpackerBuilder(AbstractUnpackerBuilder):
             elif (condition, unpacker) in unpackers:
                 continue
             else:
-                unpacker_block.append(f"return {unpacker}")
-
-            if do_try:
+                keys_check = self._get_required_keys_check(spec, type_arg)
+                if keys_check:
+                    with unpacker_block.indent(f"if {keys_check}:"):
+                        unpacker_block.append(f"return {unpacker}")
+                else:
+                    unpacker_block.append(f"return {unpacker}")
+
+            if index in adaptive_groups:
+                if adaptive_groups[index] != group_id:
+                    group = []
+                    group_id = adaptive_groups[index]
+                    lines = CodeLines()
+                    segments.extend((group, lines))
+                group.append((index, unpacker))
+            elif do_try:
                 with lines.indent("try:"):
                     lines.extend(unpacker_block)
-                lines.append("except Exception: pass")
+                _add_except_pass(lines, spec)
             else:
                 lines.extend(unpacker_block)
             unpackers.add((condition, unpacker))
         for fallback_unpacker in fallback_unpackers:
             with lines.indent("try:"):
                 lines.append(f"return {fallback_unpacker}")
-            lines.append("except Exception: pass")
-        field_type = spec.builder.get_type_name_identifier(
+            _add_except_pass(lines, spec)
+        field_type = spec.builder.get_type_ref(
             typ=spec.type,
             resolved_type_params=spec.builder.get_field_resolved_type_params(
                 spec.field_ctx.name
@@ -249,7 +303,201 @@ class UnionUnpackerBuilder(AbstractUnpackerBuilder):
             lines.append("raise ValueError(value)")
         if type_match_statements > 1:
             orig_lines.append("__value_type = type(value)")
-        orig_lines.extend(lines)
+        if adaptive_groups:
+            union_stats = self._add_union_stats(spec, type_arg_unpackers)
+            union_stats_name = f"union_stats_{random_hex()}"
+            spec.builder.ensure_object_imported(union_stats, union_stats_name)
+            orig_lines.extend(
+                self._render_segments(
+                    segments,
+                    union_stats_name,
+                    reraise_limits=spec.builder.get_decode_limiter()
+                    is not None,
+                )
+            )
+            union_stats.on_warmed_up = self._get_reorder_callback(
+                spec, segments, union_stats, type_match_statements > 1
+            )
+        else:
+            orig_lines.extend(lines)
+
+    def _get_adaptive_groups(
+        self, spec: ValueSpec, type_arg_unpackers: list[tuple[type, str]]
+    ) -> dict[int, int]:
+        # Variants can be reordered only if at most one of them can succeed
+        # for any input. It's guaranteed for dataclasses forbidding extra keys
+        # when each of them requires a key that the other one doesn't allow.
+        if not spec.builder.get_config().adaptive_union_ordering:
+            return {}
+        groups: list[list[tuple[int, tuple[list[set[str]], set[str]]]]] = []
+        group: list[tuple[int, tuple[list[set[str]], set[str]]]] = []
+        for index, (type_arg, unpacker) in enumerate(type_arg_unpackers):
+            keys = None
+            if not isinstance(unpacker, TypeMatchEligibleExpression):
+                keys = self._get_exclusive_keys(spec, type_arg)
+            if keys is None:
+                groups.append(group)
+                group = []
+            elif all(
+                _are_mutually_exclusive(keys, other_keys)
+                for _, other_keys in group
+            ):
+                group.append((index, keys))
+            else:
+                groups.append(group)
+                group = [(index, keys)]
+        groups.append(group)
+        result = {}
+        for group_id, group in enumerate(groups):
+            if len(group) > 1:
+                for index, _ in group:
+                    result[index] = group_id
+        return result
+
+    @staticmethod
+    def _get_exclusive_keys(
+        spec: ValueSpec, type_arg: type
+    ) -> tuple[list[set[str]], set[str]] | None:
+        if not isinstance(type_arg, type) or not is_dataclass(type_arg):
+            return None
+        builder = spec.builder.__class__(type_arg)
+        config = builder.get_config()
+        if (
+            not config.forbid_extra_keys
+            or config.discriminator is not None
+            or builder.get_declared_hook("__pre_deserialize__")
+        ):
+            return None
+        try:
+            return builder.get_deserialization_keys()
+        except UnresolvedTypeReferenceError:
+            return None
+
+    @staticmethod
+    def _get_required_keys_check(spec: ValueSpec, type_arg: type) -> str:
+        # A dataclass variant is ruled out by a missing required key before
+        # calling its unpacker, which would raise and discard MissingField.
+        if (
+            not isinstance(type_arg, type)
+            or not is_dataclass(type_arg)
+            or issubclass(
+                type_arg, (SerializableType, GenericSerializableType)
+            )
+            or any(
+                spec.builder.iter_serialization_strategies(
+                    spec.field_ctx.metadata, type_arg
+                )
+            )
+        ):
+            return ""
+        builder = spec.builder.__class__(type_arg)
+        if builder.get_config().discriminator is not None or (
+            builder.get_declared_hook("__pre_deserialize__")
+        ):
+            return ""
+        try:
+            required_keys = builder.get_deserialization_keys()[0]
+        except UnresolvedTypeReferenceError:
+            return ""
+        conditions = []
+        for keys in required_keys:
+            condition = " or ".join(
+                f"{key!r} in value" for key in sorted(keys)
+            )
+            conditions.append(f"({condition})" if len(keys) > 1 else condition)
+        return " and ".join(conditions)
+
+    def _add_union_stats(
+        self, spec: ValueSpec, type_arg_unpackers: list[tuple[type, str]]
+    ) -> UnionStats:
+        warmup = spec.builder.get_config().adaptive_union_ordering
+        if warmup is True:
+            warmup = DEFAULT_ADAPTIVE_UNION_WARMUP
+        name = type_name(spec.builder.cls)
+        if spec.field_ctx.name:
+            name = f"{name}.{spec.field_ctx.name}"
+        union_stats = UnionStats(
+            name=name,
+            variants=[type_name(t) for t, _ in type_arg_unpackers],
+            warmup=warmup,
+        )
+        register_union_stats(union_stats)
+        return union_stats
+
+    @staticmethod
+    def _render_segments(
+        segments: list[CodeLines | list[tuple[int, str]]],
+        union_stats_name: str | None = None,
+        union_stats: UnionStats | None = None,
+        reraise_limits: bool = False,
+    ) -> CodeLines:
+        lines = CodeLines()
+        for segment in segments:
+            if isinstance(segment, CodeLines):
+                lines.extend(segment)
+                continue
+            if union_stats is not None:
+                segment = sorted(
+                    segment, key=lambda item: -union_stats.hits[item[0]]
+                )
+            for index, unpacker in segment:
+                if union_stats_name is None:
+                    with lines.indent("try:"):
+                        lines.append(f"return {unpacker}")
+                    _add_except_pass(lines, reraise_limits=reraise_limits)
+                    continue
+                with lines.indent("try:"):
+                    lines.append(f"__result = {unpacker}")
+                _add_except_pass(lines, reraise_limits=reraise_limits)
+                with lines.indent("else:"):
+                    lines.append(f"{union_stats_name}.hit({index})")
+                    lines.append("return __result")
+        return lines
+
+    def _get_reorder_callback(
+        self,
+        spec: ValueSpec,
+        segments: list[CodeLines | list[tuple[int, str]]],
+        union_stats: UnionStats,
+        add_value_type: bool,
+    ) -> Callable[[], None]:
+        builder = spec.builder
+        globals_ = builder.globals
+        method_name = self.method_name
+        method_args = self._generate_method_args(spec)
+        cls_attrs_name = spec.cls_attrs_name
+        reraise_limits = builder.get_decode_limiter() is not None
+
+        def reorder() -> None:
+            lines = CodeLines()
+            if builder.is_nailed:
+                lines.append("@classmethod")
+            with lines.indent(f"def {method_name}({method_args}):"):
+                if add_value_type:
+                    lines.append("__value_type = type(value)")
+                lines.extend(
+                    self._render_segments(
+                        segments,
+                        union_stats=union_stats,
+                        reraise_limits=reraise_limits,
+                    )
+                )
+            lines.append(
+                f"setattr({cls_attrs_name}, '{method_name}', {method_name})"
+            )
+            for segment in segments:
+                if not isinstance(segment, CodeLines):
+                    for (position, _), (index, _) in zip(
+                        segment,
+                        sorted(
+                            segment,
+                            key=lambda item: -union_stats.hits[item[0]],
+                        ),
+                    ):
+                        union_stats.order[position] = index
+            builder.exec_code(lines.as_text(), globals_=globals_)
+
+        return reorder
 
     def _get_existing_method(self, spec: ValueSpec) -> str | None:
         if spec.owner is spec.type:
@@ -288,7 +536,7 @@ class LiteralUnpackerBuilder(AbstractUnpackerBuilder):
                 with lines.indent("try:"):
                     with lines.indent(f"if {unpacker} == {literal_value!r}:"):
                         lines.append(f"return {literal_value!r}")
-                lines.append("except Exception: pass")
+                _add_except_pass(lines, spec)
             elif isinstance(
                 literal_value, (int, str, bool, NoneType)  # type: ignore
             ):
@@ -372,7 +620,7 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
         variants_map = self._get_variants_map(spec)
         variants_attr_holder = self._get_variants_attr_holder(spec)
         variants = self._get_variant_names_iterable(spec)
-        variants_type_expr = spec.builder.get_type_name_identifier(spec.type)
+        variants_type_expr = spec.builder.get_type_ref(spec.type)
 
         if variants_attr not in variants_attr_holder.__dict__:
             setattr(variants_attr_holder, variants_attr, {})
@@ -470,7 +718,7 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
                     self._add_build_variant_unpacker(
                         spec, lines, variant_method_name, variant_method_call
                     )
-                lines.append("except Exception: pass")
+                _add_except_pass(lines, spec)
             lines.append(
                 f"raise SuitableVariantNotFoundError({variants_type_expr}) "
                 "from None"
@@ -515,7 +763,7 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
                 if not self.discriminator.field:
                     with lines.indent("try:"):
                         lines.append(f"return variant.{variant_method_call}")
-                    lines.append("except Exception: pass")
+                    _add_except_pass(lines, spec)
         else:
             spec.builder.ensure_object_imported(AttrsHolder)
             attrs = f"attrs_{random_hex()}"
@@ -533,7 +781,7 @@ class DiscriminatedUnionUnpackerBuilder(AbstractUnpackerBuilder):
             if not self.discriminator.field:
                 with lines.indent("try:"):
                     lines.append(f"return {attrs}.{variant_method_call}")
-                lines.append("except Exception: pass")
+                _add_except_pass(lines, spec)
 
     def _add_register_variant_tags(
         self, lines: CodeLines, variant_tagger_expr: str
@@ -765,6 +1013,10 @@ def unpack_final(spec: ValueSpec) -> Expression | None:
 def unpack_any(spec: ValueSpec) -> Expression | None:
     if spec.type is Any:
         return spec.expression
+    elif spec.type is object and spec.builder.get_dialect_or_config_option(
+        "dispatch_any", False
+    ):
+        return spec.expression
 
 
 @register
@@ -910,9 +1162,47 @@ def unpack_none(spec: ValueSpec) -> Expression | None:
         return TypeMatchEligibleExpression("None")
 
 
+def _get_epoch_units(spec: ValueSpec) -> int | None:
+    deserialize_option = get_overridden_deserialization_method(spec)
+    if isinstance(deserialize_option, str):
+        return EPOCH_ENGINE_UNITS.get(deserialize_option)
+    return None
+
+
+def _unpack_timedelta_from_epoch_units(
+    spec: ValueSpec, units: int
+) -> Expression:
+    method = "__datetime_timedelta"
+    spec.builder.ensure_object_imported(datetime.timedelta, method)
+    if units == 1:
+        return f"{method}(0, {spec.expression})"
+    elif units == 1_000_000:
+        return f"{method}(0, 0, {spec.expression})"
+    elif units < 1_000_000:
+        factor = 1_000_000 // units
+        return f"{method}(0, 0, {spec.expression} * {factor})"
+    else:
+        factor = units // 1_000_000
+        return f"{method}(0, 0, {spec.expression} // {factor})"
+
+
 @register
 def unpack_date_objects(spec: ValueSpec) -> Expression | None:
     if spec.origin_type in (datetime.datetime, datetime.date, datetime.time):
+        units = _get_epoch_units(spec)
+        if units is not None and spec.origin_type is datetime.datetime:
+            spec.builder.ensure_object_imported(UTC_EPOCH, "__utc_epoch")
+            td = _unpack_timedelta_from_epoch_units(spec, units)
+            return f"__utc_epoch + {td}"
+        elif units is not None and spec.origin_type is datetime.date:
+            method = "__datetime_date_fromordinal"
+            spec.builder.ensure_object_imported(
+                datetime.date.fromordinal, method
+            )
+            return (
+                f"{method}({EPOCH_ORDINAL} + "
+                f"int({spec.expression} // {86400 * units}))"
+            )
         deserialize_option = get_overridden_deserialization_method(spec)
         if deserialize_option is not None:
             if deserialize_option == "ciso8601":
@@ -954,9 +1244,9 @@ def unpack_date_objects(spec: ValueSpec) -> Expression | None:
 @register
 def unpack_timedelta(spec: ValueSpec) -> Expression | None:
     if spec.origin_type is datetime.timedelta:
-        method = "__datetime_timedelta"
-        spec.builder.ensure_object_imported(datetime.timedelta, method)
-        return f"{method}(seconds={spec.expression})"
+        return _unpack_timedelta_from_epoch_units(
+            spec, _get_epoch_units(spec) or 1
+        )
 
 
 @register
@@ -1024,7 +1314,12 @@ def unpack_tuple(spec: ValueSpec, args: tuple[type, ...]) -> Expression:
         unpacker = UnpackerRegistry.get(
             spec.copy(type=args[0], expression="value", could_be_none=True)
         )
-        return f"tuple([{unpacker} for value in {spec.expression}])"
+        limiter = spec.builder.get_decode_limiter()
+        if limiter is not None:
+            iterable = f"{limiter}.collection({spec.expression})"
+        else:
+            iterable = spec.expression
+        return f"tuple([{unpacker} for value in {iterable}])"
     else:
         arg_indexes: list[int | tuple[int, int | None]] = []
         unpack_idx: int | None = None
@@ -1144,7 +1439,7 @@ def unpack_named_tuple(spec: ValueSpec) -> Expression:
     if spec.builder.get_config().debug:
         print(f"{type_name(spec.builder.cls)}:")
         print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+    spec.builder.exec_code(lines.as_text())
     method_args = ", ".join(
         filter(None, (spec.expression, spec.builder.get_unpack_method_flags()))
     )
@@ -1218,13 +1513,103 @@ def unpack_typed_dict(spec: ValueSpec) -> Expression:
     if spec.builder.get_config().debug:
         print(f"{type_name(spec.builder.cls)}:")
         print(lines.as_text())
-    exec(lines.as_text(), spec.builder.globals, spec.builder.__dict__)
+    spec.builder.exec_code(lines.as_text())
     method_args = ", ".join(
         filter(None, (spec.expression, spec.builder.get_unpack_method_flags()))
     )
     return f"{spec.cls_attrs_name}.{method_name}({method_args})"
 
 
+def _get_array_deserialization_engine(spec: ValueSpec) -> str:
+    deserialize_option = get_overridden_deserialization_method(spec)
+    if deserialize_option is None:
+        return "as_list"
+    elif isinstance(deserialize_option, str) and deserialize_option in (
+        "as_list",
+        "as_bytes",
+    ):
+        return deserialize_option
+    raise UnsupportedDeserializationEngine(
+        field_name=spec.field_ctx.name,
+        field_type=spec.type,
+        holder_class=spec.builder.cls,
+        engine=deserialize_option,
+    )
+
+
+@register
+def unpack_array(spec: ValueSpec) -> Expression | None:
+    if spec.origin_type is not array.array:
+        return None
+    engine = _get_array_deserialization_engine(spec)
+    typecode = get_array_typecode(spec.annotations)
+    if typecode is None:
+        raise UnserializableField(
+            field_name=spec.field_ctx.name,
+            field_type=spec.type,
+            holder_class=spec.builder.cls,
+            msg="Array typecode must be specified with Annotated",
+        )
+    spec.builder.ensure_module_imported(array)
+    # array constructor calls frombytes for bytes-like initializers
+    unpacker = f"array.array({typecode!r}, {spec.expression})"
+    if engine == "as_bytes" and sys.byteorder != "little":  # pragma: no cover
+        spec.builder.ensure_object_imported(byteswapped_array)
+        return f"byteswapped_array({unpacker})"
+    return unpacker
+
+
+@register
+def unpack_numpy_array(spec: ValueSpec) -> Expression | None:
+    if not is_numpy_array(spec.origin_type):
+        return None
+    engine = _get_array_deserialization_engine(spec)
+    dtype = get_numpy_array_dtype(spec.type, spec.annotations)
+    spec.builder.ensure_module_imported(sys.modules["numpy"])
+    if engine == "as_list":
+        if dtype is None:
+            return f"numpy.asarray({spec.expression})"
+        dtype_expr = numpy_dtype_expr(spec, dtype)
+        return f"numpy.asarray({spec.expression}, dtype={dtype_expr})"
+    elif dtype is None or dtype.hasobject:
+        raise UnserializableField(
+            field_name=spec.field_ctx.name,
+            field_type=spec.type,
+            holder_class=spec.builder.cls,
+            msg="Engine as_bytes requires a fixed-size array dtype",
+        )
+    dtype_expr = numpy_dtype_expr(spec, dtype.newbyteorder("<"))
+    return f"numpy.frombuffer({spec.expression}, dtype={dtype_expr})"
+
+
+def _get_unchanged_item_types(spec: ValueSpec) -> tuple[str, ...] | None:
+    # returns names of the item types for which the item unpacker is
+    # an identity, None if items of any type need to be converted
+    spec = spec.copy(
+        type=spec.builder.get_real_type(spec.field_ctx.name, spec.type)
+    )
+    if get_overridden_deserialization_method(spec) is not None:
+        return None
+    elif spec.type is Any:
+        return ()
+    elif spec.type is object and spec.builder.get_dialect_or_config_option(
+        "dispatch_any", False
+    ):
+        return ()
+    elif is_optional(spec.type):
+        item_types = _get_unchanged_item_types(
+            spec.copy(type=not_none_type_arg(get_args(spec.type)))
+        )
+        if item_types:
+            return *item_types, "NoneType"
+        return item_types
+    elif spec.type in (int, float, bool):
+        return (spec.type.__name__,)
+    elif spec.type is str and spec.builder.get_decode_limiter() is None:
+        return ("str",)
+    return None
+
+
 @register
 def unpack_collection(spec: ValueSpec) -> Expression | None:
     if not issubclass(spec.origin_type, Collection):
@@ -1233,6 +1618,19 @@ def unpack_collection(spec: ValueSpec) -> Expression | None:
         return None
 
     args = get_args(spec.type)
+    limiter = spec.builder.get_decode_limiter()
+
+    def inner_spec(arg_num: int = 0, v_name: str = "value") -> ValueSpec:
+        if args and len(args) > arg_num:
+            type_arg: Any = args[arg_num]
+        else:
+            type_arg = Any
+        return spec.copy(
+            type=type_arg,
+            expression=v_name,
+            could_be_none=True,
+            field_ctx=spec.field_ctx.copy(metadata={}),
+        )
 
     def inner_expr(
         arg_num: int = 0, v_name: str = "value", v_type: type | None = None
@@ -1242,35 +1640,67 @@ def unpack_collection(spec: ValueSpec) -> Expression | None:
                 spec.copy(type=v_type, expression=v_name)
             )
         else:
-            if args and len(args) > arg_num:
-                type_arg: Any = args[arg_num]
-            else:
-                type_arg = Any
-            return UnpackerRegistry.get(
-                spec.copy(
-                    type=type_arg,
-                    expression=v_name,
-                    could_be_none=True,
-                    field_ctx=spec.field_ctx.copy(metadata={}),
+            return UnpackerRegistry.get(inner_spec(arg_num, v_name))
+
+    def checked(expr: Expression, kind: str = "collection") -> Expression:
+        if limiter is None:
+            return expr
+        return f"{limiter}.{kind}({expr})"
+
+    def no_copy_expr(
+        collection_type: type,
+        copy_expr: Callable[[Expression], Expression],
+        *items: tuple[ValueSpec, str],
+    ) -> Expression:
+        if collection_type not in spec.no_copy_unpack_collections:
+            return copy_expr(checked(spec.expression))
+        conditions = [
+            f"type({checked(spec.expression)}) is {collection_type.__name__}"
+        ]
+        for item_spec, iterable in items:
+            item_types = _get_unchanged_item_types(item_spec)
+            if item_types is None:
+                return copy_expr(checked(spec.expression))
+            elif item_types and not spec.trust_no_copy_unpack_collections:
+                if "NoneType" in item_types:
+                    spec.builder.ensure_object_imported(NoneType, "NoneType")
+                conditions.append(
+                    f"{{{', '.join(item_types)}}}"
+                    f".issuperset(map(type, {iterable}))"
                 )
-            )
+        return (
+            f"({spec.expression} if {' and '.join(conditions)} "
+            f"else {copy_expr(spec.expression)})"
+        )
 
     if issubclass(spec.origin_type, typing.ByteString):  # type: ignore
         if spec.origin_type is bytes:
             spec.builder.ensure_object_imported(decodebytes)
-            return f"decodebytes({spec.expression}.encode())"
+            return (
+                f"decodebytes({checked(spec.expression, 'string')}.encode())"
+            )
         elif spec.origin_type is bytearray:
             spec.builder.ensure_object_imported(decodebytes)
-            return f"bytearray(decodebytes({spec.expression}.encode()))"
+            return (
+                "bytearray(decodebytes("
+                f"{checked(spec.expression, 'string')}.encode()))"
+            )
     elif issubclass(spec.origin_type, str):
+        if limiter is not None:
+            return f"{limiter}.string(str({spec.expression}))"
         return TypeMatchEligibleExpression(f"str({spec.expression})")
     elif ensure_generic_collection_subclass(spec, list):
-        return f"[{inner_expr()} for value in {spec.expression}]"
+        ie = inner_expr()
+        return no_copy_expr(
+            list,
+            lambda expr: f"[{ie} for value in {expr}]",
+            (inner_spec(), spec.expression),
+        )
     elif ensure_generic_collection_subclass(spec, collections.deque):
         spec.builder.ensure_module_imported(collections)
         return (
             f"collections.deque([{inner_expr()} "
-            f"for value in {spec.expression}])"
+            f"for value in {checked(spec.expression)}])"
         )
     elif issubclass(spec.origin_type, tuple):  # type: ignore
         if is_named_tuple(spec.origin_type):
@@ -1278,35 +1708,40 @@ def unpack_collection(spec: ValueSpec) -> Expression | None:
         elif ensure_generic_collection(spec):
             return unpack_tuple(spec, args)
     elif ensure_generic_collection_subclass(spec, frozenset):
-        return f"frozenset([{inner_expr()} for value in {spec.expression}])"
+        return (
+            f"frozenset([{inner_expr()} "
+            f"for value in {checked(spec.expression)}])"
+        )
     elif ensure_generic_collection_subclass(spec, Set):
-        return f"set([{inner_expr()} for value in {spec.expression}])"
+        return f"set([{inner_expr()} for value in {checked(spec.expression)}])"
     elif ensure_generic_mapping(spec, args, collections.ChainMap):
         spec.builder.ensure_module_imported(collections)
         return (
             f'collections.ChainMap(*[{{{inner_expr(0, "key")}:{inner_expr(1)} '
-            f"for key, value in m.items()}} for m in {spec.expression}])"
+            f"for key, value in {checked('m')}.items()}} "
+            f"for m in {checked(spec.expression)}])"
         )
     elif ensure_generic_mapping(spec, args, collections.OrderedDict):
         spec.builder.ensure_module_imported(collections)
         return (
             f'collections.OrderedDict({{{inner_expr(0, "key")}: '
-            f"{inner_expr(1)} for key, value in {spec.expression}.items()}})"
+            f"{inner_expr(1)} "
+            f"for key, value in {checked(spec.expression)}.items()}})"
         )
     elif ensure_generic_mapping(spec, args, collections.defaultdict):
         spec.builder.ensure_module_imported(collections)
         default_type = type_name(args[1] if args else None)
         return (
             f"collections.defaultdict({default_type}, "
-            f"{{{inner_expr(0, 'key')}: "
-            f"{inner_expr(1)} for key, value in {spec.expression}.items()}})"
+            f"{{{inner_expr(0, 'key')}: {inner_expr(1)} "
+            f"for key, value in {checked(spec.expression)}.items()}})"
         )
     elif ensure_generic_mapping(spec, args, collections.Counter):
         spec.builder.ensure_module_imported(collections)
         return (
             f'collections.Counter({{{inner_expr(0, "key")}: '
             f"{inner_expr(1, v_type=int)} "
-            f"for key, value in {spec.expression}.items()}})"
+            f"for key, value in {checked(spec.expression)}.items()}})"
         )
     elif is_typed_dict(spec.origin_type):
         return unpack_typed_dict(spec)
@@ -1314,15 +1749,24 @@ def unpack_collection(spec: ValueSpec) -> Expression | None:
         spec.builder.ensure_module_imported(types)
         return (
             f'types.MappingProxyType({{{inner_expr(0, "key")}: {inner_expr(1)}'
-            f" for key, value in {spec.expression}.items()}})"
+            f" for key, value in {checked(spec.expression)}.items()}})"
         )
     elif ensure_generic_mapping(spec, args, Mapping):
-        return (
-            f'{{{inner_expr(0, "key")}: {inner_expr(1)} '
-            f"for key, value in {spec.expression}.items()}}"
+        ke = inner_expr(0, "key")
+        ve = inner_expr(1)
+        return no_copy_expr(
+            dict,
+            lambda expr: f"{{{ke}: {ve} for key, value in {expr}.items()}}",
+            (inner_spec(0, "key"), spec.expression),
+            (inner_spec(1), f"{spec.expression}.values()"),
         )
     elif ensure_generic_collection_subclass(spec, Sequence):
-        return f"[{inner_expr()} for value in {spec.expression}]"
+        ie = inner_expr()
+        return no_copy_expr(
+            list,
+            lambda expr: f"[{ie} for value in {expr}]",
+            (inner_spec(), spec.expression),
+        )
 
 
 @register
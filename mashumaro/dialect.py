@@ -5,7 +5,7 @@ from typing import Any, Type, cast
 from typing_extensions import Literal
 
 from mashumaro.core.const import Sentinel
-from mashumaro.types import SerializationStrategy
+from mashumaro.types import DecodeLimits, SerializationStrategy
 
 __all__ = ["Dialect"]
 
@@ -24,6 +24,16 @@ class Dialect:
     no_copy_collections: Sequence[Any] | Literal[Sentinel.MISSING] = (
         Sentinel.MISSING
     )
+    no_copy_unpack_collections: Sequence[Any] | Literal[Sentinel.MISSING] = (
+        Sentinel.MISSING
+    )
+    trust_no_copy_unpack_collections: bool | Literal[Sentinel.MISSING] = (
+        Sentinel.MISSING
+    )
+    dispatch_any: bool | Literal[Sentinel.MISSING] = Sentinel.MISSING
+    decode_limits: DecodeLimits | None | Literal[Sentinel.MISSING] = (
+        Sentinel.MISSING
+    )
 
     @classmethod
     def merge(cls, other: Type["Dialect"]) -> Type["Dialect"]:
@@ -50,7 +60,15 @@ class Dialect:
                 )
         new_dialect = cast(Type[Dialect], new_class("Dialect", (Dialect,)))
         new_dialect.serialization_strategy = serialization_strategy
-        for key in ("omit_none", "omit_default", "no_copy_collections"):
+        for key in (
+            "omit_none",
+            "omit_default",
+            "no_copy_collections",
+            "no_copy_unpack_collections",
+            "trust_no_copy_unpack_collections",
+            "dispatch_any",
+            "decode_limits",
+        ):
             if (others_value := getattr(other, key)) is not Sentinel.MISSING:
                 setattr(new_dialect, key, others_value)
             else:
@@ -142,6 +142,19 @@ class InvalidFieldValue(ValueError):
         return s
 
 
+class DecodeLimitExceeded(ValueError):
+    def __init__(self, limit_name: str, limit: int, size: int):
+        self.limit_name = limit_name
+        self.limit = limit
+        self.size = size
+
+    def __str__(self) -> str:
+        return (
+            f"Input data exceeds {self.limit_name}={self.limit} "
+            f"with size {self.size}"
+        )
+
+
 class MissingDiscriminatorError(LookupError):
     def __init__(self, field_name: str):
         self.field_name = field_name
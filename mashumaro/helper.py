@@ -1,27 +1,47 @@
-from collections.abc import Callable
-from typing import Any, TypeVar
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any, Generic, Type, TypeVar
 
 from typing_extensions import Literal
 
 from mashumaro.types import SerializationStrategy
 
-__all__ = ["field_options", "pass_through"]
+if TYPE_CHECKING:  # pragma: no cover
+    from mashumaro.mixins.dict import DataClassDictMixin
+
+__all__ = ["field_options", "pass_through", "ObjectPool"]
 
 
 NamedTupleDeserializationEngine = Literal["as_dict", "as_list"]
 DateTimeDeserializationEngine = Literal["ciso8601", "pendulum"]
+ArrayDeserializationEngine = Literal["as_list", "as_bytes"]
+EpochDeserializationEngine = Literal[
+    "epoch_s", "epoch_ms", "epoch_us", "epoch_ns"
+]
 AnyDeserializationEngine = Literal[
-    NamedTupleDeserializationEngine, DateTimeDeserializationEngine
+    NamedTupleDeserializationEngine,
+    DateTimeDeserializationEngine,
+    ArrayDeserializationEngine,
+    EpochDeserializationEngine,
 ]
 
 NamedTupleSerializationEngine = Literal["as_dict", "as_list"]
 OmitSerializationEngine = Literal["omit"]
+ArraySerializationEngine = Literal["as_list", "as_bytes"]
+EpochSerializationEngine = Literal[
+    "epoch_s", "epoch_ms", "epoch_us", "epoch_ns"
+]
 AnySerializationEngine = (
-    NamedTupleSerializationEngine | OmitSerializationEngine
+    NamedTupleSerializationEngine
+    | OmitSerializationEngine
+    | ArraySerializationEngine
+    | EpochSerializationEngine
 )
 
 
 T = TypeVar("T")
+DataClassDictMixinT = TypeVar(
+    "DataClassDictMixinT", bound="DataClassDictMixin"
+)
 
 
 def field_options(
@@ -52,3 +72,26 @@ class _PassThrough(SerializationStrategy):
 
 
 pass_through = _PassThrough()
+
+
+class ObjectPool(Generic[DataClassDictMixinT]):
+    """Reuses released instances by updating them in place."""
+
+    def __init__(self, cls: Type[DataClassDictMixinT], maxsize: int = 1024):
+        self.cls = cls
+        self.maxsize = maxsize
+        self._free: list[DataClassDictMixinT] = []
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self, d: Mapping) -> DataClassDictMixinT:
+        if self._free:
+            obj = self._free.pop()
+            obj.update_from_dict(d, reset_missing=True)
+            return obj
+        return self.cls.from_dict(d)
+
+    def release(self, obj: DataClassDictMixinT) -> None:
+        if len(self._free) < self.maxsize:
+            self._free.append(obj)
@@ -0,0 +1,243 @@
+import atexit
+import itertools
+import os
+import sys
+import weakref
+from collections.abc import Callable
+from typing import Any, TypedDict
+
+__all__ = [
+    "CallStats",
+    "CallStatsSnapshot",
+    "stats",
+    "reset_stats",
+    "CompileStats",
+    "CompileReportEntry",
+    "compile_report",
+    "format_compile_report",
+    "COMPILE_REPORT_ENV_VAR",
+    "UnionStats",
+    "UnionStatsSnapshot",
+    "union_stats",
+]
+
+
+COMPILE_REPORT_ENV_VAR = "MASHUMARO_COMPILE_REPORT"
+
+
+class CallStatsSnapshot(TypedDict):
+    calls: int
+    failures: int
+    total_time: float
+
+
+class CallStats:
+    __slots__ = ("calls", "failures", "total_time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.total_time = 0.0
+
+    def snapshot(self) -> CallStatsSnapshot:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "total_time": self.total_time,
+        }
+
+
+# the statistics are dropped together with the classes, except for types
+# that don't support weak references, such as "int | str"
+_registry: "weakref.WeakKeyDictionary[Any, dict[str, CallStats]]" = (
+    weakref.WeakKeyDictionary()
+)
+_strong_registry: dict[Any, dict[str, CallStats]] = {}
+
+
+def get_call_stats(cls: Any, method: str) -> CallStats:
+    try:
+        class_stats = _registry.get(cls)
+        if class_stats is None:
+            class_stats = _registry[cls] = {}
+    except TypeError:
+        class_stats = _strong_registry.setdefault(cls, {})
+    call_stats = class_stats.get(method)
+    if call_stats is None:
+        call_stats = class_stats[method] = CallStats()
+    return call_stats
+
+
+def _iter_call_stats() -> list[tuple[Any, dict[str, CallStats]]]:
+    return list(_registry.items()) + list(_strong_registry.items())
+
+
+def stats() -> dict[Any, dict[str, CallStatsSnapshot]]:
+    return {
+        cls: {
+            method: call_stats.snapshot()
+            for method, call_stats in list(class_stats.items())
+        }
+        for cls, class_stats in _iter_call_stats()
+    }
+
+
+def reset_stats() -> None:
+    for _, class_stats in _iter_call_stats():
+        for call_stats in list(class_stats.values()):
+            call_stats.__init__()  # type: ignore[misc]
+
+
+class CompileReportEntry(TypedDict):
+    name: str
+    compilations: int
+    resolution_time: float
+    generation_time: float
+    exec_time: float
+    total_time: float
+    source_size: int
+    functions: int
+
+
+class CompileStats:
+    __slots__ = (
+        "compilations",
+        "resolution_time",
+        "generation_time",
+        "exec_time",
+        "source_size",
+        "functions",
+    )
+
+    def __init__(self) -> None:
+        self.compilations = 0
+        self.resolution_time = 0.0
+        self.generation_time = 0.0
+        self.exec_time = 0.0
+        self.source_size = 0
+        self.functions = 0
+
+    def snapshot(self, name: str) -> CompileReportEntry:
+        return {
+            "name": name,
+            "compilations": self.compilations,
+            "resolution_time": self.resolution_time,
+            "generation_time": self.generation_time,
+            "exec_time": self.exec_time,
+            "total_time": (
+                self.resolution_time + self.generation_time + self.exec_time
+            ),
+            "source_size": self.source_size,
+            "functions": self.functions,
+        }
+
+
+_compile_registry: dict[str, CompileStats] = {}
+
+
+def record_compilation(
+    name: str,
+    resolution_time: float,
+    generation_time: float,
+    exec_time: float,
+    source: str,
+) -> None:
+    compile_stats = _compile_registry.get(name)
+    if compile_stats is None:
+        compile_stats = _compile_registry[name] = CompileStats()
+    compile_stats.compilations += 1
+    compile_stats.resolution_time += resolution_time
+    compile_stats.generation_time += generation_time
+    compile_stats.exec_time += exec_time
+    compile_stats.source_size += len(source)
+    compile_stats.functions += sum(
+        1 for line in source.splitlines() if line.lstrip().startswith("def ")
+    )
+
+
+def compile_report() -> list[CompileReportEntry]:
+    entries = [
+        compile_stats.snapshot(name)
+        for name, compile_stats in list(_compile_registry.items())
+    ]
+    entries.sort(key=lambda entry: entry["total_time"], reverse=True)
+    return entries
+
+
+def format_compile_report(entries: list[CompileReportEntry]) -> str:
+    lines = [
+        f"{'total, ms':>10} {'resolve':>10} {'generate':>10} {'exec':>10} "
+        f"{'count':>6} {'size':>8} {'defs':>5}  name"
+    ]
+    for entry in entries:
+        lines.append(
+            f"{entry['total_time'] * 1000:>10.3f} "
+            f"{entry['resolution_time'] * 1000:>10.3f} "
+            f"{entry['generation_time'] * 1000:>10.3f} "
+            f"{entry['exec_time'] * 1000:>10.3f} "
+            f"{entry['compilations']:>6} "
+            f"{entry['source_size']:>8} "
+            f"{entry['functions']:>5}  "
+            f"{entry['name']}"
+        )
+    return "\n".join(lines)
+
+
+def _dump_compile_report() -> None:  # pragma: no cover
+    print(format_compile_report(compile_report()), file=sys.stderr)
+
+
+if os.environ.get(COMPILE_REPORT_ENV_VAR):  # pragma: no cover
+    atexit.register(_dump_compile_report)
+
+
+class UnionStatsSnapshot(TypedDict):
+    name: str
+    hits: dict[str, int]
+    order: list[str]
+    reordered: bool
+
+
+class UnionStats:
+    """Counts successful union variants to reorder them after warm-up."""
+
+    def __init__(self, name: str, variants: list[str], warmup: int):
+        self.name = name
+        self.variants = variants
+        self.warmup = warmup
+        self.hits = [0] * len(variants)
+        self.order = list(range(len(variants)))
+        self.calls = 0
+        self.reordered = False
+        self.on_warmed_up: Callable[[], None] | None = None
+
+    def hit(self, index: int) -> None:
+        self.hits[index] += 1
+        self.calls += 1
+        if self.calls >= self.warmup and not self.reordered:
+            self.reordered = True
+            if self.on_warmed_up is not None:
+                self.on_warmed_up()
+
+    def snapshot(self) -> UnionStatsSnapshot:
+        return {
+            "name": self.name,
+            "hits": dict(zip(self.variants, self.hits)),
+            "order": [self.variants[index] for index in self.order],
+            "reordered": self.reordered,
+        }
+
+
+# the statistics are held by the generated unpackers that update them
+_union_registry: "weakref.WeakValueDictionary[int, UnionStats]" = (
+    weakref.WeakValueDictionary()
+)
+_union_ids = itertools.count()
+
+
+def register_union_stats(stats_: UnionStats) -> None:
+    _union_registry[next(_union_ids)] = stats_
+
+
+def union_stats() -> list[UnionStatsSnapshot]:
+    return [stats_.snapshot() for stats_ in list(_union_registry.values())]
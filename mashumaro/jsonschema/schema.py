@@ -1,3 +1,4 @@
+import array
 import datetime
 import inspect
 import ipaddress
@@ -31,8 +32,10 @@ from mashumaro.core.const import PY_311_MIN
 from mashumaro.core.meta.code.builder import CodeBuilder
 from mashumaro.core.meta.helpers import (
     get_args,
+    get_array_typecode,
     get_function_return_annotation,
     get_literal_values,
+    get_numpy_array_dtype,
     get_type_origin,
     is_annotated,
     is_generic,
@@ -40,6 +43,7 @@ from mashumaro.core.meta.helpers import (
     is_named_tuple,
     is_new_type,
     is_not_required,
+    is_numpy_array,
     is_readonly,
     is_required,
     is_self,
@@ -54,7 +58,11 @@ from mashumaro.core.meta.helpers import (
     resolve_type_params,
     type_name,
 )
-from mashumaro.core.meta.types.common import NoneType, clean_id
+from mashumaro.core.meta.types.common import (
+    EPOCH_ENGINE_UNITS,
+    NoneType,
+    clean_id,
+)
 from mashumaro.helper import pass_through
 from mashumaro.jsonschema.annotations import (
     Annotation,
@@ -594,6 +602,14 @@ def on_none(instance: Instance, ctx: Context) -> JSONSchema | None:
         return JSONSchema(type=JSONSchemaInstanceType.NULL)
 
 
+def _get_epoch_engine(instance: Instance) -> str | None:
+    serialize_option = instance.get_overridden_serialization_method()
+    if isinstance(serialize_option, str):
+        if serialize_option in EPOCH_ENGINE_UNITS:
+            return serialize_option
+    return None
+
+
 @register
 def on_date_objects(instance: Instance, ctx: Context) -> JSONSchema | None:
     if instance.origin_type in (
@@ -601,6 +617,14 @@ def on_date_objects(instance: Instance, ctx: Context) -> JSONSchema | None:
         datetime.date,
         datetime.time,
     ):
+        epoch_engine = _get_epoch_engine(instance)
+        if epoch_engine and instance.origin_type is not datetime.time:
+            if (
+                epoch_engine == "epoch_s"
+                and instance.origin_type is datetime.datetime
+            ):
+                return JSONSchema(type=JSONSchemaInstanceType.NUMBER)
+            return JSONSchema(type=JSONSchemaInstanceType.INTEGER)
         return JSONSchema(
             type=JSONSchemaInstanceType.STRING,
             format=DATETIME_FORMATS[instance.origin_type],
@@ -610,6 +634,9 @@ def on_date_objects(instance: Instance, ctx: Context) -> JSONSchema | None:
 @register
 def on_timedelta(instance: Instance, ctx: Context) -> JSONSchema | None:
     if instance.origin_type is datetime.timedelta:
+        epoch_engine = _get_epoch_engine(instance)
+        if epoch_engine and epoch_engine != "epoch_s":
+            return JSONSchema(type=JSONSchemaInstanceType.INTEGER)
         return JSONSchema(
             type=JSONSchemaInstanceType.NUMBER,
             format=JSONSchemaInstanceFormatExtension.TIMEDELTA,
@@ -841,6 +868,46 @@ def apply_object_constraints(
     return schema
 
 
+def _array_items_schema(kind: str) -> JSONSchema | None:
+    if kind in "iu":
+        return JSONSchema(type=JSONSchemaInstanceType.INTEGER)
+    elif kind == "f":
+        return JSONSchema(type=JSONSchemaInstanceType.NUMBER)
+    elif kind == "b":
+        return JSONSchema(type=JSONSchemaInstanceType.BOOLEAN)
+    elif kind in "UwS":
+        return JSONSchema(type=JSONSchemaInstanceType.STRING)
+    return None
+
+
+@register
+def on_array(instance: Instance, ctx: Context) -> JSONSchema | None:
+    if instance.origin_type is not array.array:
+        return None
+    typecode = get_array_typecode(instance.annotations)
+    if typecode in ("f", "d"):
+        items = _array_items_schema("f")
+    elif typecode in ("u", "w"):
+        items = _array_items_schema("U")
+    elif typecode is not None:
+        items = _array_items_schema("i")
+    else:
+        items = None
+    return apply_array_constraints(instance, JSONArraySchema(items=items))
+
+
+@register
+def on_numpy_array(instance: Instance, ctx: Context) -> JSONSchema | None:
+    if not is_numpy_array(instance.origin_type):
+        return None
+    dtype = get_numpy_array_dtype(instance.type, instance.annotations)
+    if dtype is not None and dtype.fields is None:
+        items = _array_items_schema(dtype.kind)
+    else:
+        items = None
+    return apply_array_constraints(instance, JSONArraySchema(items=items))
+
+
 @register
 def on_collection(instance: Instance, ctx: Context) -> JSONSchema | None:
     if not issubclass(instance.origin_type, Collection):
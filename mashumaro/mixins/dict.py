@@ -2,8 +2,11 @@ from collections.abc import Mapping
 from typing import Any, Type, TypeVar, final
 
 from mashumaro.core.meta.mixin import (
+    compile_mixin_cloner,
+    compile_mixin_object_unpacker,
     compile_mixin_packer,
     compile_mixin_unpacker,
+    compile_mixin_updater,
 )
 
 __all__ = ["DataClassDictMixin"]
@@ -25,6 +28,26 @@ class DataClassDictMixin:
             if builder_params:
                 compile_mixin_unpacker(cls, **builder_params["unpacker"])
                 compile_mixin_packer(cls, **builder_params["packer"])
+        update_from_dict = cls.update_from_dict
+        if (
+            update_from_dict is DataClassDictMixin.update_from_dict
+            or update_from_dict.__name__ == "__mashumaro_update_from_dict__"
+        ):
+            # the inherited method doesn't know about fields of this class,
+            # and the parent can compile its own one after this class is
+            # created, so only methods defined by users are inherited
+            cls.update_from_dict = (  # type: ignore[method-assign]
+                DataClassDictMixin.update_from_dict
+            )
+        # the compiled method of a parent class can appear after this class
+        # is created, so each class gets its own lazily compiled one
+        setattr(cls, "from_object", DataClassDictMixin.__dict__["from_object"])
+        setattr(cls, "clone", DataClassDictMixin.__dict__["clone"])
+        setattr(
+            cls,
+            "__mashumaro_prepare_update__",
+            DataClassDictMixin.__dict__["__mashumaro_prepare_update__"],
+        )
 
     @final
     def to_dict(
@@ -48,6 +71,33 @@ class DataClassDictMixin:
         **kwargs: Any,
     ) -> T: ...
 
+    def update_from_dict(
+        self: T, d: Mapping, *, reset_missing: bool = False
+    ) -> None:
+        if "__mashumaro_update_from_dict__" not in self.__class__.__dict__:
+            compile_mixin_updater(self.__class__)
+        self.__mashumaro_update_from_dict__(  # type: ignore[attr-defined]
+            d, reset_missing=reset_missing
+        )
+
+    def __mashumaro_prepare_update__(
+        self, d: Mapping, reset_missing: bool
+    ) -> tuple[Any, ...]:
+        # used to update nested objects before update_from_dict is called
+        compile_mixin_updater(self.__class__)
+        return self.__mashumaro_prepare_update__(d, reset_missing)
+
+    @final
+    @classmethod
+    def from_object(cls: Type[T], obj: Any) -> T:
+        compile_mixin_object_unpacker(cls)
+        return cls.from_object(obj)
+
+    @final
+    def clone(self: T) -> T:
+        compile_mixin_cloner(self.__class__)
+        return self.clone()
+
     @classmethod
     def __pre_deserialize__(
         cls: Type[T], d: dict[Any, Any]
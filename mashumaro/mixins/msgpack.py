@@ -1,14 +1,26 @@
+import array
+import datetime
+import decimal
+import ipaddress
+import uuid
 from collections.abc import Callable
+from decimal import Decimal
 from typing import Any, Type, TypeVar, final
 
 import msgpack
 
+from mashumaro.core.helpers import EPOCH, UTC_EPOCH
 from mashumaro.dialect import Dialect
 from mashumaro.helper import pass_through
 from mashumaro.mixins.dict import DataClassDictMixin
 
 T = TypeVar("T", bound="DataClassMessagePackMixin")
 
+DECIMAL_EXT_TYPE = 1
+_EXACT_DECIMAL_CONTEXT = decimal.Context(
+    prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+)
+
 
 EncodedData = bytes
 Encoder = Callable[[Any], EncodedData]
@@ -17,9 +29,116 @@ Decoder = Callable[[EncodedData], dict[Any, Any]]
 
 class MessagePackDialect(Dialect):
     no_copy_collections = (list, dict)
+    no_copy_unpack_collections = (list, dict)
     serialization_strategy = {
         bytes: pass_through,
         bytearray: {"deserialize": bytearray, "serialize": pass_through},
+        array.array: {"serialize": "as_bytes", "deserialize": "as_bytes"},
+    }
+
+
+def _pack_datetime(value: datetime.datetime) -> msgpack.Timestamp:
+    delta = value - (EPOCH if value.tzinfo is None else UTC_EPOCH)
+    return msgpack.Timestamp(
+        delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+    )
+
+
+def _unpack_datetime(value: msgpack.Timestamp) -> datetime.datetime:
+    return UTC_EPOCH + datetime.timedelta(
+        0, value.seconds, value.nanoseconds // 1000
+    )
+
+
+def _pack_uuid(value: uuid.UUID) -> bytes:
+    return value.bytes
+
+
+def _unpack_uuid(value: bytes) -> uuid.UUID:
+    return uuid.UUID(bytes=value)
+
+
+def _pack_ip_address(
+    value: ipaddress.IPv4Address | ipaddress.IPv6Address,
+) -> bytes:
+    return value.packed
+
+
+def _pack_ip_network(
+    value: ipaddress.IPv4Network | ipaddress.IPv6Network,
+) -> bytes:
+    return value.network_address.packed + bytes((value.prefixlen,))
+
+
+def _pack_ip_interface(
+    value: ipaddress.IPv4Interface | ipaddress.IPv6Interface,
+) -> bytes:
+    return value.packed + bytes((value.network.prefixlen,))
+
+
+def _ip_network_unpacker(cls: Type) -> Callable[[bytes], Any]:
+    def unpack(value: bytes) -> Any:
+        return cls((value[:-1], value[-1]))
+
+    return unpack
+
+
+def _pack_decimal(value: Decimal) -> msgpack.ExtType:
+    # the first byte is the exponent, the rest is the signed coefficient,
+    # other values are stored as strings after the reserved byte 0x80
+    exponent = value.as_tuple().exponent
+    if isinstance(exponent, int) and -128 < exponent < 128 and value:
+        coefficient = int(value.scaleb(-exponent, _EXACT_DECIMAL_CONTEXT))
+        data = exponent.to_bytes(1, "big", signed=True) + coefficient.to_bytes(
+            (coefficient.bit_length() + 8) // 8, "big", signed=True
+        )
+    else:
+        data = b"\x80" + str(value).encode()
+    return msgpack.ExtType(DECIMAL_EXT_TYPE, data)
+
+
+def _unpack_decimal(value: msgpack.ExtType) -> Decimal:
+    data = value.data
+    if data[0] == 0x80:
+        return Decimal(data[1:].decode())
+    return Decimal(int.from_bytes(data[1:], "big", signed=True)).scaleb(
+        int.from_bytes(data[:1], "big", signed=True), _EXACT_DECIMAL_CONTEXT
+    )
+
+
+class CompactMessagePackDialect(MessagePackDialect):
+    serialization_strategy = {
+        **MessagePackDialect.serialization_strategy,
+        datetime.datetime: {
+            "serialize": _pack_datetime,
+            "deserialize": _unpack_datetime,
+        },
+        uuid.UUID: {"serialize": _pack_uuid, "deserialize": _unpack_uuid},
+        ipaddress.IPv4Address: {
+            "serialize": _pack_ip_address,
+            "deserialize": ipaddress.IPv4Address,
+        },
+        ipaddress.IPv6Address: {
+            "serialize": _pack_ip_address,
+            "deserialize": ipaddress.IPv6Address,
+        },
+        ipaddress.IPv4Network: {
+            "serialize": _pack_ip_network,
+            "deserialize": _ip_network_unpacker(ipaddress.IPv4Network),
+        },
+        ipaddress.IPv6Network: {
+            "serialize": _pack_ip_network,
+            "deserialize": _ip_network_unpacker(ipaddress.IPv6Network),
+        },
+        ipaddress.IPv4Interface: {
+            "serialize": _pack_ip_interface,
+            "deserialize": _ip_network_unpacker(ipaddress.IPv4Interface),
+        },
+        ipaddress.IPv6Interface: {
+            "serialize": _pack_ip_interface,
+            "deserialize": _ip_network_unpacker(ipaddress.IPv6Interface),
+        },
+        Decimal: {"serialize": _pack_decimal, "deserialize": _unpack_decimal},
     }
 
 
@@ -20,6 +20,7 @@ Decoder = Callable[[EncodedData], dict[Any, Any]]
 
 class OrjsonDialect(Dialect):
     no_copy_collections = (list, dict)
+    no_copy_unpack_collections = (list, dict)
     serialization_strategy = {
         datetime: {"serialize": pass_through},
         date: {"serialize": pass_through},
@@ -13,6 +13,7 @@ __all__ = [
     "SerializationStrategy",
     "RoundedDecimal",
     "Discriminator",
+    "DecodeLimits",
     "Alias",
 ]
 
@@ -100,6 +101,7 @@ class Discriminator:
     include_supertypes: bool = False
     include_subtypes: bool = False
     variant_tagger_fn: Callable[[Any], Any] | None = None
+    serialize_tag: bool = False
 
     def __post_init__(self) -> None:
         if not self.include_supertypes and not self.include_subtypes:
@@ -109,6 +111,14 @@ class Discriminator:
             )
 
 
+@dataclass(frozen=True)
+class DecodeLimits:
+    max_depth: int | None = None
+    max_collection_length: int | None = None
+    max_string_length: int | None = None
+    max_total_items: int | None = None
+
+
 class Alias:
     def __init__(self, name: str, /):
         self.name = name
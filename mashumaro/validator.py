@@ -0,0 +1,405 @@
+from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
+from dataclasses import MISSING, is_dataclass
+from enum import Enum
+from itertools import count
+from typing import Any, Generic, Type, TypeVar, final, overload
+
+from mashumaro.codecs._builder import CodecCodeBuilder
+from mashumaro.core.const import Sentinel
+from mashumaro.core.meta.code.builder import __PRE_DESERIALIZE__
+from mashumaro.core.meta.code.lines import CodeLines
+from mashumaro.core.meta.helpers import (
+    get_args,
+    get_class_that_defines_method,
+    is_dataclass_dict_mixin,
+    is_optional,
+    is_self,
+    not_none_type_arg,
+    type_name,
+)
+from mashumaro.core.meta.types.common import (
+    FieldContext,
+    NoneType,
+    ValueSpec,
+    clean_id,
+)
+from mashumaro.core.meta.types.unpack import UnpackerRegistry
+from mashumaro.dialect import Dialect
+from mashumaro.exceptions import (
+    ExtraKeysError,
+    InvalidFieldValue,
+    MissingField,
+)
+from mashumaro.types import GenericSerializableType, SerializableType
+
+__all__ = ["Validator", "validate"]
+
+
+T = TypeVar("T")
+
+VALIDATE_METHOD = "__mashumaro_validate__"
+SEQUENCE_TYPES = (list, Sequence, MutableSequence)
+MAPPING_TYPES = (dict, Mapping, MutableMapping)
+
+
+def add_path_prefix(
+    exc: MissingField | InvalidFieldValue, prefix: str
+) -> None:
+    name = exc.field_name
+    if name and not name.startswith("["):
+        prefix += "."
+    exc.field_name = prefix + name
+
+
+class ValidatorCodeBuilder(CodecCodeBuilder):
+    def reset(self) -> None:
+        super().reset()
+        self._var_ids = count()
+        self.ensure_object_imported(add_path_prefix)
+        self.ensure_object_imported(ExtraKeysError)
+        self.ensure_object_imported(InvalidFieldValue)
+        self.ensure_object_imported(MissingField)
+        self.ensure_object_imported(Sentinel.MISSING, "MISSING")
+
+    def add_validate_method(
+        self, shape_type: Type, validator_obj: Any
+    ) -> None:
+        self.reset()
+        self.compile_report_name = f"{type_name(shape_type)} validator"
+        holder = clean_id(f"holder_{type_name(shape_type)}")
+        self.ensure_object_imported(shape_type, holder)
+        with self.indent("def validate(value):"):
+            limits = self.get_dialect_or_config_option("decode_limits", None)
+            if limits is not None and limits.max_total_items is not None:
+                self.add_line(f"{self.get_decode_limiter()}.start()")
+            if shape_type is Any or shape_type is NoneType:
+                self.add_line("return")
+            elif is_optional(shape_type):
+                with self.indent("if value is not None:"):
+                    self._add_check(
+                        not_none_type_arg(get_args(shape_type)),
+                        "value",
+                        holder,
+                    )
+            else:
+                self._add_check(shape_type, "value", holder)
+            self.add_line("return")
+        self.add_line("setattr(validator_obj, 'validate', validate)")
+        self.ensure_object_imported(validator_obj, "validator_obj")
+        self.compile()
+
+    def add_dataclass_validate_method(self) -> None:
+        self.reset()
+        self.compile_report_name = f"{type_name(self.cls)} validator"
+        self.ensure_object_imported(self.attrs, "_cls")
+        self.ensure_object_imported(self.cls, "cls")
+        config = self.get_config()
+        fields = []
+        for fname, ftype in self.get_field_types(include_extras=True).items():
+            field = self.dataclass_fields.get(fname)
+            if field is None or field.init:
+                fields.append(
+                    (fname, ftype, self.get_field_keys(fname, ftype))
+                )
+        with self.indent(f"def {VALIDATE_METHOD}(d):"):
+            with self._add_decode_depth_lines():
+                with self.indent("try:"):
+                    if fields and config.forbid_extra_keys:
+                        self._add_extra_keys_check(
+                            [
+                                (f, k[0] if k[0] != f else None, t)
+                                for f, t, k in fields
+                            ]
+                        )
+                    for fname, ftype, keys in fields:
+                        self._add_field_check(fname, ftype, keys)
+                    if not fields:
+                        self.add_line("pass")
+                with self.indent("except AttributeError:"):
+                    with self.indent("if not isinstance(d, dict):"):
+                        self.add_line(
+                            "raise ValueError('Input for "
+                            f"{type_name(self.cls)} should be a dict "
+                            "instance') from None"
+                        )
+                    self.add_line("raise")
+        self.add_line(f"setattr(_cls, '{VALIDATE_METHOD}', {VALIDATE_METHOD})")
+        self.compile()
+
+    def _add_field_check(
+        self, fname: str, ftype: Any, keys: tuple[str, ...]
+    ) -> None:
+        self.add_line(f"value = d.get('{keys[0]}', MISSING)")
+        for key in keys[1:]:
+            with self.indent("if value is MISSING:"):
+                self.add_line(f"value = d.get('{key}', MISSING)")
+        self.add_type_modules(ftype)
+        default = self.get_field_default(fname)
+        resolved_type_params = self.get_field_resolved_type_params(fname)
+        conditions = []
+        if default is MISSING:
+            with self.indent("if value is MISSING:"):
+                field_type = self.get_type_ref(
+                    ftype, resolved_type_params=resolved_type_params
+                )
+                self.add_line(
+                    f"raise MissingField('{fname}',{field_type},cls) from None"
+                )
+        else:
+            conditions.append("value is not MISSING")
+        if is_optional(ftype, resolved_type_params):
+            ftype = not_none_type_arg(get_args(ftype), resolved_type_params)
+            conditions.append("value is not None")
+        elif default is None:
+            conditions.append("value is not None")
+        check_lines = self._get_checked_value_lines(
+            ftype,
+            "value",
+            f"'{fname}'",
+            "cls",
+            FieldContext(name=fname, metadata=self.metadatas.get(fname, {})),
+        )
+        if not check_lines.as_text():
+            return
+        elif conditions:
+            with self.indent(f"if {' and '.join(conditions)}:"):
+                self.lines.extend(check_lines)
+        else:
+            self.lines.extend(check_lines)
+
+    def _get_checked_value_lines(
+        self,
+        typ: Any,
+        expr: str,
+        path: str,
+        holder: str,
+        field_ctx: FieldContext,
+    ) -> CodeLines:
+        lines, self.lines = self.lines, CodeLines()
+        try:
+            self._add_checked_value(typ, expr, path, holder, field_ctx)
+            return self.lines
+        finally:
+            self.lines = lines
+
+    def _add_checked_value(
+        self,
+        typ: Any,
+        expr: str,
+        path: str,
+        holder: str,
+        field_ctx: FieldContext,
+    ) -> None:
+        lines, self.lines = self.lines, CodeLines()
+        try:
+            self._add_check(typ, expr, holder, field_ctx)
+            check_lines = self.lines
+        finally:
+            self.lines = lines
+        if not check_lines.as_text():
+            return
+        with self.indent("try:"):
+            self.lines.extend(check_lines)
+        field_type = self.get_type_ref(typ)
+        with self.indent("except (MissingField, InvalidFieldValue) as e:"):
+            self.add_line(f"add_path_prefix(e, {path})")
+            self.add_line("raise")
+        self.add_decode_limits_reraise()
+        with self.indent("except ExtraKeysError:"):
+            self.add_line("raise")
+        with self.indent("except Exception:"):
+            self.add_line(
+                f"raise InvalidFieldValue({path},{field_type},{expr},{holder})"
+                " from None"
+            )
+
+    def _add_check(
+        self,
+        typ: Any,
+        expr: str,
+        holder: str,
+        field_ctx: FieldContext | None = None,
+    ) -> None:
+        if field_ctx is None:
+            field_ctx = FieldContext(name="", metadata={})
+        if is_self(typ):
+            typ = self.cls
+        spec = ValueSpec(
+            type=typ,
+            expression=expr,
+            builder=self,
+            field_ctx=field_ctx,
+            could_be_none=False,
+        )
+        if not self._is_structural(spec):
+            self._add_leaf_check(spec)
+            return
+        origin = spec.origin_type
+        args = get_args(typ)
+        if is_optional(typ):
+            with self.indent(f"if {expr} is not None:"):
+                self._add_check(not_none_type_arg(args), expr, holder)
+        elif is_dataclass(origin):
+            self._add_dataclass_check(spec)
+        elif issubclass(origin, MAPPING_TYPES):
+            key_type, value_type = args or (Any, Any)
+            i = next(self._var_ids)
+            key, value = f"k{i}", f"v{i}"
+            items = f"{self._get_limited_collection(expr)}.items()"
+            with self.indent(f"for {key}, {value} in {items}:"):
+                self._add_checked_value(
+                    key_type,
+                    key,
+                    f"f'[{{{key}!r}}]'",
+                    holder,
+                    FieldContext(name="", metadata={}),
+                )
+                self._add_checked_value(
+                    value_type,
+                    value,
+                    f"f'[{{{key}!r}}]'",
+                    holder,
+                    FieldContext(name="", metadata={}),
+                )
+        else:
+            item_type = args[0] if args else Any
+            i = next(self._var_ids)
+            index, item = f"i{i}", f"v{i}"
+            items = f"enumerate({self._get_limited_collection(expr)})"
+            with self.indent(f"for {index}, {item} in {items}:"):
+                self._add_checked_value(
+                    item_type,
+                    item,
+                    f"f'[{{{index}}}]'",
+                    holder,
+                    FieldContext(name="", metadata={}),
+                )
+
+    def _get_limited_collection(self, expr: str) -> str:
+        limiter = self.get_decode_limiter()
+        if limiter is None:
+            return expr
+        return f"{limiter}.collection({expr})"
+
+    def _is_structural(self, spec: ValueSpec) -> bool:
+        metadata = spec.field_ctx.metadata
+        if (
+            "deserialize" in metadata
+            or any(self.iter_serialization_strategies(metadata, spec.type))
+            or spec.annotations
+        ):
+            return False
+        typ = spec.type
+        origin = spec.origin_type
+        args = get_args(typ)
+        if is_optional(typ):
+            return True
+        elif not isinstance(origin, type):
+            return False
+        elif is_dataclass(origin):
+            return (
+                not args
+                and not issubclass(
+                    origin, (SerializableType, GenericSerializableType)
+                )
+                and self.get_config(
+                    origin, look_in_parents=False
+                ).discriminator
+                is None
+                and not self._has_pre_deserialize_hook(origin)
+            )
+        elif origin in SEQUENCE_TYPES:
+            return True
+        elif origin is tuple:
+            return len(args) == 2 and args[1] is Ellipsis
+        elif origin in MAPPING_TYPES:
+            return True
+        return False
+
+    @staticmethod
+    def _has_pre_deserialize_hook(cls: Type) -> bool:
+        hook_owner = get_class_that_defines_method(__PRE_DESERIALIZE__, cls)
+        return hook_owner is not None and not is_dataclass_dict_mixin(
+            hook_owner
+        )
+
+    def _add_dataclass_check(self, spec: ValueSpec) -> None:
+        method_loc = spec.attrs
+        if VALIDATE_METHOD not in method_loc.__dict__:
+            # register the method before compiling it for recursive types
+            setattr(method_loc, VALIDATE_METHOD, None)
+            builder = self.__class__(
+                spec.origin_type,
+                dialect=self.dialect,
+                format_name=self.format_name,
+                default_dialect=self.default_dialect,
+                attrs=method_loc,
+                attrs_registry=self.attrs_registry,
+            )
+            builder.add_dataclass_validate_method()
+        method = getattr(method_loc, VALIDATE_METHOD)
+        if method is None:
+            # the method of a recursive type is being compiled
+            method_expr = f"{spec.cls_attrs_name}.{VALIDATE_METHOD}"
+        else:
+            method_expr = clean_id(
+                f"{type_name(spec.origin_type)}_{VALIDATE_METHOD}"
+            )
+            self.ensure_object_imported(method, method_expr)
+        self.add_line(f"{method_expr}({spec.expression})")
+
+    def _add_leaf_check(self, spec: ValueSpec) -> None:
+        unpacked_value = UnpackerRegistry.get(spec)
+        expr = spec.expression
+        origin = spec.origin_type
+        if unpacked_value == expr:
+            return
+        elif unpacked_value == f"{getattr(origin, '__name__', '')}({expr})":
+            # values of the exact primitive type are returned as is
+            with self.indent(f"if type({expr}) is not {origin.__name__}:"):
+                self.add_line(unpacked_value)
+        elif (
+            isinstance(origin, type)
+            and issubclass(origin, Enum)
+            and unpacked_value.endswith(f"({expr})")
+        ):
+            # skip the slow enum call for known values
+            values_name = clean_id(f"{type_name(origin)}_values")
+            self.ensure_object_imported(origin._value2member_map_, values_name)
+            with self.indent(f"if {expr} not in {values_name}:"):
+                self.add_line(unpacked_value)
+        else:
+            self.add_line(unpacked_value)
+
+
+class Validator(Generic[T]):
+    @overload
+    def __init__(
+        self,
+        shape_type: Type[T],
+        *,
+        default_dialect: Type[Dialect] | None = None,
+    ): ...
+
+    @overload
+    def __init__(
+        self, shape_type: Any, *, default_dialect: Type[Dialect] | None = None
+    ): ...
+
+    def __init__(
+        self,
+        shape_type: Type[T] | Any,
+        *,
+        default_dialect: Type[Dialect] | None = None,
+    ):
+        code_builder = ValidatorCodeBuilder.new(
+            type_args=get_args(shape_type), default_dialect=default_dialect
+        )
+        code_builder.add_validate_method(shape_type, self)
+
+    @final
+    def validate(self, data: Any) -> None: ...
+
+
+def validate(shape_type: Type[T] | Any, data: Any) -> None:
+    Validator(shape_type).validate(data)
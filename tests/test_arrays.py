@@ -0,0 +1,211 @@
+import array
+from dataclasses import dataclass, field
+from typing import Annotated, Optional
+
+import msgpack
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from mashumaro import DataClassDictMixin
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.codecs.msgpack import MessagePackDecoder, MessagePackEncoder
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import (
+    UnserializableField,
+    UnsupportedDeserializationEngine,
+    UnsupportedSerializationEngine,
+)
+from mashumaro.jsonschema import build_json_schema
+from mashumaro.mixins.msgpack import (
+    DataClassMessagePackMixin,
+    MessagePackDialect,
+)
+
+
+@dataclass
+class Samples(DataClassDictMixin):
+    doubles: Annotated[array.array, "d"]
+    floats: npt.NDArray[np.float32]
+    shorts: Annotated[np.ndarray, np.int16]
+    any_array: Optional[np.ndarray] = None
+
+
+class NumpyAsBytesDialect(MessagePackDialect):
+    serialization_strategy = {
+        **MessagePackDialect.serialization_strategy,
+        np.ndarray: {"serialize": "as_bytes", "deserialize": "as_bytes"},
+    }
+
+
+@dataclass
+class MessagePackSamples(DataClassMessagePackMixin):
+    doubles: Annotated[array.array, "d"]
+    floats: npt.NDArray[np.float32]
+    shorts: Annotated[np.ndarray, np.dtype("int16")]
+
+    class Config(BaseConfig):
+        dialect = NumpyAsBytesDialect
+
+
+def test_array_as_list():
+    obj = Samples(
+        doubles=array.array("d", [1.5, 2.5]),
+        floats=np.array([1.0, 2.0], dtype=np.float32),
+        shorts=np.array([[1, 2], [3, 4]], dtype=np.int16),
+        any_array=np.array(["a", "b"]),
+    )
+    data = {
+        "doubles": [1.5, 2.5],
+        "floats": [1.0, 2.0],
+        "shorts": [[1, 2], [3, 4]],
+        "any_array": ["a", "b"],
+    }
+    assert obj.to_dict() == data
+    loaded = Samples.from_dict(data)
+    assert loaded.doubles == obj.doubles
+    assert loaded.floats.dtype == np.float32
+    assert loaded.shorts.dtype == np.int16
+    assert loaded.shorts.shape == (2, 2)
+    np.testing.assert_array_equal(loaded.floats, obj.floats)
+    np.testing.assert_array_equal(loaded.shorts, obj.shorts)
+    np.testing.assert_array_equal(loaded.any_array, obj.any_array)
+
+
+def test_array_as_bytes_in_msgpack():
+    obj = MessagePackSamples(
+        doubles=array.array("d", [1.5, 2.5]),
+        floats=np.array([1.0, 2.0], dtype=np.float32),
+        shorts=np.array([1, 2, 3], dtype=">i2"),
+    )
+    dumped = obj.to_msgpack()
+    raw = msgpack.unpackb(dumped)
+    assert raw == {
+        "doubles": np.array([1.5, 2.5], dtype="<f8").tobytes(),
+        "floats": np.array([1.0, 2.0], dtype="<f4").tobytes(),
+        "shorts": np.array([1, 2, 3], dtype="<i2").tobytes(),
+    }
+    loaded = MessagePackSamples.from_msgpack(dumped)
+    assert loaded.doubles == obj.doubles
+    np.testing.assert_array_equal(loaded.floats, obj.floats)
+    np.testing.assert_array_equal(loaded.shorts, obj.shorts)
+    assert loaded.shorts.dtype == np.dtype("<i2")
+
+
+def test_array_as_bytes_with_field_options():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Annotated[array.array, "i"] = field(
+            metadata={"serialize": "as_bytes", "deserialize": "as_bytes"}
+        )
+        y: npt.NDArray[np.uint8] = field(
+            metadata={"serialize": "as_bytes", "deserialize": "as_bytes"}
+        )
+
+    obj = DataClass(array.array("i", [1, 2]), np.array([3, 4], np.uint8))
+    data = obj.to_dict()
+    assert data == {"x": array.array("i", [1, 2]).tobytes(), "y": b"\x03\x04"}
+    loaded = DataClass.from_dict(data)
+    assert loaded.x == obj.x
+    np.testing.assert_array_equal(loaded.y, obj.y)
+
+
+def test_array_codecs():
+    shape_type = list[npt.NDArray[np.float64]]
+    value = [np.array([1.0, 2.0]), np.array([3.0])]
+    encoded = BasicEncoder(shape_type).encode(value)
+    assert encoded == [[1.0, 2.0], [3.0]]
+    for decoded, expected in zip(
+        BasicDecoder(shape_type).decode(encoded), value
+    ):
+        np.testing.assert_array_equal(decoded, expected)
+
+    encoded = MessagePackEncoder(shape_type).encode(value)
+    for decoded, expected in zip(
+        MessagePackDecoder(shape_type).decode(encoded), value
+    ):
+        np.testing.assert_array_equal(decoded, expected)
+
+
+def test_structured_numpy_array_as_bytes():
+    dtype = np.dtype([("x", "<i4"), ("y", "<f8")])
+
+    @dataclass
+    class DataClass(DataClassMessagePackMixin):
+        x: Annotated[np.ndarray, dtype] = field(
+            metadata={"serialize": "as_bytes", "deserialize": "as_bytes"}
+        )
+
+    obj = DataClass(np.array([(1, 2.0), (3, 4.0)], dtype=dtype))
+    loaded = DataClass.from_msgpack(obj.to_msgpack())
+    assert loaded.x.dtype == dtype
+    np.testing.assert_array_equal(loaded.x, obj.x)
+
+
+def test_array_without_typecode():
+    with pytest.raises(UnserializableField):
+
+        @dataclass
+        class DataClass(DataClassDictMixin):
+            x: array.array
+
+
+def test_numpy_array_as_bytes_without_dtype():
+    with pytest.raises(UnserializableField):
+
+        @dataclass
+        class DataClass(DataClassMessagePackMixin):
+            x: np.ndarray = field(metadata={"serialize": "as_bytes"})
+
+
+def test_numpy_array_as_list_in_msgpack_by_default():
+    @dataclass
+    class DataClass(DataClassMessagePackMixin):
+        x: np.ndarray
+        y: npt.NDArray[np.int16]
+
+    obj = DataClass(np.array([[1, 2], [3, 4]]), np.array([[5], [6]], "i2"))
+    dumped = obj.to_msgpack()
+    assert msgpack.unpackb(dumped) == {"x": [[1, 2], [3, 4]], "y": [[5], [6]]}
+    loaded = DataClass.from_msgpack(dumped)
+    assert loaded.x.shape == (2, 2)
+    assert loaded.y.shape == (2, 1)
+    assert loaded.y.flags.writeable
+    np.testing.assert_array_equal(loaded.x, obj.x)
+    np.testing.assert_array_equal(loaded.y, obj.y)
+
+
+def test_unsupported_array_engines():
+    with pytest.raises(UnsupportedSerializationEngine):
+
+        @dataclass
+        class DataClass1(DataClassDictMixin):
+            x: npt.NDArray[np.int8] = field(metadata={"serialize": "as_dict"})
+
+    with pytest.raises(UnsupportedDeserializationEngine):
+
+        @dataclass
+        class DataClass2(DataClassDictMixin):
+            x: Annotated[array.array, "b"] = field(
+                metadata={"deserialize": "as_dict"}
+            )
+
+
+def test_array_json_schema():
+    assert build_json_schema(npt.NDArray[np.float32]).to_dict() == {
+        "type": "array",
+        "items": {"type": "number"},
+    }
+    assert build_json_schema(Annotated[np.ndarray, np.bool_]).to_dict() == {
+        "type": "array",
+        "items": {"type": "boolean"},
+    }
+    assert build_json_schema(np.ndarray).to_dict() == {"type": "array"}
+    assert build_json_schema(Annotated[array.array, "q"]).to_dict() == {
+        "type": "array",
+        "items": {"type": "integer"},
+    }
+    assert build_json_schema(Annotated[array.array, "u"]).to_dict() == {
+        "type": "array",
+        "items": {"type": "string"},
+    }
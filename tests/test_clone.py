@@ -0,0 +1,181 @@
+import collections
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Annotated, Any, NewType, Optional, Union
+from uuid import UUID, uuid4
+
+import pytest
+from typing_extensions import Self
+
+from mashumaro import DataClassDictMixin, clone
+from mashumaro.config import BaseConfig
+
+Tags = NewType("Tags", list[str])
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int
+    y: int
+
+
+@dataclass(frozen=True)
+class FrozenWithList:
+    values: list[int]
+
+
+@dataclass
+class Item:
+    name: str
+    tags: Tags = field(default_factory=lambda: Tags([]))
+    attrs: dict[str, list[int]] = field(default_factory=dict)
+
+
+@dataclass
+class Order(DataClassDictMixin):
+    id: UUID
+    created: datetime
+    items: list[Item]
+    points: list[Point] = field(default_factory=list)
+    by_name: dict[str, Item] = field(default_factory=dict)
+    pair: tuple[Item, Point] | None = None
+    frozen: tuple[Point, ...] = ()
+    counter: collections.Counter[str] = field(
+        default_factory=collections.Counter
+    )
+    raw: Any = None
+    mixed: Union[int, list[int]] = 0
+    annotated: Annotated[list[Item], "x"] = field(default_factory=list)
+    buffer: bytearray = field(default_factory=bytearray)
+    parent: Optional[Self] = None
+
+
+@dataclass(slots=True)
+class Slotted:
+    values: list[int]
+    name: str = ""
+
+
+@dataclass
+class Base(DataClassDictMixin):
+    x: list[int]
+
+
+@dataclass
+class Child(Base):
+    y: list[int] = field(default_factory=list)
+
+
+@dataclass
+class Tracked(DataClassDictMixin):
+    x: int = 0
+
+    class Config(BaseConfig):
+        track_changes = True
+
+
+def make_order() -> Order:
+    item = Item("a", Tags(["t"]), {"k": [1]})
+    return Order(
+        id=uuid4(),
+        created=datetime(2024, 1, 1),
+        items=[item],
+        points=[Point(1, 2)],
+        by_name={"a": Item("b")},
+        pair=(Item("c"), Point(3, 4)),
+        frozen=(Point(5, 6),),
+        counter=collections.Counter("aab"),
+        raw={"x": [1]},
+        mixed=[1],
+        annotated=[Item("d")],
+        buffer=bytearray(b"x"),
+        parent=Order(uuid4(), datetime(2023, 1, 1), [item]),
+    )
+
+
+def test_clone_is_deep_copy():
+    order = make_order()
+    cloned = order.clone()
+    assert cloned == order
+    assert cloned is not order
+    assert cloned.items is not order.items
+    assert cloned.items[0] is not order.items[0]
+    assert cloned.items[0].tags is not order.items[0].tags
+    assert cloned.items[0].attrs["k"] is not order.items[0].attrs["k"]
+    assert cloned.by_name["a"] is not order.by_name["a"]
+    assert cloned.pair[0] is not order.pair[0]
+    assert cloned.counter is not order.counter
+    assert cloned.raw["x"] is not order.raw["x"]
+    assert cloned.mixed is not order.mixed
+    assert cloned.annotated[0] is not order.annotated[0]
+    assert cloned.buffer is not order.buffer
+    assert cloned.parent is not order.parent
+    assert cloned.parent.items[0] is not order.parent.items[0]
+
+
+def test_clone_shares_immutable_values():
+    order = make_order()
+    cloned = clone(order)
+    assert cloned.id is order.id
+    assert cloned.created is order.created
+    assert cloned.points[0] is order.points[0]
+    assert cloned.pair[1] is order.pair[1]
+    assert cloned.frozen is order.frozen
+    assert cloned.items[0].name is order.items[0].name
+
+
+def test_clone_frozen_dataclass_with_mutable_field():
+    obj = FrozenWithList([1])
+    cloned = clone(obj)
+    assert cloned == obj
+    assert cloned.values is not obj.values
+
+
+def test_clone_slots_dataclass():
+    obj = Slotted([1], "a")
+    cloned = clone(obj)
+    assert cloned == obj
+    assert cloned.values is not obj.values
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_clone_with_unset_fields(slots):
+    @dataclass(slots=slots)
+    class DataClass:
+        x: int
+        y: list[int] = field(init=False)
+        z: int = field(init=False)
+
+    obj = DataClass(1)
+    cloned = clone(obj)
+    assert cloned.x == 1
+    assert not hasattr(cloned, "y")
+    assert not hasattr(cloned, "z")
+    obj.y = [2]
+    obj.z = 3
+    cloned = clone(obj)
+    assert cloned == obj
+    assert cloned.y is not obj.y
+
+
+def test_clone_subclass_instance():
+    child = Child([1], [2])
+    for cloned in (Base.clone(child), child.clone(), clone(child)):
+        assert cloned == child
+        assert type(cloned) is Child
+        assert cloned.y is not child.y
+    assert Base([1]).clone() == Base([1])
+
+
+def test_clone_with_track_changes():
+    obj = Tracked()
+    obj.mark_clean()
+    cloned = obj.clone()
+    cloned.x = 1
+    assert obj.to_dict_changes() == {}
+    assert cloned.to_dict_changes() == {"x": 1}
+
+
+def test_clone_not_dataclass():
+    with pytest.raises(ValueError, match="is not a dataclass"):
+        clone([1])
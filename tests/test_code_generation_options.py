@@ -1,12 +1,22 @@
+import gc
+import weakref
 from dataclasses import dataclass
 from typing import Optional
 
-from mashumaro import DataClassDictMixin
+import pytest
+
+from mashumaro import DataClassDictMixin, stats
+from mashumaro.codecs import BasicDecoder
 from mashumaro.config import (
+    ADD_INSTRUMENTATION,
     TO_DICT_ADD_BY_ALIAS_FLAG,
     TO_DICT_ADD_OMIT_NONE_FLAG,
     BaseConfig,
 )
+from mashumaro.core.meta.helpers import type_name
+from mashumaro.exceptions import InvalidFieldValue
+from mashumaro.instrumentation import get_call_stats, reset_stats
+from mashumaro.mixins.msgpack import DataClassMessagePackMixin
 
 
 @dataclass
@@ -65,3 +75,94 @@ def test_passing_flags_if_parent_does_not_have_them():
     obj = WithoutFlags.from_dict({"b": {"a_alias": {"x": None}}})
     assert obj == WithoutFlags(b=B(a=A(x=None)))
     assert obj.to_dict() == {"b": {"a": {"x": None}}}
+
+
+def test_instrumentation():
+    @dataclass
+    class Inner(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_INSTRUMENTATION]
+
+    @dataclass
+    class Outer(DataClassMessagePackMixin):
+        inner: Inner
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_INSTRUMENTATION]
+
+    reset_stats()
+    obj = Outer.from_dict({"inner": {"x": 1}})
+    obj.to_dict()
+    Outer.from_msgpack(obj.to_msgpack())
+    with pytest.raises(InvalidFieldValue):
+        Outer.from_dict({"inner": {"x": "a"}})
+    BasicDecoder(list[Inner]).decode([{"x": 1}, {"x": 2}])
+
+    snapshot = stats()
+    outer = snapshot[Outer]
+    inner = snapshot[Inner]
+    assert outer["from_dict"]["calls"] == 2
+    assert outer["from_dict"]["failures"] == 1
+    assert outer["to_dict"] == {
+        "calls": 1,
+        "failures": 0,
+        "total_time": outer["to_dict"]["total_time"],
+    }
+    assert outer["from_msgpack"]["calls"] == 1
+    assert outer["to_msgpack"]["calls"] == 1
+    assert inner["from_dict"]["calls"] == 4
+    assert inner["from_msgpack"]["calls"] == 1
+    assert inner["from_dict"]["failures"] == 1
+    assert inner["from_dict"]["total_time"] > 0
+
+    reset_stats()
+    assert stats()[Outer]["from_dict"]["calls"] == 0
+
+
+def test_no_instrumentation_by_default():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+    DataClass.from_dict({"x": 1}).to_dict()
+    assert DataClass not in stats()
+
+
+def _make_instrumented_class():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_INSTRUMENTATION]
+
+    return DataClass
+
+
+def test_instrumentation_of_classes_with_same_name():
+    first = _make_instrumented_class()
+    second = _make_instrumented_class()
+    assert type_name(first) == type_name(second)
+    first.from_dict({"x": 1})
+    second.from_dict({"x": 1})
+    second.from_dict({"x": 2})
+    snapshot = stats()
+    assert snapshot[first]["from_dict"]["calls"] == 1
+    assert snapshot[second]["from_dict"]["calls"] == 2
+
+
+def test_instrumentation_stats_are_dropped_with_classes():
+    cls = type("DroppedClass", (), {})
+    get_call_stats(cls, "from_dict").calls += 1
+    assert stats()[cls]["from_dict"]["calls"] == 1
+    cls_ref = weakref.ref(cls)
+    del cls
+    gc.collect()
+    assert cls_ref() is None
+    assert all(
+        getattr(key, "__name__", None) != "DroppedClass" for key in stats()
+    )
+    get_call_stats(int | str, "decode").calls += 1
+    assert stats()[int | str]["decode"]["calls"] == 1
@@ -0,0 +1,154 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Generic, Optional, TypeVar
+
+import pytest
+
+from mashumaro import field_options, pass_through
+from mashumaro.codecs import RowDecoder, RowEncoder
+from mashumaro.dialect import Dialect
+from mashumaro.exceptions import InvalidFieldValue
+
+T = TypeVar("T")
+
+
+@dataclass
+class Address:
+    city: str
+
+
+@dataclass
+class User:
+    id: int
+    joined: date
+    name: str = field(default="", metadata=field_options(alias="user_name"))
+    address: Optional[Address] = None
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class GenericRow(Generic[T]):
+    value: T
+
+
+@dataclass
+class WithHooks:
+    x: int
+
+    @classmethod
+    def __post_deserialize__(cls, obj: "WithHooks") -> "WithHooks":
+        obj.x += 1
+        return obj
+
+    def __pre_serialize__(self) -> "WithHooks":
+        return WithHooks(self.x * 10)
+
+
+class PassThroughDialect(Dialect):
+    serialization_strategy = {date: pass_through}
+
+
+def test_row_decoder():
+    decoder = RowDecoder(
+        User, columns=["id", None, "joined", "user_name", "address"]
+    )
+    assert decoder.decode(("1", "skip", "2024-01-01", "a", {"city": "x"})) == (
+        User(1, date(2024, 1, 1), "a", Address("x"))
+    )
+    assert decoder.decode([2, 0, "2024-01-02", "b", None]) == User(
+        2, date(2024, 1, 2), "b"
+    )
+
+
+def test_row_decoder_columns_by_field_name_and_defaults():
+    decoder = RowDecoder(User, columns=["joined", "id", "name"])
+    assert decoder.decode(("2024-01-01", 1, "a")) == User(
+        1, date(2024, 1, 1), "a"
+    )
+    first = decoder.decode(("2024-01-01", 1, "a"))
+    assert (
+        first.tags == []
+        and first.tags is not decoder.decode(("2024-01-01", 1, "a")).tags
+    )
+
+
+def test_row_decoder_decode_many_is_lazy():
+    consumed = []
+
+    def rows():
+        for i in range(3):
+            consumed.append(i)
+            yield i, "2024-01-01"
+
+    decoded = RowDecoder(User, columns=["id", "joined"]).decode_many(rows())
+    assert consumed == []
+    assert next(decoded) == User(0, date(2024, 1, 1))
+    assert consumed == [0]
+    assert [u.id for u in decoded] == [1, 2]
+
+
+def test_row_decoder_invalid_value():
+    decoder = RowDecoder(User, columns=["id", "joined"])
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        decoder.decode((1, "not a date"))
+    assert exc_info.value.field_name == "joined"
+    with pytest.raises(ValueError):
+        decoder.decode((1, "2024-01-01", "extra"))
+
+
+def test_row_codecs_bad_columns():
+    with pytest.raises(ValueError, match="Column 'foo'"):
+        RowDecoder(User, columns=["id", "joined", "foo"])
+    with pytest.raises(ValueError, match="Required field 'joined'"):
+        RowDecoder(User, columns=["id", "name"])
+    with pytest.raises(ValueError, match="Column 'foo'"):
+        RowEncoder(User, columns=["id", "foo"])
+    with pytest.raises(ValueError):
+        RowEncoder(User, columns=["id", None])
+    with pytest.raises(ValueError, match="is not a dataclass"):
+        RowDecoder(int, columns=["id"])
+    with pytest.raises(ValueError, match="Column 'id' maps field 'id'"):
+        RowDecoder(User, columns=["id", "id", "joined"])
+    with pytest.raises(ValueError, match="Column 'name' maps field 'name'"):
+        RowDecoder(User, columns=["id", "joined", "user_name", "name"])
+    with pytest.raises(ValueError, match="Column 'id' maps field 'id'"):
+        RowEncoder(User, columns=["id", "id"])
+
+
+def test_row_encoder():
+    encoder = RowEncoder(User, columns=["id", "joined", "name", "address"])
+    users = [
+        User(1, date(2024, 1, 1), "a", Address("x")),
+        User(2, date(2024, 1, 2)),
+    ]
+    assert encoder.encode(users[0]) == (1, "2024-01-01", "a", {"city": "x"})
+    assert list(encoder.encode_many(users)) == [
+        (1, "2024-01-01", "a", {"city": "x"}),
+        (2, "2024-01-02", "", None),
+    ]
+
+
+def test_row_codecs_with_dialect():
+    encoder = RowEncoder(
+        User, columns=["id", "joined"], default_dialect=PassThroughDialect
+    )
+    decoder = RowDecoder(
+        User, columns=["id", "joined"], default_dialect=PassThroughDialect
+    )
+    user = User(1, date(2024, 1, 1))
+    assert encoder.encode(user) == (1, date(2024, 1, 1))
+    assert decoder.decode(encoder.encode(user)) == user
+
+
+def test_row_codecs_generic_dataclass():
+    decoder = RowDecoder(GenericRow[date], columns=["value"])
+    encoder = RowEncoder(GenericRow[date], columns=["value"])
+    assert decoder.decode(("2024-01-01",)) == GenericRow(date(2024, 1, 1))
+    assert encoder.encode(GenericRow(date(2024, 1, 1))) == ("2024-01-01",)
+    any_decoder: RowDecoder[Any] = RowDecoder(GenericRow, columns=["value"])
+    assert any_decoder.decode(("x",)) == GenericRow("x")
+
+
+def test_row_codecs_hooks():
+    assert RowDecoder(WithHooks, columns=["x"]).decode((1,)) == WithHooks(2)
+    assert RowEncoder(WithHooks, columns=["x"]).encode(WithHooks(1)) == (10,)
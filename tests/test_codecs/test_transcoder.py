@@ -0,0 +1,175 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Optional
+
+import pytest
+from typing_extensions import Self
+
+from mashumaro import field_options
+from mashumaro.codecs import BasicDecoder, BasicEncoder, Transcoder
+from mashumaro.config import BaseConfig
+from mashumaro.dialect import Dialect
+from mashumaro.exceptions import (
+    ExtraKeysError,
+    InvalidFieldValue,
+    MissingField,
+)
+
+
+@dataclass
+class Item:
+    sku: str = field(metadata=field_options(alias="skuCode"))
+    added_at: datetime = field(metadata=field_options(alias="addedAt"))
+    quantity: int = 1
+
+
+@dataclass
+class Order:
+    order_id: int = field(metadata=field_options(alias="orderId"))
+    created: date
+    items: list[Item]
+    by_sku: dict[str, Item] = field(default_factory=dict)
+    parent: Optional[Self] = None
+    note: Optional[str] = None
+    secret: str = field(default="", metadata={"serialize": "omit"})
+
+
+@dataclass
+class WithHook:
+    x: int
+
+    @classmethod
+    def __pre_deserialize__(cls, d: dict[Any, Any]) -> dict[Any, Any]:
+        return {"x": d["y"]}
+
+
+@dataclass
+class Strict:
+    x: int
+
+    class Config(BaseConfig):
+        forbid_extra_keys = True
+
+
+@dataclass
+class Wrapper:
+    item: Item
+
+
+class ExternalDialect(Dialect):
+    serialize_by_alias = True
+
+
+class InternalDialect(Dialect):
+    serialization_strategy = {
+        datetime: {
+            "serialize": lambda dt: int(dt.timestamp()),
+            "deserialize": lambda ts: datetime.fromtimestamp(ts, timezone.utc),
+        }
+    }
+    omit_none = True
+
+
+class InternalByAliasDialect(InternalDialect):
+    serialize_by_alias = True
+
+
+class ItemAsSkuDialect(Dialect):
+    serialization_strategy = {Item: {"serialize": lambda item: item.sku}}
+
+
+EXTERNAL_ORDER = {
+    "orderId": 1,
+    "created": "2024-01-01",
+    "items": [{"skuCode": "a", "addedAt": "2024-01-01T00:00:00+00:00"}],
+    "by_sku": {"b": {"skuCode": "b", "addedAt": "2024-01-02T00:00:00+00:00"}},
+    "parent": {"orderId": 0, "created": "2023-01-01", "items": []},
+    "secret": "x",
+}
+
+
+def decode_encode(shape_type, from_dialect, to_dialect, data):
+    decoder = BasicDecoder(shape_type, default_dialect=from_dialect)
+    encoder = BasicEncoder(shape_type, default_dialect=to_dialect)
+    return encoder.encode(decoder.decode(data))
+
+
+@pytest.mark.parametrize(
+    ["from_dialect", "to_dialect"],
+    [
+        [ExternalDialect, InternalDialect],
+        [InternalByAliasDialect, ExternalDialect],
+        [ExternalDialect, None],
+    ],
+)
+def test_transcoder_matches_decode_encode(from_dialect, to_dialect):
+    # input data must use aliases to be decoded
+    data = decode_encode(Order, None, from_dialect, EXTERNAL_ORDER)
+    transcoder = Transcoder(
+        Order, from_dialect=from_dialect, to_dialect=to_dialect
+    )
+    assert transcoder.transcode(data) == decode_encode(
+        Order, from_dialect, to_dialect, data
+    )
+
+
+def test_transcoder_output():
+    transcoder = Transcoder(
+        Order, from_dialect=ExternalDialect, to_dialect=InternalDialect
+    )
+    assert transcoder.transcode(EXTERNAL_ORDER) == {
+        "order_id": 1,
+        "created": "2024-01-01",
+        "items": [{"sku": "a", "added_at": 1704067200, "quantity": 1}],
+        "by_sku": {"b": {"sku": "b", "added_at": 1704153600, "quantity": 1}},
+        "parent": {
+            "order_id": 0,
+            "created": "2023-01-01",
+            "items": [],
+            "by_sku": {},
+        },
+    }
+
+
+def test_transcoder_copies_values_with_same_representation():
+    data = {"orderId": 1, "created": "not checked", "items": []}
+    result = Transcoder(Order).transcode(data)
+    assert result["created"] == "not checked"
+    assert result["items"] is not data["items"]
+    assert result["note"] is None
+
+
+def test_transcoder_errors():
+    transcoder = Transcoder(
+        Order, from_dialect=ExternalDialect, to_dialect=InternalDialect
+    )
+    with pytest.raises(MissingField) as exc_info:
+        transcoder.transcode({"orderId": 1, "items": []})
+    assert exc_info.value.field_name == "created"
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        transcoder.transcode(
+            {
+                "orderId": 1,
+                "created": "2024-01-01",
+                "items": [{"skuCode": "a", "addedAt": "x"}],
+            }
+        )
+    assert exc_info.value.field_name == "items"
+    with pytest.raises(ValueError, match="should be a dict instance"):
+        transcoder.transcode([])
+    with pytest.raises(ValueError, match="is not a dataclass"):
+        Transcoder(list[Item])
+
+
+def test_transcoder_hooks_and_config():
+    assert Transcoder(WithHook).transcode({"y": 1}) == {"x": 1}
+    transcoder = Transcoder(Strict)
+    assert transcoder.transcode({"x": 1}) == {"x": 1}
+    with pytest.raises(ExtraKeysError):
+        transcoder.transcode({"x": 1, "y": 2})
+
+
+def test_transcoder_nested_dataclass_with_strategy():
+    data = {"item": {"skuCode": "a", "addedAt": "2024-01-01T00:00:00"}}
+    transcoder = Transcoder(Wrapper, to_dialect=ItemAsSkuDialect)
+    assert transcoder.transcode(data) == {"item": "a"}
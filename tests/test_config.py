@@ -1,12 +1,17 @@
-from dataclasses import dataclass, field
-from typing import Optional, Union
+import copy
+from dataclasses import dataclass, field, replace
+from datetime import date
+from typing import Any, Optional, Union
 
 import pytest
 from typing_extensions import Literal
 
 from mashumaro import DataClassDictMixin
 from mashumaro.config import TO_DICT_ADD_OMIT_NONE_FLAG, BaseConfig
+from mashumaro.core.const import Sentinel
+from mashumaro.core.helpers import SerializationCache
 from mashumaro.exceptions import ExtraKeysError, InvalidFieldValue
+from mashumaro.mixins.msgpack import DataClassMessagePackMixin
 from mashumaro.types import Discriminator, SerializationStrategy
 
 from .entities import (
@@ -455,3 +460,286 @@ def test_forbid_extra_keys_with_discriminator_for_subclass():
             {"x": "foo", "__type": "_VariantByField4", "y": "bar"}
         )
     assert exc_info.value.extra_keys == {"y"}
+
+
+def test_cache_serialization():
+    @dataclass(frozen=True)
+    class Inner(DataClassMessagePackMixin):
+        x: int
+
+        class Config(BaseConfig):
+            cache_serialization = True
+
+    @dataclass(frozen=True)
+    class Outer(DataClassMessagePackMixin):
+        inner: Inner
+        y: Optional[int] = None
+
+        class Config(BaseConfig):
+            cache_serialization = 2
+            code_generation_options = [TO_DICT_ADD_OMIT_NONE_FLAG]
+
+    obj = Outer(Inner(1))
+    data = obj.to_dict()
+    assert data == {"inner": {"x": 1}, "y": None}
+    assert obj.to_dict() is data
+    assert obj.to_dict(omit_none=True) == {"inner": {"x": 1}}
+    assert obj.to_dict(omit_none=True) is not data
+    assert data["inner"] is obj.inner.to_dict()
+    assert obj.to_msgpack() is obj.to_msgpack()
+    assert Outer.from_msgpack(obj.to_msgpack()) == obj
+
+    cache = Outer.__mashumaro_serialization_cache__
+    assert len(cache.entries) == 1
+    other = Outer(Inner(2))
+    other.to_dict()
+    third = Outer(Inner(3))
+    third.to_dict()
+    assert len(cache.entries) == 2
+    assert cache.get(obj, ("__mashumaro_to_dict__", False)) is Sentinel.MISSING
+    del other
+    assert len(cache.entries) == 1
+    del third
+    assert len(cache.entries) == 0
+
+
+def test_cache_serialization_with_lazy_compilation():
+    @dataclass(frozen=True)
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            cache_serialization = True
+            lazy_compilation = True
+
+    obj = DataClass(1)
+    assert obj.to_dict() == {"x": 1}
+    assert obj.to_dict() is obj.to_dict()
+
+
+def test_cache_serialization_requires_frozen_dataclass():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            cache_serialization = True
+
+    with pytest.raises(TypeError, match="frozen"):
+        DataClass(1).to_dict()
+
+
+def test_cache_serialization_requires_weakref_support():
+    with pytest.raises(ValueError, match="weak references"):
+
+        @dataclass(frozen=True, slots=True)
+        class DataClass(DataClassDictMixin):
+            x: int
+
+            class Config(BaseConfig):
+                cache_serialization = True
+
+    @dataclass(frozen=True, slots=True, weakref_slot=True)
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            cache_serialization = True
+
+    obj = DataClass(1)
+    assert obj.to_dict() is obj.to_dict()
+
+    @dataclass(frozen=True, slots=True)
+    class Slotted:
+        x: int
+
+        class Config(BaseConfig):
+            cache_serialization = True
+
+    with pytest.raises(ValueError, match="weak references"):
+
+        @dataclass
+        class Holder(DataClassDictMixin):
+            x: Slotted
+
+    cache = SerializationCache(1)
+    with pytest.raises(TypeError, match="weak references"):
+        cache.set(Slotted(1), (), {})
+
+
+def test_track_changes():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: Optional[date] = field(default=None, metadata={"alias": "why"})
+        z: list[int] = field(default_factory=list)
+
+        class Config(BaseConfig):
+            track_changes = True
+            serialize_by_alias = True
+
+    obj = DataClass(1)
+    assert obj.to_dict_changes() == obj.to_dict()
+    obj.mark_clean()
+    assert obj.to_dict_changes() == {}
+    obj.y = date(2024, 1, 2)
+    obj.y = date(2024, 1, 3)
+    assert obj.to_dict_changes() == {"why": "2024-01-03"}
+    obj.x = 2
+    obj.y = None
+    assert obj.to_dict_changes() == {"x": 2, "why": None}
+    obj.mark_clean()
+    assert obj.to_dict_changes() == {}
+    assert DataClass.from_dict({"x": 1}).to_dict_changes() == {
+        "x": 1,
+        "why": None,
+        "z": [],
+    }
+
+
+def test_track_changes_with_inheritance_and_own_setattr():
+    calls = []
+
+    @dataclass
+    class Base(DataClassDictMixin):
+        x: int
+
+        def __setattr__(self, name, value):
+            calls.append(name)
+            super().__setattr__(name, value)
+
+        class Config(BaseConfig):
+            track_changes = True
+
+    @dataclass
+    class Child(Base):
+        y: int
+
+    obj = Child(1, 2)
+    obj.mark_clean()
+    calls.clear()
+    obj.y = 3
+    assert calls == ["y"]
+    assert obj.to_dict_changes() == {"y": 3}
+
+
+def test_track_changes_with_forward_refs():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: "ForwardRefTrackedChanges"
+
+        class Config(BaseConfig):
+            track_changes = True
+
+    global ForwardRefTrackedChanges
+
+    @dataclass
+    class ForwardRefTrackedChanges(DataClassDictMixin):
+        y: int
+
+    obj = DataClass(ForwardRefTrackedChanges(1))
+    obj.mark_clean()
+    obj.x = ForwardRefTrackedChanges(2)
+    assert obj.to_dict_changes() == {"x": {"y": 2}}
+
+
+def test_track_changes_is_not_supported_for_slotted_dataclasses():
+    with pytest.raises(ValueError, match="track_changes"):
+
+        @dataclass(slots=True)
+        class DataClass(DataClassDictMixin):
+            x: int
+
+            class Config(BaseConfig):
+                track_changes = True
+
+
+def test_track_changes_with_omit_none_and_omit_default():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: Optional[int] = None
+        z: int = 0
+
+        class Config(BaseConfig):
+            track_changes = True
+            omit_none = True
+            omit_default = True
+
+    obj = DataClass(1)
+    assert obj.to_dict_changes() == obj.to_dict() == {"x": 1}
+    obj.mark_clean()
+    obj.y = None
+    obj.z = 0
+    assert obj.to_dict_changes() == {}
+    obj.y = 2
+    obj.z = 3
+    assert obj.to_dict_changes() == {"y": 2, "z": 3}
+
+
+def test_track_changes_with_serialization_hooks():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: int = 0
+
+        class Config(BaseConfig):
+            track_changes = True
+
+        def __pre_serialize__(self) -> "DataClass":
+            return DataClass(self.x * 10, self.y * 10)
+
+        def __post_serialize__(self, d: dict[Any, Any]) -> dict[Any, Any]:
+            d["post"] = True
+            return d
+
+    obj = DataClass(1, 2)
+    assert obj.to_dict_changes() == obj.to_dict()
+    obj.mark_clean()
+    obj.y = 3
+    assert obj.to_dict_changes() == {"y": 30, "post": True}
+
+
+def test_track_changes_is_not_supported_for_frozen_dataclasses():
+    @dataclass(frozen=True)
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(BaseConfig):
+            track_changes = True
+
+    obj = DataClass(1)
+    assert obj.to_dict_changes() == {"x": 1}
+    with pytest.raises(ValueError, match="'track_changes' can't be used"):
+        obj.mark_clean()
+
+
+def test_track_changes_copies_have_own_changes():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: list[int] = field(default_factory=list)
+
+        class Config(BaseConfig):
+            track_changes = True
+
+    obj = DataClass(1, [1])
+    obj.mark_clean()
+    copied = copy.copy(obj)
+    copied.y = [9]
+    assert obj.to_dict_changes() == {}
+    assert copied.to_dict_changes() == {"y": [9]}
+    deep_copied = copy.deepcopy(obj)
+    deep_copied.x = 2
+    assert obj.to_dict_changes() == {}
+    assert deep_copied.to_dict_changes() == {"x": 2}
+    replaced = replace(obj, x=3)
+    replaced.y = [3]
+    assert obj.to_dict_changes() == {}
+    assert replaced.to_dict_changes() == {"x": 3, "y": [3]}
+    replaced.mark_clean()
+    replaced.y = [4]
+    assert replaced.to_dict_changes() == {"y": [4]}
+    obj.x = 5
+    assert obj.to_dict_changes() == {"x": 5}
+    assert copied.to_dict_changes() == {"y": [9]}
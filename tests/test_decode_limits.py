@@ -0,0 +1,155 @@
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import pytest
+from typing_extensions import Self
+
+from mashumaro import DataClassDictMixin, Validator
+from mashumaro.codecs import BasicDecoder
+from mashumaro.codecs.orjson import ORJSONDecoder
+from mashumaro.config import BaseConfig
+from mashumaro.dialect import Dialect
+from mashumaro.exceptions import DecodeLimitExceeded
+from mashumaro.types import DecodeLimits
+
+LIMITS = DecodeLimits(
+    max_depth=3,
+    max_collection_length=5,
+    max_string_length=10,
+    max_total_items=12,
+)
+
+
+class LimitedDialect(Dialect):
+    decode_limits = LIMITS
+
+
+@dataclass
+class Node(DataClassDictMixin):
+    name: str
+    children: list[Self] = field(default_factory=list)
+    tags: dict[str, Union[list[int], str]] = field(default_factory=dict)
+    data: Optional[bytes] = None
+
+    class Config(BaseConfig):
+        decode_limits = LIMITS
+
+
+@dataclass
+class Leaf:
+    values: list[int]
+
+
+@dataclass
+class Holder:
+    leaf: Leaf
+    sets: tuple[frozenset[int], ...] = ()
+
+
+@dataclass
+class Unlimited(DataClassDictMixin):
+    values: list[int]
+
+
+def nested(depth: int) -> dict:
+    node = {"name": "x"}
+    for _ in range(depth - 1):
+        node = {"name": "x", "children": [node]}
+    return node
+
+
+@pytest.mark.parametrize(
+    ["data", "limit_name"],
+    [
+        [{"name": "x" * 11}, "max_string_length"],
+        [{"name": "x", "tags": {"a": "x" * 11}}, "max_string_length"],
+        [{"name": "x", "data": "YWJjYWJjYWJjYWJj"}, "max_string_length"],
+        [
+            {"name": "x", "tags": {"a": [1, 2, 3, 4, 5, 6]}},
+            "max_collection_length",
+        ],
+        [
+            {"name": "x", "tags": dict.fromkeys("abcdef", "")},
+            "max_collection_length",
+        ],
+        [
+            {"name": "x", "tags": {"a": [1] * 5, "b": [1] * 5, "c": [1, 2]}},
+            "max_total_items",
+        ],
+        [nested(4), "max_depth"],
+    ],
+)
+def test_decode_limits_exceeded(data, limit_name):
+    with pytest.raises(DecodeLimitExceeded) as exc_info:
+        Node.from_dict(data)
+    assert exc_info.value.limit_name == limit_name
+    with pytest.raises(DecodeLimitExceeded) as exc_info:
+        Validator(Node).validate(data)
+    assert exc_info.value.limit_name == limit_name
+
+
+def test_decode_limits_not_exceeded():
+    data = {
+        "name": "x" * 10,
+        "children": [nested(2)],
+        "tags": {"a": [1] * 5, "b": "x"},
+        "data": "YWJj",
+    }
+    assert Node.from_dict(data).to_dict() == {
+        "name": "x" * 10,
+        "children": [
+            {
+                "name": "x",
+                "children": [
+                    {"name": "x", "children": [], "tags": {}, "data": None}
+                ],
+                "tags": {},
+                "data": None,
+            }
+        ],
+        "tags": {"a": [1] * 5, "b": "x"},
+        "data": "YWJj\n",
+    }
+    Validator(Node).validate(data)
+
+
+def test_decode_limits_total_items_counted_per_call():
+    data = {"name": "x", "tags": {"a": [1] * 5, "b": [1] * 5}}
+    for _ in range(3):
+        Node.from_dict(data)
+    decoder = BasicDecoder(list[list[int]], default_dialect=LimitedDialect)
+    for _ in range(3):
+        assert decoder.decode([[1] * 5, [2] * 5]) == [[1] * 5, [2] * 5]
+    with pytest.raises(DecodeLimitExceeded):
+        decoder.decode([[1] * 5, [2] * 5, [3]])
+
+
+def test_decode_limits_depth_is_restored_after_error():
+    with pytest.raises(DecodeLimitExceeded):
+        Node.from_dict(nested(4))
+    with pytest.raises(ValueError):
+        Node.from_dict({"name": "x", "children": [{"name": "x"}, 1]})
+    Node.from_dict(nested(3))
+
+
+def test_decode_limits_in_dialect_apply_to_nested_dataclasses():
+    decoder = BasicDecoder(Holder, default_dialect=LimitedDialect)
+    decoder.decode({"leaf": {"values": [1] * 5}, "sets": [[1, 2]]})
+    with pytest.raises(DecodeLimitExceeded):
+        decoder.decode({"leaf": {"values": [1] * 6}})
+    with pytest.raises(DecodeLimitExceeded):
+        decoder.decode({"leaf": {"values": []}, "sets": [[]] * 6})
+    with pytest.raises(DecodeLimitExceeded):
+        decoder.decode({"leaf": {"values": []}, "sets": [list(range(6))]})
+
+
+def test_decode_limits_with_no_copy_collections():
+    decoder = ORJSONDecoder(Leaf, default_dialect=LimitedDialect)
+    assert decoder.decode(b'{"values": [1, 2]}') == Leaf([1, 2])
+    with pytest.raises(DecodeLimitExceeded):
+        decoder.decode(b'{"values": [1, 2, 3, 4, 5, 6]}')
+
+
+def test_decode_limits_not_set():
+    assert "decode_limiter" not in Unlimited.from_dict.__globals__
+    assert Unlimited.from_dict({"values": [1] * 100}) == Unlimited([1] * 100)
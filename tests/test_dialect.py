@@ -1,9 +1,11 @@
 import collections
 import enum
 import typing
+import uuid
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import (
+    Any,
     FrozenSet,
     Generic,
     List,
@@ -21,7 +23,7 @@ from typing_extensions import TypedDict
 from mashumaro import DataClassDictMixin, pass_through
 from mashumaro.config import ADD_DIALECT_SUPPORT, BaseConfig
 from mashumaro.dialect import Dialect
-from mashumaro.exceptions import BadDialect
+from mashumaro.exceptions import BadDialect, UnserializableField
 from mashumaro.mixins.msgpack import DataClassMessagePackMixin
 from mashumaro.mixins.msgpack import default_encoder as msgpack_encoder
 from mashumaro.types import SerializationStrategy
@@ -1206,11 +1208,120 @@ def test_dialect_no_copy():
     assert data["g"] is not obj.g
 
 
+def test_dialect_no_copy_unpack():
+    class NoCopyDialect(Dialect):
+        no_copy_unpack_collections = (list, dict)
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: List[int]
+        b: typing.Dict[str, float]
+        c: List[Optional[str]]
+        d: Set[str]
+        e: List[typing.Any]
+        f: typing.Sequence[bool]
+
+        class Config(BaseConfig):
+            dialect = NoCopyDialect
+
+    data = {
+        "a": [1, 2],
+        "b": {"x": 1.5},
+        "c": ["foo", None],
+        "d": ["foo"],
+        "e": [1, "foo"],
+        "f": [True],
+    }
+    obj = DataClass.from_dict(data)
+    assert obj.a is data["a"]
+    assert obj.b is data["b"]
+    assert obj.c is data["c"]
+    assert obj.d == {"foo"}
+    assert obj.e is data["e"]
+    assert obj.f is data["f"]
+
+    data = {
+        "a": ["1", True],
+        "b": {"x": 1},
+        "c": (1, None),
+        "d": [],
+        "e": (1,),
+        "f": [1],
+    }
+    obj = DataClass.from_dict(data)
+    assert obj.a == [1, 1]
+    assert type(obj.a[1]) is int
+    assert obj.b == {"x": 1.0}
+    assert type(obj.b["x"]) is float
+    assert obj.c == ["1", None]
+    assert obj.e == [1]
+    assert obj.f == [True]
+    assert obj.a is not data["a"]
+    assert obj.b is not data["b"]
+
+
+def test_dialect_no_copy_unpack_with_item_strategy():
+    class NoCopyDialect(Dialect):
+        no_copy_unpack_collections = (list, dict)
+        serialization_strategy = {str: {"deserialize": str.upper}}
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: List[str]
+        b: typing.Dict[str, Optional[str]]
+        c: List[int]
+
+        class Config(BaseConfig):
+            dialect = NoCopyDialect
+
+    data = {"a": ["foo"], "b": {"x": "bar", "y": None}, "c": [1]}
+    obj = DataClass.from_dict(data)
+    assert obj.a == ["FOO"]
+    assert obj.b == {"X": "BAR", "Y": None}
+    assert obj.c is data["c"]
+
+
+def test_dialect_no_copy_unpack_trusted():
+    class TrustedDialect(Dialect):
+        no_copy_unpack_collections = (list,)
+        trust_no_copy_unpack_collections = True
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: List[int]
+        b: typing.Dict[str, int]
+        c: List[date]
+
+        class Config(BaseConfig):
+            dialect = TrustedDialect
+
+    data = {"a": ["1"], "b": {"x": 1}, "c": ["2024-01-01"]}
+    obj = DataClass.from_dict(data)
+    assert obj.a is data["a"]
+    assert obj.b == data["b"]
+    assert obj.b is not data["b"]
+    assert obj.c == [date(2024, 1, 1)]
+
+
+def test_msgpack_dialect_no_copy_unpack():
+    @dataclass
+    class DataClass(DataClassMessagePackMixin):
+        a: List[int]
+        b: typing.Dict[str, List[float]]
+
+    obj = DataClass.from_msgpack(
+        msgpack_encoder({"a": [1, 2], "b": {"x": [1.0, 2]}})
+    )
+    assert obj == DataClass([1, 2], {"x": [1.0, 2.0]})
+    assert type(obj.b["x"][1]) is float
+
+
 def test_dialect_merge():
     class DialectA(Dialect):
         omit_none = True
         omit_default = True
         no_copy_collections = [set, dict]
+        no_copy_unpack_collections = [list]
         serialization_strategy = {
             date: {
                 "serialize": date.toordinal,
@@ -1224,6 +1335,8 @@ def test_dialect_merge():
         omit_none = False
         omit_default = False
         no_copy_collections = [list]
+        trust_no_copy_unpack_collections = True
+        dispatch_any = True
         serialization_strategy = {
             date: pass_through,
             int: {"serialize": int, "deserialize": int},
@@ -1234,8 +1347,104 @@ def test_dialect_merge():
     assert DialectC.omit_none is False
     assert DialectC.omit_default is False
     assert DialectC.no_copy_collections == [list]
+    assert DialectC.no_copy_unpack_collections == [list]
+    assert DialectC.trust_no_copy_unpack_collections is True
+    assert DialectC.dispatch_any is True
     assert DialectC.serialization_strategy == {
         date: pass_through,
         int: {"serialize": int, "deserialize": int},
         float: {"serialize": float, "deserialize": float},
     }
+
+
+class DispatchAnyDialect(Dialect):
+    dispatch_any = True
+
+
+@dataclass
+class DispatchAnyItem:
+    x: int
+    created_at: datetime
+
+
+def test_dialect_dispatch_any():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: Any
+        b: List[Any]
+        c: typing.Dict[str, Any]
+        d: object = None
+
+        class Config(BaseConfig):
+            dialect = DispatchAnyDialect
+
+    item = DispatchAnyItem(1, datetime(2024, 1, 1))
+    obj = DataClass(
+        a=item,
+        b=[uuid.UUID(int=1), [item], (1, "2"), None],
+        c={"x": {"y": date(2024, 1, 1)}},
+        d=item,
+    )
+    assert obj.to_dict() == {
+        "a": {"x": 1, "created_at": "2024-01-01T00:00:00"},
+        "b": [
+            "00000000-0000-0000-0000-000000000001",
+            [{"x": 1, "created_at": "2024-01-01T00:00:00"}],
+            [1, "2"],
+            None,
+        ],
+        "c": {"x": {"y": "2024-01-01"}},
+        "d": {"x": 1, "created_at": "2024-01-01T00:00:00"},
+    }
+    assert DataClass.from_dict({"a": 1, "b": [], "c": {}, "d": [1]}) == (
+        DataClass(a=1, b=[], c={}, d=[1])
+    )
+
+
+def test_dialect_dispatch_any_uses_dialect_options():
+    class OrdinalDispatchAnyDialect(DispatchAnyDialect):
+        serialization_strategy = OrdinalDialect.serialization_strategy
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: Any
+
+        class Config(BaseConfig):
+            dialect = OrdinalDispatchAnyDialect
+
+    assert DataClass([date(2024, 1, 1), 10, "x"]).to_dict() == {
+        "a": [date(2024, 1, 1).toordinal(), "0xa", "x"]
+    }
+
+
+def test_dialect_dispatch_any_with_dialect_support():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: Any
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_DIALECT_SUPPORT]
+
+    obj = DataClass(date(2024, 1, 1))
+    assert obj.to_dict() == {"a": date(2024, 1, 1)}
+    assert obj.to_dict(dialect=DispatchAnyDialect) == {"a": "2024-01-01"}
+
+
+def test_dialect_dispatch_any_leaves_unknown_types_as_is():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: Any
+
+        class Config(BaseConfig):
+            dialect = DispatchAnyDialect
+
+    value = object()
+    assert DataClass(value).to_dict()["a"] is value
+
+
+def test_object_field_without_dispatch_any():
+    with pytest.raises(UnserializableField):
+
+        @dataclass
+        class DataClass(DataClassDictMixin):
+            a: object
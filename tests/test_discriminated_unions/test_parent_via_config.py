@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 import pytest
 from typing_extensions import Literal
 
 from mashumaro import DataClassDictMixin
-from mashumaro.codecs.basic import decode
+from mashumaro.codecs.basic import decode, encode
 from mashumaro.config import BaseConfig
 from mashumaro.exceptions import (
     InvalidFieldValue,
@@ -811,3 +811,112 @@ def test_by_subtypes_with_custom_variant_tagger_and_multiple_tags():
         VariantWithMultipleTags.from_dict({"type": "unknown"})
     with pytest.raises(SuitableVariantNotFoundError):
         decode({"type": "unknown"}, _VariantWithMultipleTags)
+
+
+@dataclass
+class VariantWithClassAttributeTag:
+    x: int
+
+    class Config(BaseConfig):
+        discriminator = Discriminator(
+            field="type", include_subtypes=True, serialize_tag=True
+        )
+
+
+@dataclass
+class VariantWithClassAttributeTagSub1(VariantWithClassAttributeTag):
+    type = "sub1"
+    y: int = 0
+
+
+@dataclass
+class VariantWithClassAttributeTagSub2(VariantWithClassAttributeTagSub1):
+    type = "sub2"
+    z: date = DT_DATE
+
+
+@dataclass
+class VariantWithClassAttributeTagHolder(DataClassDictMixin):
+    variants: List[VariantWithClassAttributeTag]
+
+
+def test_encode_subtypes():
+    assert encode(
+        _VariantByFieldWithSubtypesSub2(x=DT_DATE), _VariantByFieldWithSubtypes
+    ) == {"x": DT_STR, "type": 2}
+    assert encode(
+        VariantByFieldWithSubtypesSub2(x=DT_DATE), VariantByFieldWithSubtypes
+    ) == {"x": DT_STR, "type": 2}
+    assert encode(
+        [VariantWithClassAttributeTagSub2(1), VariantWithClassAttributeTag(2)],
+        List[VariantWithClassAttributeTag],
+    ) == [{"type": "sub2", "x": 1, "y": 0, "z": DT_STR}, {"x": 2}]
+
+
+def test_encode_subtypes_with_class_attribute_tag():
+    obj = VariantWithClassAttributeTagHolder(
+        [
+            VariantWithClassAttributeTagSub1(1, 2),
+            VariantWithClassAttributeTagSub2(3),
+        ]
+    )
+    data = obj.to_dict()
+    assert data == {
+        "variants": [
+            {"type": "sub1", "x": 1, "y": 2},
+            {"type": "sub2", "x": 3, "y": 0, "z": DT_STR},
+        ]
+    }
+    assert VariantWithClassAttributeTagHolder.from_dict(data) == obj
+
+
+@dataclass
+class VariantWithSerializedTag(DataClassDictMixin):
+    class Config(BaseConfig):
+        discriminator = Discriminator(
+            field="type",
+            include_subtypes=True,
+            variant_tagger_fn=lambda cls: [cls.__name__.lower()],
+            serialize_tag=True,
+        )
+
+
+@dataclass
+class VariantWithSerializedTagSub1(VariantWithSerializedTag):
+    pass
+
+
+@dataclass
+class _VariantWithSerializedTag:
+    class Config(BaseConfig):
+        discriminator = Discriminator(
+            field="type",
+            include_subtypes=True,
+            variant_tagger_fn=lambda cls: cls.__name__.lower(),
+            serialize_tag=True,
+        )
+
+
+@dataclass
+class _VariantWithSerializedTagSub1(_VariantWithSerializedTag):
+    pass
+
+
+def test_encode_subtypes_without_serialize_tag():
+    assert VariantWitCustomTaggerSub1().to_dict() == {}
+    assert encode(_VariantWitCustomTaggerSub2(), _VariantWitCustomTagger) == {}
+    assert (
+        encode(_VariantWithMultipleTagsOne(), _VariantWithMultipleTags) == {}
+    )
+
+
+def test_encode_subtypes_with_custom_variant_tagger():
+    data = VariantWithSerializedTagSub1().to_dict()
+    assert data == {"type": "variantwithserializedtagsub1"}
+    assert VariantWithSerializedTag.from_dict(data) == (
+        VariantWithSerializedTagSub1()
+    )
+    assert encode(
+        _VariantWithSerializedTagSub1(), _VariantWithSerializedTag
+    ) == {"type": "_variantwithserializedtagsub1"}
+    assert encode(_VariantWithSerializedTag(), _VariantWithSerializedTag) == {}
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Union
+from typing import Generic, List, TypeVar, Union
 
 import pytest
 
@@ -204,3 +204,30 @@ def test_extra_keys_error():
     with pytest.raises(ExtraKeysError) as exc_info:
         MyClass.from_dict({"x": "x", "y": "y"})
     assert str(exc_info.value).endswith(".MyClass: y")
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class GenericDataClass(Generic[T], DataClassDictMixin):
+    x: List[T]
+    y: Union[int, List[T]] = 0
+
+
+@dataclass
+class ConcreteDataClass(GenericDataClass[int]):
+    pass
+
+
+def test_raised_exceptions_have_field_type_objects():
+    with pytest.raises(MissingField) as exc_info:
+        ConcreteDataClass.from_dict({})
+    assert exc_info.value.field_type == List[int]
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        ConcreteDataClass.from_dict({"x": [1], "y": ["a"]})
+    assert exc_info.value.field_type == Union[int, List[int]]
+    assert str(exc_info.value) == (
+        'Field "y" of type Union[int, List[int]] in '
+        "ConcreteDataClass has invalid value ['a']"
+    )
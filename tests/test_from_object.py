@@ -0,0 +1,177 @@
+from dataclasses import dataclass, field
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+from typing_extensions import Self
+
+from mashumaro import DataClassDictMixin, MissingField, field_options
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import InvalidFieldValue
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Author(DataClassDictMixin):
+    name: str = field(metadata=field_options(alias="full_name"))
+
+
+@dataclass
+class Book(DataClassDictMixin):
+    title: str
+    published: date
+    authors: list[Author]
+    tags: tuple[Tag, ...] = ()
+    by_key: dict[str, Author] = field(default_factory=dict)
+    main_tag: Optional[Tag] = None
+    pages: int = 0
+    notes: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Node(DataClassDictMixin):
+    value: int
+    children: list[Self] = field(default_factory=list)
+
+
+@dataclass
+class Base(DataClassDictMixin):
+    x: int
+
+
+@dataclass
+class Child(Base):
+    y: int = 0
+
+
+@dataclass(kw_only=True)
+class KwOnly(DataClassDictMixin):
+    x: int
+    y: int = 1
+
+
+@dataclass
+class WithHooks(DataClassDictMixin):
+    x: int
+
+    @classmethod
+    def __pre_deserialize__(cls, d: dict[Any, Any]) -> dict[Any, Any]:
+        raise AssertionError("must not be called")
+
+    @classmethod
+    def __post_deserialize__(cls, obj: "WithHooks") -> "WithHooks":
+        obj.x *= 2
+        return obj
+
+
+@dataclass
+class NotByAlias(DataClassDictMixin):
+    x: int = field(metadata=field_options(alias="alias_x"))
+
+    class Config(BaseConfig):
+        allow_deserialization_not_by_alias = True
+
+
+def test_from_object_nested_objects():
+    row = SimpleNamespace(
+        title="t",
+        published=date(2024, 1, 1),
+        authors=[SimpleNamespace(full_name="a")],
+        tags=[SimpleNamespace(name="x")],
+        by_key={"k": SimpleNamespace(full_name="b")},
+        main_tag=SimpleNamespace(name="y"),
+        pages=10,
+        notes=["n"],
+    )
+    assert Book.from_object(row) == Book(
+        title="t",
+        published=date(2024, 1, 1),
+        authors=[Author("a")],
+        tags=(Tag("x"),),
+        by_key={"k": Author("b")},
+        main_tag=Tag("y"),
+        pages=10,
+        notes=["n"],
+    )
+
+
+def test_from_object_defaults():
+    row = SimpleNamespace(title="t", published=date(2024, 1, 1), authors=[])
+    book = Book.from_object(row)
+    assert book == Book("t", date(2024, 1, 1), [])
+    assert book.notes is not Book.from_object(row).notes
+
+
+def test_from_object_keeps_instances_and_values_as_is():
+    author = Author("a")
+    notes = ["n"]
+    row = SimpleNamespace(
+        title="t",
+        published="not a date",
+        authors=[author],
+        main_tag=None,
+        notes=notes,
+    )
+    book = Book.from_object(row)
+    assert book.authors[0] is author
+    assert book.published == "not a date"
+    assert book.main_tag is None
+    assert book.notes is notes
+
+
+def test_from_object_missing_field():
+    with pytest.raises(MissingField) as exc_info:
+        Book.from_object(SimpleNamespace(title="t", authors=[]))
+    assert exc_info.value.field_name == "published"
+    with pytest.raises(MissingField) as exc_info:
+        Author.from_object(SimpleNamespace(name="a"))
+    assert exc_info.value.field_name == "name"
+
+
+def test_from_object_invalid_field_value():
+    row = SimpleNamespace(title="t", published=None, authors=[1])
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        Book.from_object(row)
+    assert exc_info.value.field_name == "authors"
+
+
+def test_from_object_recursive_dataclass():
+    row = SimpleNamespace(
+        value=1, children=[SimpleNamespace(value=2, children=[Node(3)])]
+    )
+    assert Node.from_object(row) == Node(1, [Node(2, [Node(3)])])
+
+
+def test_from_object_subclass():
+    assert Base.from_object(SimpleNamespace(x=1, y=2)) == Base(1)
+    assert Child.from_object(SimpleNamespace(x=1, y=2)) == Child(1, 2)
+    assert Child.from_object(SimpleNamespace(x=1)) == Child(1)
+
+
+def test_from_object_kw_only():
+    assert KwOnly.from_object(SimpleNamespace(x=2)) == KwOnly(x=2, y=1)
+
+
+def test_from_object_hooks():
+    assert WithHooks.from_object(SimpleNamespace(x=2)) == WithHooks(4)
+
+
+def test_from_object_with_keyword_alias():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        cls: str = field(metadata=field_options(alias="class"))
+
+    obj = SimpleNamespace(**{"class": "a"})
+    assert DataClass.from_object(obj) == DataClass("a")
+    with pytest.raises(MissingField):
+        DataClass.from_object(SimpleNamespace())
+
+
+def test_from_object_not_by_alias():
+    assert NotByAlias.from_object(SimpleNamespace(alias_x=1)).x == 1
+    assert NotByAlias.from_object(SimpleNamespace(x=2)).x == 2
@@ -322,6 +322,27 @@ def test_jsonschema_for_timedelta():
     )
 
 
+def test_jsonschema_for_epoch_engines():
+    @dataclass
+    class DataClass:
+        a: datetime.datetime = field(metadata={"serialize": "epoch_s"})
+        b: datetime.datetime = field(metadata={"serialize": "epoch_ms"})
+        c: datetime.date = field(metadata={"serialize": "epoch_s"})
+        d: datetime.timedelta = field(metadata={"serialize": "epoch_us"})
+        e: datetime.timedelta = field(metadata={"serialize": "epoch_s"})
+
+    assert build_json_schema(DataClass).properties == {
+        "a": JSONSchema(type=JSONSchemaInstanceType.NUMBER),
+        "b": JSONSchema(type=JSONSchemaInstanceType.INTEGER),
+        "c": JSONSchema(type=JSONSchemaInstanceType.INTEGER),
+        "d": JSONSchema(type=JSONSchemaInstanceType.INTEGER),
+        "e": JSONSchema(
+            type=JSONSchemaInstanceType.NUMBER,
+            format=JSONSchemaInstanceFormatExtension.TIMEDELTA,
+        ),
+    }
+
+
 def test_jsonschema_for_timezone():
     assert build_json_schema(datetime.timezone) == JSONSchema(
         type=JSONSchemaInstanceType.STRING, pattern=UTC_OFFSET_PATTERN
@@ -1,5 +1,8 @@
 import collections
 import collections.abc
+import gc
+import inspect
+import linecache
 import types
 import typing
 from dataclasses import InitVar, dataclass
@@ -8,7 +11,9 @@ from datetime import datetime
 import pytest
 import typing_extensions
 
-from mashumaro import DataClassDictMixin
+from mashumaro import DataClassDictMixin, compile_report
+from mashumaro.codecs import BasicDecoder
+from mashumaro.core.meta.code import builder as builder_module
 from mashumaro.core.meta.code.builder import CodeBuilder
 
 # noinspection PyProtectedMember
@@ -54,6 +59,7 @@ from mashumaro.core.meta.types.common import (
 )
 from mashumaro.dialect import Dialect
 from mashumaro.exceptions import UnserializableField
+from mashumaro.instrumentation import format_compile_report
 from mashumaro.mixins.json import DataClassJSONMixin
 
 from .entities import (
@@ -753,3 +759,73 @@ def test_get_type_var_default():
 
     assert get_type_var_default(T_WithDefault) is int
     assert get_type_var_default(T_WithDefaultNone) is None
+
+
+def test_compile_report():
+    @dataclass
+    class CompileReportInner:
+        x: typing.Union[int, str]
+
+    @dataclass
+    class CompileReportOuter(DataClassDictMixin):
+        inner: CompileReportInner
+
+    BasicDecoder(typing.List[CompileReportOuter])
+    report = {entry["name"]: entry for entry in compile_report()}
+    outer = report[type_name(CompileReportOuter)]
+    inner = report[type_name(CompileReportInner)]
+    decoder = report[f"{type_name(typing.List[CompileReportOuter])} decoder"]
+    # from_dict, to_dict and the decoder of the codec
+    assert outer["compilations"] == 3
+    assert inner["compilations"] == 3
+    assert decoder["compilations"] == 1
+    for entry in (outer, inner, decoder):
+        assert entry["total_time"] == pytest.approx(
+            entry["resolution_time"]
+            + entry["generation_time"]
+            + entry["exec_time"]
+        )
+        assert entry["generation_time"] > 0
+        assert entry["exec_time"] > 0
+        assert entry["source_size"] > 0
+    assert inner["functions"] >= inner["compilations"]
+    totals = [entry["total_time"] for entry in compile_report()]
+    assert totals == sorted(totals, reverse=True)
+    assert type_name(CompileReportOuter) in format_compile_report(
+        [outer, inner]
+    )
+
+
+def test_generated_source_is_registered_in_linecache():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: typing.Union[int, typing.List[int]]
+
+    code = DataClass.__mashumaro_from_dict__.__code__
+    assert code.co_filename.startswith(
+        f"<mashumaro {type_name(DataClass)}.__mashumaro_from_dict__ #"
+    )
+    source = inspect.getsource(DataClass.__mashumaro_to_dict__)
+    assert source.startswith("def __mashumaro_to_dict__(self):")
+    assert linecache.getline(code.co_filename, 1).startswith("@classmethod")
+
+
+def test_generated_source_registration_opt_out(monkeypatch):
+    monkeypatch.setattr(builder_module, "REGISTER_GENERATED_SOURCE", False)
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+    code = DataClass.__mashumaro_from_dict__.__code__
+    assert code.co_filename == "<string>"
+
+
+def test_generated_source_is_removed_from_linecache_with_functions():
+    decoder = BasicDecoder(typing.List[datetime])
+    filename = decoder.decode.__code__.co_filename
+    assert filename in linecache.cache
+    del decoder
+    CodeBuilder.get_config.cache_clear()  # it holds recent builders
+    gc.collect()
+    assert filename not in linecache.cache
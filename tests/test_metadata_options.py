@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from datetime import date, datetime, time, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -87,6 +87,80 @@ def test_pendulum_time_parser():
     assert instance == should_be
 
 
+@pytest.mark.parametrize(
+    ["engine", "dt_value", "d_value", "td_value"],
+    [
+        ["epoch_s", 1609556645.000006, 1609545600, 1.5],
+        ["epoch_ms", 1609556645000, 1609545600000, 1500],
+        ["epoch_us", 1609556645000006, 1609545600000000, 1500000],
+        ["epoch_ns", 1609556645000006000, 1609545600000000000, 1500000000],
+    ],
+)
+def test_epoch_engines(engine, dt_value, d_value, td_value):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        dt: datetime = field(
+            metadata={"serialize": engine, "deserialize": engine}
+        )
+        d: date = field(metadata={"serialize": engine, "deserialize": engine})
+        td: timedelta = field(
+            metadata={"serialize": engine, "deserialize": engine}
+        )
+
+    tz = timezone(timedelta(hours=3))
+    obj = DataClass(
+        dt=datetime(2021, 1, 2, 6, 4, 5, 6, tzinfo=tz),
+        d=date(2021, 1, 2),
+        td=timedelta(seconds=1, milliseconds=500),
+    )
+    data = {"dt": dt_value, "d": d_value, "td": td_value}
+    assert obj.to_dict() == data
+    if engine == "epoch_ms":
+        obj.dt = obj.dt.replace(microsecond=0)
+    loaded = DataClass.from_dict(data)
+    assert loaded == obj
+    assert loaded.dt.tzinfo is timezone.utc
+
+
+def test_epoch_engines_for_naive_and_negative_values():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: datetime = field(
+            metadata={"serialize": "epoch_ms", "deserialize": "epoch_ms"}
+        )
+        y: timedelta = field(
+            metadata={"serialize": "epoch_us", "deserialize": "epoch_us"}
+        )
+
+    obj = DataClass(datetime(1969, 12, 31, 23, 59, 59, 999500), timedelta(-1))
+    assert obj.to_dict() == {"x": -1, "y": -86400000000}
+    assert DataClass.from_dict({"x": -1, "y": -86400000000}) == DataClass(
+        datetime(1969, 12, 31, 23, 59, 59, 999000, tzinfo=timezone.utc),
+        timedelta(-1),
+    )
+
+
+def test_epoch_engines_in_serialization_strategy():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: datetime
+        y: Optional[timedelta] = None
+
+        class Config:
+            serialization_strategy = {
+                datetime: {"serialize": "epoch_s", "deserialize": "epoch_s"},
+                timedelta: {
+                    "serialize": "epoch_ns",
+                    "deserialize": "epoch_ns",
+                },
+            }
+
+    obj = DataClass(datetime(1970, 1, 2, tzinfo=timezone.utc), timedelta(1))
+    data = {"x": 86400.0, "y": 86400000000000}
+    assert obj.to_dict() == data
+    assert DataClass.from_dict(data) == obj
+
+
 def test_unsupported_datetime_parser_engine():
     with pytest.raises(UnsupportedDeserializationEngine):
 
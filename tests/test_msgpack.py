@@ -1,13 +1,20 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Interface
 from typing import Dict, List
+from uuid import UUID
 
 import msgpack
 
 from mashumaro import DataClassDictMixin
 from mashumaro.config import ADD_DIALECT_SUPPORT, BaseConfig
 from mashumaro.dialect import Dialect
-from mashumaro.mixins.msgpack import DataClassMessagePackMixin
+from mashumaro.mixins.msgpack import (
+    DECIMAL_EXT_TYPE,
+    CompactMessagePackDialect,
+    DataClassMessagePackMixin,
+)
 
 
 class MyDialect(Dialect):
@@ -164,3 +171,60 @@ def test_msgpack_with_custom_encoder_and_decoder():
     dumped = msgpack.packb({"x": b"ABC", "inner": {"x": b"DEF"}})
     assert instance.to_msgpack(encoder=encoder) == dumped
     assert DataClass.from_msgpack(dumped, decoder=decoder) == instance
+
+
+def test_compact_msgpack_dialect():
+    @dataclass
+    class DataClass(DataClassMessagePackMixin):
+        dt: datetime
+        naive_dt: datetime
+        uid: UUID
+        ip4: IPv4Address
+        ip6: IPv6Address
+        net: IPv4Network
+        iface: IPv6Interface
+        decimals: List[Decimal]
+
+        class Config(BaseConfig):
+            code_generation_options = [ADD_DIALECT_SUPPORT]
+
+    obj = DataClass(
+        dt=datetime(
+            2024, 1, 2, 6, 4, 5, 6, tzinfo=timezone(timedelta(hours=3))
+        ),
+        naive_dt=datetime(1960, 1, 1, 0, 0, 0, 1),
+        uid=UUID("3c25dd74-f208-46a2-9606-dd2919e975b7"),
+        ip4=IPv4Address("192.168.0.1"),
+        ip6=IPv6Address("::1"),
+        net=IPv4Network("10.0.0.0/8"),
+        iface=IPv6Interface("2001:db8::1/64"),
+        decimals=[
+            Decimal("1.5"),
+            Decimal("-123.456"),
+            Decimal("-0"),
+            Decimal("0.00"),
+            Decimal("NaN"),
+            Decimal("-Infinity"),
+            Decimal("1e-500"),
+            Decimal("123456789012345678901234567890.123"),
+        ],
+    )
+    dumped = obj.to_msgpack(dialect=CompactMessagePackDialect)
+    raw = msgpack.unpackb(dumped, raw=False)
+    assert raw["dt"] == msgpack.Timestamp(1704164645, 6000)
+    assert raw["naive_dt"] == msgpack.Timestamp(-315619200, 1000)
+    assert raw["uid"] == obj.uid.bytes
+    assert raw["ip4"] == b"\xc0\xa8\x00\x01"
+    assert raw["net"] == b"\x0a\x00\x00\x00\x08"
+    assert raw["iface"] == obj.iface.packed + b"\x40"
+    assert raw["decimals"][0] == msgpack.ExtType(DECIMAL_EXT_TYPE, b"\xff\x0f")
+    assert len(dumped) < len(obj.to_msgpack())
+
+    loaded = DataClass.from_msgpack(dumped, dialect=CompactMessagePackDialect)
+    assert loaded.dt == obj.dt
+    assert loaded.dt.tzinfo is timezone.utc
+    assert loaded.uid == obj.uid
+    assert (loaded.ip4, loaded.ip6) == (obj.ip4, obj.ip6)
+    assert (loaded.net, loaded.iface) == (obj.net, obj.iface)
+    assert loaded.naive_dt == obj.naive_dt.replace(tzinfo=timezone.utc)
+    assert [str(d) for d in loaded.decimals] == [str(d) for d in obj.decimals]
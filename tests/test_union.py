@@ -1,14 +1,21 @@
-from dataclasses import dataclass
+import gc
+from dataclasses import dataclass, field
 from datetime import date
 from itertools import permutations
 from typing import Any, Dict, List, Union
 
 import pytest
 
-from mashumaro import DataClassDictMixin, pass_through
+from mashumaro import DataClassDictMixin, field_options, pass_through
 from mashumaro.codecs.basic import encode
 from mashumaro.config import BaseConfig
 from mashumaro.dialect import Dialect
+from mashumaro.exceptions import InvalidFieldValue
+from mashumaro.instrumentation import (
+    UnionStats,
+    register_union_stats,
+    union_stats,
+)
 from tests.utils import same_types
 
 
@@ -165,3 +172,211 @@ def test_union_no_copy_list_with_dataclass_items_or_passed_through_items():
     container = Container(items=items)
     data = container.to_dict()
     assert data == {"items": [{"value": 1}, {"value": 2}]}
+
+
+class StrictConfig(BaseConfig):
+    forbid_extra_keys = True
+
+
+@dataclass
+class StrictA(DataClassDictMixin):
+    a: int
+
+    class Config(StrictConfig):
+        pass
+
+
+@dataclass
+class StrictB(DataClassDictMixin):
+    b: int
+    x: int = 0
+
+    class Config(StrictConfig):
+        pass
+
+
+@dataclass
+class LaxC(DataClassDictMixin):
+    c: int
+    x: int = 0
+
+
+def _get_union_stats(name: str):
+    return next(s for s in union_stats() if s["name"].endswith(name))
+
+
+def test_adaptive_union_ordering():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[int, StrictA, StrictB, str]
+
+        class Config(BaseConfig):
+            adaptive_union_ordering = 3
+
+    for i in range(3):
+        assert DataClass.from_dict({"x": {"b": i}}) == DataClass(StrictB(i))
+    stats = _get_union_stats("DataClass.x")
+    assert stats["reordered"]
+    assert stats["hits"] == {
+        "int": 0,
+        "tests.test_union.StrictA": 0,
+        "tests.test_union.StrictB": 3,
+        "str": 0,
+    }
+    assert stats["order"] == [
+        "int",
+        "tests.test_union.StrictB",
+        "tests.test_union.StrictA",
+        "str",
+    ]
+    assert DataClass.from_dict({"x": {"a": 1}}) == DataClass(StrictA(1))
+    assert DataClass.from_dict({"x": {"b": 2}}) == DataClass(StrictB(2))
+    assert DataClass.from_dict({"x": 1.0}) == DataClass(1)
+    assert DataClass.from_dict({"x": "a"}) == DataClass("a")
+
+
+def test_adaptive_union_ordering_skips_overlapping_variants():
+    registered = len(union_stats())
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[StrictA, LaxC, StrictB]
+        y: Union[StrictB, LaxC]
+
+        class Config(BaseConfig):
+            adaptive_union_ordering = True
+
+    assert DataClass.from_dict(
+        {"x": {"c": 1}, "y": {"b": 1, "x": 1}}
+    ) == DataClass(LaxC(1), StrictB(1, 1))
+    assert len(union_stats()) == registered
+
+
+def test_adaptive_union_ordering_is_disabled_by_default():
+    registered = len(union_stats())
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[StrictA, StrictB]
+
+    assert DataClass.from_dict({"x": {"b": 1}}) == DataClass(StrictB(1))
+    assert len(union_stats()) == registered
+
+
+@dataclass
+class Point2D:
+    x: int
+    y: int
+
+
+@dataclass
+class Point3D:
+    x: int
+    y: int
+    z: int
+
+
+@dataclass
+class Point2DChild(Point2D):
+    label: str = "child"
+
+
+def test_union_serialization_dispatches_on_exact_class():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[int, Point2D, list[int], Point3D, str]
+
+    assert DataClass(Point3D(1, 2, 3)).to_dict() == {
+        "x": {"x": 1, "y": 2, "z": 3}
+    }
+    assert DataClass(Point2D(1, 2)).to_dict() == {"x": {"x": 1, "y": 2}}
+    assert DataClass([1, 2]).to_dict() == {"x": [1, 2]}
+    assert DataClass(1).to_dict() == {"x": 1}
+    assert DataClass("a").to_dict() == {"x": "a"}
+    assert encode(Point3D(1, 2, 3), Union[Point2D, Point3D]) == {
+        "x": 1,
+        "y": 2,
+        "z": 3,
+    }
+
+
+def test_union_serialization_falls_back_for_subclasses():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[Point3D, Point2D]
+
+    assert DataClass(Point2DChild(1, 2)).to_dict() == {"x": {"x": 1, "y": 2}}
+
+
+def _fail(value):
+    raise ValueError(value)
+
+
+@dataclass
+class FailingPoint:
+    x: int
+    y: int = field(metadata={"serialize": _fail})
+
+
+def test_union_serialization_with_failing_dispatched_variant():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[FailingPoint, list[int]]
+
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        DataClass(FailingPoint(1, 2)).to_dict()
+    assert exc_info.value.field_name == "x"
+    with pytest.raises(ValueError, match="FailingPoint"):
+        encode(FailingPoint(1, 2), Union[FailingPoint, list[int]])
+
+
+@dataclass
+class WithAlias(DataClassDictMixin):
+    a: int = field(metadata=field_options(alias="alias_a"))
+
+    class Config(BaseConfig):
+        allow_deserialization_not_by_alias = True
+
+
+@dataclass
+class WithPreDeserialize(DataClassDictMixin):
+    c: int
+
+    @classmethod
+    def __pre_deserialize__(cls, d: Dict[Any, Any]) -> Dict[Any, Any]:
+        return {"c": d["value"]}
+
+
+def test_union_rules_out_variants_by_required_keys(monkeypatch):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[Point3D, WithAlias, WithPreDeserialize, Point2D, str]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("must not be called")
+
+    assert DataClass.from_dict({"x": {"x": 1, "y": 2}}) == DataClass(
+        Point2D(1, 2)
+    )
+    assert DataClass.from_dict({"x": {"alias_a": 1}}) == DataClass(
+        WithAlias(1)
+    )
+    assert DataClass.from_dict({"x": {"a": 1}}) == DataClass(WithAlias(1))
+    assert DataClass.from_dict({"x": {"value": 1}}) == DataClass(
+        WithPreDeserialize(1)
+    )
+    assert DataClass.from_dict({"x": "a"}) == DataClass("a")
+    monkeypatch.setattr(Point3D, "__mashumaro_from_dict__", fail)
+    monkeypatch.setattr(WithAlias, "__mashumaro_from_dict__", fail)
+    assert DataClass.from_dict({"x": {"x": 1, "y": 2}}) == DataClass(
+        Point2D(1, 2)
+    )
+
+
+def test_union_stats_are_dropped_with_unpackers():
+    stats = UnionStats("tests.test_union.Dropped.x", ["int", "str"], 1)
+    register_union_stats(stats)
+    assert _get_union_stats("Dropped.x")["hits"] == {"int": 0, "str": 0}
+    del stats
+    gc.collect()
+    assert not any(s["name"].endswith("Dropped.x") for s in union_stats())
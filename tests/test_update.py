@@ -0,0 +1,164 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Optional
+
+import pytest
+
+from mashumaro import DataClassDictMixin, MissingField
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import ExtraKeysError, InvalidFieldValue
+from mashumaro.helper import ObjectPool
+
+
+@dataclass
+class Quote(DataClassDictMixin):
+    price: float
+    day: Optional[date] = None
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Tick(DataClassDictMixin):
+    symbol: str
+    quote: Quote
+    previous: Optional[Quote] = None
+    volume: int = field(default=0, metadata={"alias": "v"})
+
+
+def test_update_from_dict_keeps_missing_fields():
+    obj = Tick("AAPL", Quote(1.0, tags=["a"]), volume=10)
+    quote = obj.quote
+    obj.update_from_dict({"quote": {"price": 2.0}, "v": 20})
+    assert obj == Tick("AAPL", Quote(2.0, tags=["a"]), volume=20)
+    assert obj.quote is quote
+
+
+def test_update_from_dict_resets_missing_fields():
+    obj = Tick("AAPL", Quote(1.0, date(2024, 1, 1), ["a"]), Quote(0.5), 10)
+    quote = obj.quote
+    obj.update_from_dict(
+        {"symbol": "MSFT", "quote": {"price": 2.0}}, reset_missing=True
+    )
+    assert obj == Tick("MSFT", Quote(2.0))
+    assert obj.quote is quote
+    with pytest.raises(MissingField):
+        obj.update_from_dict({"symbol": "MSFT"}, reset_missing=True)
+
+
+def test_update_from_dict_replaces_nested_objects():
+    obj = Tick("AAPL", Quote(1.0))
+    obj.update_from_dict({"previous": {"price": 3.0, "day": "2024-01-02"}})
+    assert obj.previous == Quote(3.0, date(2024, 1, 2))
+    obj.update_from_dict({"previous": None})
+    assert obj.previous is None
+
+
+def test_update_from_dict_with_invalid_values():
+    obj = Tick("AAPL", Quote(1.0))
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        obj.update_from_dict({"quote": {"price": "x"}})
+    assert exc_info.value.field_name == "quote"
+    with pytest.raises(ValueError, match="should be a dict instance"):
+        obj.update_from_dict([])  # type: ignore[arg-type]
+
+
+def test_update_from_dict_is_atomic():
+    obj = Tick("AAPL", Quote(1.0, tags=["a"]), Quote(0.5), 10)
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        obj.update_from_dict(
+            {"symbol": "MSFT", "quote": {"price": 2.0}, "v": "x"}
+        )
+    assert exc_info.value.field_name == "volume"
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        obj.update_from_dict(
+            {"quote": {"price": 2.0}, "previous": {"price": "x"}}
+        )
+    assert exc_info.value.field_name == "previous"
+    with pytest.raises(MissingField):
+        obj.update_from_dict({"quote": {"price": 2.0}}, reset_missing=True)
+    assert obj == Tick("AAPL", Quote(1.0, tags=["a"]), Quote(0.5), 10)
+
+
+def test_update_from_dict_in_subclass():
+    @dataclass
+    class ExtendedTick(Tick):
+        exchange: str = "NASDAQ"
+
+    obj = Tick("AAPL", Quote(1.0))
+    obj.update_from_dict({"symbol": "MSFT"})
+    extended = ExtendedTick("AAPL", Quote(1.0))
+    extended.update_from_dict({"symbol": "MSFT", "exchange": "NYSE"})
+    assert extended == ExtendedTick("MSFT", Quote(1.0), exchange="NYSE")
+
+
+def test_update_from_dict_in_subclass_after_parent_compiled():
+    @dataclass
+    class Parent(DataClassDictMixin):
+        x: int
+
+    @dataclass
+    class Child(Parent):
+        y: int = 0
+
+    parent = Parent(1)
+    parent.update_from_dict({"x": 2})
+    assert parent == Parent(2)
+    child = Child(1, 2)
+    child.update_from_dict({"x": 3, "y": "5"})
+    assert child == Child(3, 5)
+
+
+def test_update_from_dict_overridden_in_parent():
+    @dataclass
+    class Parent(DataClassDictMixin):
+        x: int
+
+        def update_from_dict(self, d, *, reset_missing=False):
+            super().update_from_dict(d, reset_missing=reset_missing)
+            self.x += 1
+
+    @dataclass
+    class Child(Parent):
+        y: int = 0
+
+    for _ in range(2):
+        parent = Parent(1)
+        parent.update_from_dict({"x": 3})
+        assert parent == Parent(4)
+        child = Child(1)
+        child.update_from_dict({"x": 3, "y": 5})
+        assert child == Child(4, 5)
+
+
+def test_update_from_dict_with_config_and_hooks():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: Any = None
+
+        class Config(BaseConfig):
+            forbid_extra_keys = True
+
+        @classmethod
+        def __pre_deserialize__(cls, d: dict[Any, Any]) -> dict[Any, Any]:
+            return {k.lower(): v for k, v in d.items()}
+
+    obj = DataClass(1)
+    obj.update_from_dict({"X": "2", "Y": [1]})
+    assert obj == DataClass(2, [1])
+    with pytest.raises(ExtraKeysError):
+        obj.update_from_dict({"z": 1})
+
+
+def test_object_pool():
+    pool = ObjectPool(Quote, maxsize=1)
+    first = pool.acquire({"price": 1.0, "tags": ["a"]})
+    second = pool.acquire({"price": 2.0})
+    assert first == Quote(1.0, tags=["a"])
+    assert len(pool) == 0
+    pool.release(first)
+    pool.release(second)
+    assert len(pool) == 1
+    third = pool.acquire({"price": 3.0})
+    assert third is first
+    assert third == Quote(3.0)
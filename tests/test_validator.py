@@ -0,0 +1,164 @@
+from dataclasses import dataclass, field
+from datetime import date
+from enum import Enum
+from typing import Any, Optional, Union
+
+import pytest
+from typing_extensions import Self
+
+from mashumaro import DataClassDictMixin, MissingField, Validator, validate
+from mashumaro.codecs import BasicDecoder
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import ExtraKeysError, InvalidFieldValue
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class Item:
+    name: str
+    day: date
+    color: Color = Color.RED
+    count: int = field(default=0, metadata={"alias": "c"})
+
+
+@dataclass
+class Order(DataClassDictMixin):
+    items: list[Item]
+    extra: dict[str, Optional[Item]] = field(default_factory=dict)
+    code: Union[int, str] = 0
+    note: Optional[str] = None
+
+
+@dataclass
+class Strict:
+    x: int
+
+    class Config(BaseConfig):
+        forbid_extra_keys = True
+
+
+@dataclass
+class Node:
+    value: int
+    children: list[Self] = field(default_factory=list)
+
+
+@dataclass
+class WithHook:
+    x: int
+
+    @classmethod
+    def __pre_deserialize__(cls, d: dict[Any, Any]) -> dict[Any, Any]:
+        return {"x": d["y"]}
+
+
+VALID_ORDER = {
+    "items": [{"name": "a", "day": "2024-01-01", "color": "green", "c": 2}],
+    "extra": {"x": None, "y": {"name": "b", "day": "2024-01-02"}},
+    "code": "abc",
+    "note": None,
+}
+
+
+def test_validate_valid_data():
+    validate(Order, VALID_ORDER)
+    validate(Order, {"items": []})
+    Validator(Order).validate(VALID_ORDER)
+    Order.from_dict(VALID_ORDER)
+
+
+@pytest.mark.parametrize(
+    ["data", "exc_type", "path"],
+    [
+        [{}, MissingField, "items"],
+        [{"items": [{"day": "2024-01-01"}]}, MissingField, "items[0].name"],
+        [{"items": 1}, InvalidFieldValue, "items"],
+        [{"items": [1]}, InvalidFieldValue, "items[0]"],
+        [
+            {"items": [{"name": "a", "day": "2024-01-01"}, {"name": "a"}]},
+            MissingField,
+            "items[1].day",
+        ],
+        [
+            {"items": [{"name": "a", "day": "x"}]},
+            InvalidFieldValue,
+            "items[0].day",
+        ],
+        [
+            {"items": [{"name": "a", "day": "2024-01-01", "color": "blue"}]},
+            InvalidFieldValue,
+            "items[0].color",
+        ],
+        [
+            {"items": [{"name": "a", "day": "2024-01-01", "c": "z"}]},
+            InvalidFieldValue,
+            "items[0].count",
+        ],
+        [
+            {"items": [], "extra": {"k": {"name": "b", "day": None}}},
+            InvalidFieldValue,
+            "extra['k'].day",
+        ],
+        [{"items": [], "extra": []}, InvalidFieldValue, "extra"],
+    ],
+)
+def test_validate_invalid_data(data, exc_type, path):
+    with pytest.raises(exc_type) as exc_info:
+        validate(Order, data)
+    assert exc_info.value.field_name == path
+    with pytest.raises((MissingField, InvalidFieldValue)):
+        Order.from_dict(data)
+
+
+def test_validate_converts_values_like_decoder():
+    data = {"items": [{"name": 1, "day": "2024-01-01", "c": "3"}]}
+    validate(Order, data)
+    assert Order.from_dict(data).items[0].count == 3
+
+
+def test_validate_non_dict_input():
+    with pytest.raises(ValueError):
+        validate(Strict, [1])
+
+
+def test_validate_extra_keys():
+    validate(Strict, {"x": 1})
+    with pytest.raises(ExtraKeysError):
+        validate(Strict, {"x": 1, "y": 2})
+    with pytest.raises(ExtraKeysError):
+        validate(list[Strict], [{"x": 1, "y": 2}])
+
+
+def test_validate_recursive_dataclass():
+    validate(Node, {"value": 1, "children": [{"value": 2}]})
+    with pytest.raises(MissingField) as exc_info:
+        validate(
+            Node, {"value": 1, "children": [{"value": 2, "children": [{}, 1]}]}
+        )
+    assert exc_info.value.field_name == "children[0].children[0].value"
+
+
+def test_validate_dataclass_with_pre_deserialize_hook():
+    validate(WithHook, {"y": 1})
+    assert BasicDecoder(WithHook).decode({"y": 1}) == WithHook(1)
+    with pytest.raises(KeyError):
+        validate(WithHook, {"x": 1})
+
+
+def test_validate_root_types():
+    validate(list[int], [1, "2"])
+    validate(Optional[list[int]], None)
+    validate(Any, object())
+    validate(dict[str, date], {"a": "2024-01-01"})
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        validate(list[int], [1, "a"])
+    assert exc_info.value.field_name == "[1]"
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        validate(dict[str, date], {"a": "b"})
+    assert exc_info.value.field_name == "['a']"
+    with pytest.raises(ValueError):
+        validate(date, "a")